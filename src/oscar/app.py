@@ -4,8 +4,8 @@ from django.conf.urls import include, url
 from django.contrib.auth import views as auth_views
 from django.core.urlresolvers import reverse_lazy
 
-from oscar.core.application import Application
-from oscar.core.loading import get_class
+from oscar.core.application import Application, lazy_include
+from oscar.core.loading import get_class, get_class_lazily
 from oscar.views.decorators import login_forbidden
 
 
@@ -18,7 +18,7 @@ class Shop(Application):
     checkout_app = get_class('checkout.app', 'application')
     promotions_app = get_class('promotions.app', 'application')
     search_app = get_class('search.app', 'application')
-    dashboard_app = get_class('dashboard.app', 'application')
+    dashboard_app = get_class_lazily('dashboard.app', 'application')
     offer_app = get_class('offer.app', 'application')
 
     password_reset_form = get_class('customer.forms', 'PasswordResetForm')
@@ -31,7 +31,7 @@ class Shop(Application):
             url(r'^checkout/', include(self.checkout_app.urls)),
             url(r'^accounts/', include(self.customer_app.urls)),
             url(r'^search/', include(self.search_app.urls)),
-            url(r'^dashboard/', include(self.dashboard_app.urls)),
+            url(r'^dashboard/', lazy_include(self.dashboard_app, 'dashboard')),
             url(r'^offers/', include(self.offer_app.urls)),
 
             # Password reset - as we're using Django's default view functions,
@@ -108,3 +108,55 @@ class AbstractUserSearch(models.Model):
         return _("%(user)s searched for '%(query)s'") % {
             'user': self.user,
             'query': self.query}
+
+
+@python_2_unicode_compatible
+class AbstractHourlyOrderRecord(models.Model):
+    """
+    Statistics of the orders placed during an hour that have a given status.
+
+    The records are rolled up from the orders as they're placed and change
+    status (see ``analytics.stats``), so that the dashboard doesn't need to
+    aggregate the whole order table.
+    """
+
+    hour = models.DateTimeField(_("Hour"), db_index=True)
+    status = models.CharField(_("Status"), max_length=100, blank=True)
+
+    num_orders = models.IntegerField(_("Orders"), default=0)
+    num_lines = models.IntegerField(_("Order Lines"), default=0)
+    total_incl_tax = models.DecimalField(
+        _("Revenue"), decimal_places=2, max_digits=12,
+        default=Decimal('0.00'))
+
+    class Meta:
+        abstract = True
+        app_label = 'analytics'
+        ordering = ['hour', 'status']
+        unique_together = ('hour', 'status')
+        verbose_name = _("Hourly order record")
+        verbose_name_plural = _("Hourly order records")
+
+    def __str__(self):
+        return _("Orders placed at %(hour)s with status '%(status)s'") % {
+            'hour': self.hour, 'status': self.status}
+
+
+@python_2_unicode_compatible
+class AbstractHourlyCustomerRecord(models.Model):
+    """
+    The number of customers who registered during an hour.
+    """
+
+    hour = models.DateTimeField(_("Hour"), unique=True)
+    num_customers = models.IntegerField(_("Customers"), default=0)
+
+    class Meta:
+        abstract = True
+        app_label = 'analytics'
+        ordering = ['hour']
+        verbose_name = _("Hourly customer record")
+        verbose_name_plural = _("Hourly customer records")
+
+    def __str__(self):
+        return _("Customers registered at %s") % self.hour
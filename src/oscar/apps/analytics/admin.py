@@ -17,9 +17,22 @@ class UserRecordAdmin(admin.ModelAdmin):
                     'num_orders', 'total_spent', 'date_last_order')
 
 
+class HourlyOrderRecordAdmin(admin.ModelAdmin):
+    list_display = ('hour', 'status', 'num_orders', 'num_lines',
+                    'total_incl_tax')
+
+
+class HourlyCustomerRecordAdmin(admin.ModelAdmin):
+    list_display = ('hour', 'num_customers')
+
+
 admin.site.register(get_model('analytics', 'productrecord'),
                     ProductRecordAdmin)
 admin.site.register(get_model('analytics', 'userrecord'), UserRecordAdmin)
 admin.site.register(get_model('analytics', 'usersearch'))
 admin.site.register(get_model('analytics', 'userproductview'),
                     UserProductViewAdmin)
+admin.site.register(get_model('analytics', 'hourlyorderrecord'),
+                    HourlyOrderRecordAdmin)
+admin.site.register(get_model('analytics', 'hourlycustomerrecord'),
+                    HourlyCustomerRecordAdmin)
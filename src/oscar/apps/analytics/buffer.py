@@ -0,0 +1,181 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+
+from oscar.core.loading import get_model
+
+logger = logging.getLogger('oscar.analytics')
+
+
+def update_counters(model, field_name, lookup, increments, chunk_size=500):
+    """
+    Increment a counter field on many records at once.
+
+    Rows are updated with one UPDATE per distinct increment (most increments
+    are small numbers like 1, so there are only a few of them) and missing
+    rows are inserted with ``bulk_create``.
+
+    :param model: The model class of the recording model
+    :param field_name: The name of the counter field
+    :param lookup: The name of the field identifying a record, eg
+                   ``product_id``
+    :param increments: A dict mapping the values of the lookup field to the
+                       increment for that record
+    """
+    keys = list(increments)
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start:start + chunk_size]
+        existing = set(model._default_manager.filter(
+            **{'%s__in' % lookup: chunk}).values_list(lookup, flat=True))
+
+        by_increment = defaultdict(list)
+        for key in existing:
+            by_increment[increments[key]].append(key)
+        for increment, group in by_increment.items():
+            model._default_manager.filter(
+                **{'%s__in' % lookup: group}).update(
+                    **{field_name: F(field_name) + increment})
+
+        missing = [key for key in chunk if key not in existing]
+        if missing:
+            _create_counters(model, field_name, lookup, increments, missing)
+
+
+def _create_counters(model, field_name, lookup, increments, keys):
+    try:
+        with transaction.atomic():
+            model._default_manager.bulk_create([
+                model(**{lookup: key, field_name: increments[key]})
+                for key in keys])
+    except IntegrityError:
+        # Another process created some of the records in the meantime, so we
+        # fall back to updating or creating them one by one.
+        for key in keys:
+            filter_kwargs = {lookup: key}
+            affected = model._default_manager.filter(**filter_kwargs).update(
+                **{field_name: F(field_name) + increments[key]})
+            if not affected:
+                try:
+                    with transaction.atomic():
+                        model._default_manager.create(**dict(
+                            filter_kwargs, **{field_name: increments[key]}))
+                except IntegrityError:
+                    logger.error(
+                        "IntegrityError when updating analytics counter "
+                        "for %s", model)
+
+
+class AnalyticsBuffer(object):
+    """
+    Process-local buffer of analytics data.
+
+    Counter increments and product views are collected in memory and written
+    in bulk by ``flush``. Once ``OSCAR_ANALYTICS_FLUSH_INTERVAL`` seconds have
+    passed since the last flush, or more than ``max_size`` entries are
+    pending, recording data starts a flush in a background thread, so that
+    requests don't wait for the analytics tables. Pending data is also flushed
+    when the process exits.
+
+    Data that is still buffered when a process is killed is lost, which is
+    the price for taking the writes out of the request cycle.
+    """
+    max_size = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._reset()
+        self._last_flush = time.time()
+
+    def _reset(self):
+        # {(model label, field name, lookup): {key: increment}}
+        self._counters = defaultdict(lambda: defaultdict(int))
+        # [(user ID, product ID)]
+        self._views = []
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def increment(self, model, field_name, lookup, key, increment=1):
+        with self._lock:
+            label = (model._meta.app_label, model._meta.object_name)
+            self._counters[(label, field_name, lookup)][key] += increment
+            self._size += 1
+        self.maybe_flush()
+
+    def add_view(self, user, product):
+        with self._lock:
+            self._views.append((user.pk, product.pk))
+            self._size += 1
+        self.maybe_flush()
+
+    def is_due(self):
+        interval = getattr(settings, 'OSCAR_ANALYTICS_FLUSH_INTERVAL', 0)
+        return (self._size > self.max_size or
+                time.time() - self._last_flush > interval)
+
+    def maybe_flush(self):
+        if self.is_due() and not self._flush_lock.locked():
+            self.start_flush()
+
+    def start_flush(self):
+        thread = threading.Thread(target=self._flush_in_thread)
+        thread.daemon = True
+        thread.start()
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Error when flushing analytics data")
+        finally:
+            # The thread has its own database connection, which would
+            # otherwise never be closed.
+            connection.close()
+
+    def take(self):
+        """
+        Return the pending data and empty the buffer
+        """
+        with self._lock:
+            counters, views = self._counters, self._views
+            self._reset()
+            self._last_flush = time.time()
+        return counters, views
+
+    def flush(self):
+        """
+        Write all pending data to the database
+        """
+        with self._flush_lock:
+            counters, views = self.take()
+            for (label, field_name, lookup), increments in counters.items():
+                update_counters(
+                    get_model(*label), field_name, lookup, increments)
+            if views:
+                UserProductView = get_model('analytics', 'UserProductView')
+                UserProductView._default_manager.bulk_create([
+                    UserProductView(user_id=user_id, product_id=product_id)
+                    for user_id, product_id in views])
+
+    def clear(self):
+        self.take()
+
+
+analytics_buffer = AnalyticsBuffer()
+
+
+@atexit.register
+def flush_analytics_buffer():
+    if len(analytics_buffer):
+        try:
+            analytics_buffer.flush()
+        except Exception:
+            logger.exception("Error when flushing analytics data")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from decimal import Decimal
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_auto_20140827_1705'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HourlyCustomerRecord',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(unique=True, verbose_name='Hour')),
+                ('num_customers', models.IntegerField(default=0, verbose_name='Customers')),
+            ],
+            options={
+                'ordering': ['hour'],
+                'verbose_name_plural': 'Hourly customer records',
+                'verbose_name': 'Hourly customer record',
+                'abstract': False,
+            },
+            bases=(models.Model,),
+        ),
+        migrations.CreateModel(
+            name='HourlyOrderRecord',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(db_index=True, verbose_name='Hour')),
+                ('status', models.CharField(max_length=100, verbose_name='Status', blank=True)),
+                ('num_orders', models.IntegerField(default=0, verbose_name='Orders')),
+                ('num_lines', models.IntegerField(default=0, verbose_name='Order Lines')),
+                ('total_incl_tax', models.DecimalField(default=Decimal('0.00'), verbose_name='Revenue', max_digits=12, decimal_places=2)),
+            ],
+            options={
+                'ordering': ['hour', 'status'],
+                'verbose_name_plural': 'Hourly order records',
+                'verbose_name': 'Hourly order record',
+                'abstract': False,
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='hourlyorderrecord',
+            unique_together=set([('hour', 'status')]),
+        ),
+    ]
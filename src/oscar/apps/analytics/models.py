@@ -1,4 +1,5 @@
 from oscar.apps.analytics.abstract_models import (
+    AbstractHourlyCustomerRecord, AbstractHourlyOrderRecord,
     AbstractProductRecord, AbstractUserProductView,
     AbstractUserRecord, AbstractUserSearch)
 from oscar.core.loading import is_model_registered
@@ -32,3 +33,17 @@ if not is_model_registered('analytics', 'UserSearch'):
         pass
 
     __all__.append('UserSearch')
+
+
+if not is_model_registered('analytics', 'HourlyOrderRecord'):
+    class HourlyOrderRecord(AbstractHourlyOrderRecord):
+        pass
+
+    __all__.append('HourlyOrderRecord')
+
+
+if not is_model_registered('analytics', 'HourlyCustomerRecord'):
+    class HourlyCustomerRecord(AbstractHourlyCustomerRecord):
+        pass
+
+    __all__.append('HourlyCustomerRecord')
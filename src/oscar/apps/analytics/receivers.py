@@ -1,10 +1,14 @@
 import logging
 
+from django.conf import settings
 from django.db import IntegrityError
 from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from oscar.apps.analytics.buffer import analytics_buffer, update_counters
 from oscar.apps.search.signals import user_search
+from oscar.core.compat import get_user_model
 from oscar.core.loading import get_class, get_classes
 
 UserSearch, UserRecord, ProductRecord, UserProductView = get_classes(
@@ -13,6 +17,11 @@ UserSearch, UserRecord, ProductRecord, UserProductView = get_classes(
 product_viewed = get_classes('catalogue.signals', ['product_viewed'])
 basket_addition = get_class('basket.signals', 'basket_addition')
 order_placed = get_class('order.signals', 'order_placed')
+order_status_changed = get_class('order.signals', 'order_status_changed')
+record_placed_order, record_order_status_change, record_customer = get_classes(
+    'analytics.stats', ['record_placed_order', 'record_order_status_change',
+                        'record_customer'])
+User = get_user_model()
 
 # Helpers
 
@@ -42,12 +51,23 @@ def _update_counter(model, field_name, filter_kwargs, increment=1):
             "IntegrityError when updating analytics counter for %s", model)
 
 
+def _is_buffered():
+    return bool(getattr(settings, 'OSCAR_ANALYTICS_FLUSH_INTERVAL', 0))
+
+
 def _record_products_in_order(order):
-    # surely there's a way to do this without causing a query for each line?
-    for line in order.lines.all():
-        _update_counter(
-            ProductRecord, 'num_purchases',
-            {'product': line.product}, line.quantity)
+    quantities = {}
+    for product_id, quantity in order.lines.exclude(
+            product=None).values_list('product_id', 'quantity'):
+        quantities[product_id] = quantities.get(product_id, 0) + quantity
+    if _is_buffered():
+        for product_id, quantity in quantities.items():
+            analytics_buffer.increment(
+                ProductRecord, 'num_purchases', 'product_id', product_id,
+                quantity)
+    else:
+        update_counters(
+            ProductRecord, 'num_purchases', 'product_id', quantities)
 
 
 def _record_user_order(user, order):
@@ -76,6 +96,14 @@ def _record_user_order(user, order):
 def receive_product_view(sender, product, user, **kwargs):
     if kwargs.get('raw', False):
         return
+    if _is_buffered():
+        analytics_buffer.increment(
+            ProductRecord, 'num_views', 'product_id', product.pk)
+        if user and user.is_authenticated():
+            analytics_buffer.increment(
+                UserRecord, 'num_product_views', 'user_id', user.pk)
+            analytics_buffer.add_view(user, product)
+        return
     _update_counter(ProductRecord, 'num_views', {'product': product})
     if user and user.is_authenticated():
         _update_counter(UserRecord, 'num_product_views', {'user': user})
@@ -92,6 +120,13 @@ def receive_product_search(sender, query, user, **kwargs):
 def receive_basket_addition(sender, product, user, **kwargs):
     if kwargs.get('raw', False):
         return
+    if _is_buffered():
+        analytics_buffer.increment(
+            ProductRecord, 'num_basket_additions', 'product_id', product.pk)
+        if user and user.is_authenticated():
+            analytics_buffer.increment(
+                UserRecord, 'num_basket_additions', 'user_id', user.pk)
+        return
     _update_counter(
         ProductRecord, 'num_basket_additions', {'product': product})
     if user and user.is_authenticated():
@@ -105,3 +140,21 @@ def receive_order_placed(sender, order, user, **kwargs):
     _record_products_in_order(order)
     if user and user.is_authenticated():
         _record_user_order(user, order)
+    record_placed_order(order)
+
+
+@receiver(order_status_changed)
+def receive_order_status_change(sender, order, old_status, new_status,
+                                **kwargs):
+    record_order_status_change(order, old_status, new_status)
+
+
+@receiver(post_save, sender=User)
+def receive_user_creation(sender, instance, created, **kwargs):
+    if created and not kwargs.get('raw', False):
+        record_customer(instance)
+
+
+@receiver(post_delete, sender=User)
+def receive_user_deletion(sender, instance, **kwargs):
+    record_customer(instance, increment=-1)
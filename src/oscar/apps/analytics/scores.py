@@ -1,4 +1,6 @@
-from django.db.models import F
+import time
+
+from django.db.models import F, Max, Min
 
 from oscar.core.loading import get_model
 
@@ -15,16 +17,66 @@ class Calculator(object):
         'num_purchases': 5
     }
 
-    def __init__(self, logger):
+    def __init__(self, logger, incremental=False, chunk_size=None,
+                 dry_run=False):
+        """
+        :param incremental: Only update the records whose score is out of date
+        :param chunk_size: Update the records in chunks of this many IDs
+                           (instead of a single UPDATE of the whole table)
+        :param dry_run: Only count and time the records that would be updated
+        """
         self.logger = logger
+        self.incremental = incremental
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
 
     def run(self):
         self.calculate_scores()
 
-    def calculate_scores(self):
-        self.logger.info("Calculating product scores")
+    def get_score_expression(self):
         total_weight = float(sum(self.weights.values()))
         weighted_fields = [
             self.weights[name] * F(name) for name in self.weights.keys()]
-        ProductRecord.objects.update(
-            score=sum(weighted_fields) / total_weight)
+        return sum(weighted_fields) / total_weight
+
+    def get_queryset(self):
+        queryset = ProductRecord.objects.all()
+        if self.incremental:
+            # Records whose counters haven't changed since the last run
+            # already have the right score, so we don't rewrite them.
+            queryset = queryset.exclude(score=self.get_score_expression())
+        return queryset
+
+    def calculate_scores(self):
+        self.logger.info("Calculating product scores")
+        start = time.time()
+        if self.chunk_size:
+            num_updated = self.update_in_chunks(self.get_queryset())
+        else:
+            num_updated = self.update_scores(self.get_queryset())
+        self.logger.info(
+            "%s %d product scores in %.2f seconds",
+            "Found stale" if self.dry_run else "Updated",
+            num_updated, time.time() - start)
+        return num_updated
+
+    def update_in_chunks(self, queryset):
+        bounds = ProductRecord.objects.aggregate(Min('id'), Max('id'))
+        if bounds['id__min'] is None:
+            return 0
+        num_updated = 0
+        for lower in range(bounds['id__min'], bounds['id__max'] + 1,
+                           self.chunk_size):
+            upper = lower + self.chunk_size
+            num_updated += self.update_scores(
+                queryset.filter(id__gte=lower, id__lt=upper))
+            self.logger.info(
+                "Processed records with IDs %d to %d of %d (%d %s so far)",
+                lower, upper - 1, bounds['id__max'], num_updated,
+                "stale" if self.dry_run else "updated")
+        return num_updated
+
+    def update_scores(self, queryset):
+        if self.dry_run:
+            return queryset.count()
+        return queryset.update(score=self.get_score_expression())
@@ -0,0 +1,201 @@
+import logging
+import time
+from decimal import Decimal as D
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Count, Sum
+from django.utils import timezone
+
+from oscar.core.compat import get_user_model
+from oscar.core.loading import get_model
+
+HourlyOrderRecord = get_model('analytics', 'HourlyOrderRecord')
+HourlyCustomerRecord = get_model('analytics', 'HourlyCustomerRecord')
+Order = get_model('order', 'Order')
+
+logger = logging.getLogger('oscar.analytics')
+
+
+def get_hour(value):
+    """
+    Return the start of the hour of a datetime (in UTC if it's aware), which
+    is the ``hour`` of the records it's rolled up into
+    """
+    if timezone.is_aware(value):
+        value = value.astimezone(timezone.utc)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def update_record(model, lookup, **increments):
+    """
+    Add the increments to the fields of the record matching the lookup, and
+    create it if it doesn't exist yet
+    """
+    queryset = model._default_manager.filter(**lookup)
+    updates = dict((name, F(name) + value)
+                   for name, value in increments.items())
+    if queryset.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            model._default_manager.create(**dict(lookup, **increments))
+    except IntegrityError:
+        # Created by another process in the meantime
+        queryset.update(**updates)
+
+
+# Recording
+
+def record_placed_order(order):
+    update_record(
+        HourlyOrderRecord,
+        {'hour': get_hour(order.date_placed), 'status': order.status or ''},
+        num_orders=1, num_lines=order.num_lines,
+        total_incl_tax=order.total_incl_tax)
+
+
+def record_order_status_change(order, old_status, new_status):
+    """
+    Move an order from the record of its old status to the one of its new
+    status
+    """
+    hour = get_hour(order.date_placed)
+    num_lines = order.num_lines
+    update_record(
+        HourlyOrderRecord, {'hour': hour, 'status': old_status or ''},
+        num_orders=-1, num_lines=-num_lines,
+        total_incl_tax=-order.total_incl_tax)
+    update_record(
+        HourlyOrderRecord, {'hour': hour, 'status': new_status or ''},
+        num_orders=1, num_lines=num_lines,
+        total_incl_tax=order.total_incl_tax)
+
+
+def record_customer(user, increment=1):
+    date_joined = getattr(user, 'date_joined', None)
+    if date_joined is not None:
+        update_record(HourlyCustomerRecord, {'hour': get_hour(date_joined)},
+                      num_customers=increment)
+
+
+# Rebuilding
+
+def rebuild_order_records(batch_size=1000):
+    """
+    Replace the hourly order records with ones rolled up from the order
+    table, and return the number of orders.
+
+    Orders are read in batches of primary keys. Orders that are placed or
+    change status while the records are rebuilt may not be counted
+    correctly.
+    """
+    start = time.time()
+    records = {}
+    num_orders = 0
+    orders = Order._default_manager.order_by('pk').annotate(
+        line_count=Count('lines')).values_list(
+            'pk', 'date_placed', 'status', 'total_incl_tax', 'line_count')
+    last_pk = 0
+    while True:
+        batch = list(orders.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        for pk, date_placed, status, total_incl_tax, line_count in batch:
+            key = (get_hour(date_placed), status or '')
+            record = records.setdefault(key, HourlyOrderRecord(
+                hour=key[0], status=key[1]))
+            record.num_orders += 1
+            record.num_lines += line_count
+            record.total_incl_tax += total_incl_tax
+        num_orders += len(batch)
+        last_pk = batch[-1][0]
+    with transaction.atomic():
+        HourlyOrderRecord._default_manager.all().delete()
+        HourlyOrderRecord._default_manager.bulk_create(
+            records.values(), batch_size=batch_size)
+    logger.info("Rolled up %d orders into %d hourly records in %.1f seconds",
+                num_orders, len(records), time.time() - start)
+    return num_orders
+
+
+def rebuild_customer_records(batch_size=1000):
+    """
+    Replace the hourly customer records with ones rolled up from the user
+    table, and return the number of customers
+    """
+    start = time.time()
+    records = {}
+    users = get_user_model()._default_manager.order_by('pk').values_list(
+        'pk', 'date_joined')
+    num_customers = 0
+    last_pk = 0
+    while True:
+        batch = list(users.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        for pk, date_joined in batch:
+            hour = get_hour(date_joined)
+            record = records.setdefault(hour, HourlyCustomerRecord(hour=hour))
+            record.num_customers += 1
+        num_customers += len(batch)
+        last_pk = batch[-1][0]
+    with transaction.atomic():
+        HourlyCustomerRecord._default_manager.all().delete()
+        HourlyCustomerRecord._default_manager.bulk_create(
+            records.values(), batch_size=batch_size)
+    logger.info(
+        "Rolled up %d customers into %d hourly records in %.1f seconds",
+        num_customers, len(records), time.time() - start)
+    return num_customers
+
+
+# Reading
+
+def get_hour_filters(filters):
+    """
+    Translate filters on the ``date_placed`` of orders to filters on the
+    ``hour`` of records, or return None if that's not possible.
+
+    Dates are compared with the start of the hour of the records, so bounds
+    are rounded to the hour.
+    """
+    hour_filters = {}
+    for lookup, value in filters.items():
+        if lookup in ('date_placed__gt', 'date_placed__gte'):
+            hour_filters['hour__gte'] = value
+        elif lookup in ('date_placed__lt', 'date_placed__lte'):
+            hour_filters['hour__lt'] = value
+        elif lookup == 'date_placed__range':
+            hour_filters['hour__gte'], hour_filters['hour__lt'] = value
+        else:
+            return None
+    return hour_filters
+
+
+def get_order_stats(**filters):
+    """
+    Return the number of orders and lines and the revenue of the records
+    matching the filters
+    """
+    stats = HourlyOrderRecord._default_manager.filter(**filters).aggregate(
+        total_orders=Sum('num_orders'), total_lines=Sum('num_lines'),
+        total_revenue=Sum('total_incl_tax'))
+    return {
+        'total_orders': stats['total_orders'] or 0,
+        'total_lines': stats['total_lines'] or 0,
+        'total_revenue': stats['total_revenue'] or D('0.00'),
+    }
+
+
+def get_order_status_breakdown(**filters):
+    """
+    Return the number of orders (``freq``) of each status
+    """
+    return HourlyOrderRecord._default_manager.filter(**filters).order_by(
+        'status').values('status').annotate(
+            freq=Sum('num_orders')).filter(freq__gt=0)
+
+
+def get_customer_count(**filters):
+    return HourlyCustomerRecord._default_manager.filter(**filters).aggregate(
+        total=Sum('num_customers'))['total'] or 0
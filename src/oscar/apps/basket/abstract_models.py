@@ -1,3 +1,4 @@
+import hashlib
 import zlib
 from decimal import Decimal as D
 
@@ -242,6 +243,27 @@ class AbstractBasket(models.Model):
         self.offer_applications = results.OfferApplications()
         self._lines = None
 
+    def get_content_fingerprint(self):
+        """
+        Return a hash of the basket contents that offers depend on.
+
+        The fingerprint changes whenever a line is added, removed or changes
+        quantity, when the price of a line changes and when vouchers are added
+        or removed. It can be used to check that two requests are pricing the
+        same basket.
+        """
+        parts = []
+        for line in self.all_lines():
+            price = line.purchase_info.price
+            parts.append('%s:%s:%s:%s:%s' % (
+                line.id, line.quantity, line.stockrecord_id,
+                price.effective_price, price.is_tax_known))
+        if self.id:
+            parts.extend(sorted(
+                'voucher:%s' % code
+                for code in self.vouchers.values_list('code', flat=True)))
+        return hashlib.sha1('|'.join(parts).encode('utf8')).hexdigest()
+
     def merge_line(self, line, add_quantities=True):
         """
         For transferring a line from another basket to this one.
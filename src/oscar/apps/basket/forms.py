@@ -4,12 +4,14 @@ from django.db.models import Sum
 from django.forms.models import BaseModelFormSet, modelformset_factory
 from django.utils.translation import ugettext_lazy as _
 
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 from oscar.forms import widgets
 
 Line = get_model('basket', 'line')
 Basket = get_model('basket', 'basket')
 Product = get_model('catalogue', 'product')
+prefetch_attribute_values = get_class(
+    'catalogue.managers', 'prefetch_attribute_values')
 
 
 class BasketLineForm(forms.ModelForm):
@@ -159,7 +161,8 @@ class AddToBasketForm(forms.Form):
         """
         choices = []
         disabled_values = []
-        for child in product.children.all():
+        children = prefetch_attribute_values(product.children.all())
+        for child in children:
             # Build a description of the child, including any pertinent
             # attributes
             attr_summary = child.attribute_summary
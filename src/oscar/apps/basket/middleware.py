@@ -8,7 +8,11 @@ from oscar.core.loading import get_class, get_model
 
 Applicator = get_class('offer.utils', 'Applicator')
 Basket = get_model('basket', 'basket')
+BasketSummary = get_class('basket.summary', 'BasketSummary')
 Selector = get_class('partner.strategy', 'Selector')
+cache_basket_summary = get_class('basket.summary', 'cache_basket_summary')
+get_cached_basket_summary = get_class(
+    'basket.summary', 'get_cached_basket_summary')
 
 selector = Selector()
 
@@ -23,9 +27,10 @@ class BasketMiddleware(object):
         request.cookies_to_delete = []
 
         # Load stock/price strategy and assign to request (it will later be
-        # assigned to the basket too).
-        strategy = selector.strategy(request=request, user=request.user)
-        request.strategy = strategy
+        # assigned to the basket too). Like the basket, it's only loaded when
+        # it's first used.
+        request.strategy = SimpleLazyObject(
+            lambda: selector.strategy(request=request, user=request.user))
 
         # We lazily load the basket so use a private variable to hold the
         # cached instance.
@@ -56,6 +61,8 @@ class BasketMiddleware(object):
         # when the attribute is accessed.
         request.basket = SimpleLazyObject(load_full_basket)
         request.basket_hash = SimpleLazyObject(load_basket_hash)
+        request.basket_summary = SimpleLazyObject(
+            lambda: self.get_basket_summary(request))
 
     def process_response(self, request, response):
         # Delete any surplus cookies
@@ -172,6 +179,60 @@ class BasketMiddleware(object):
 
         return basket
 
+    def get_basket_summary(self, request):
+        """
+        Return the summary of the open basket for this request (see
+        ``basket.summary.BasketSummary``), as rendered in the page header.
+
+        Anonymous visitors without a basket cookie get an empty summary, and
+        the summaries of existing baskets are read from the cache if
+        ``OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT`` is set. The basket is only
+        loaded if neither is possible.
+        """
+        if (not isinstance(request.basket, SimpleLazyObject)
+                or request.basket._wrapped is not empty):
+            # The basket has already been loaded for this request
+            return BasketSummary.from_basket(request.basket)
+
+        is_authenticated = (hasattr(request, 'user')
+                            and request.user.is_authenticated())
+        if (not is_authenticated
+                and self.get_cookie_key(request) not in request.COOKIES):
+            return BasketSummary.empty()
+
+        use_cache = bool(settings.OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT)
+        if use_cache:
+            basket_id = self.get_basket_id(request)
+            if basket_id is not None:
+                summary = get_cached_basket_summary(basket_id)
+                if summary is not None:
+                    return summary
+
+        summary = BasketSummary.from_basket(request.basket)
+        if use_cache and summary.basket_id:
+            cache_basket_summary(summary)
+        return summary
+
+    def get_basket_id(self, request):
+        """
+        Return the ID of the open basket for this request without loading
+        it, or None if that isn't possible (eg because baskets need to be
+        merged first)
+        """
+        cookie_key = self.get_cookie_key(request)
+        if hasattr(request, 'user') and request.user.is_authenticated():
+            if cookie_key in request.COOKIES:
+                return None
+            basket_ids = list(Basket.open.filter(
+                owner=request.user).values_list('id', flat=True)[:2])
+            if len(basket_ids) == 1:
+                return basket_ids[0]
+            return None
+        try:
+            return int(Signer().unsign(request.COOKIES[cookie_key]))
+        except (KeyError, BadSignature, ValueError):
+            return None
+
     def merge_baskets(self, master, slave):
         """
         Merge one basket into another.
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from oscar.core.loading import get_class, get_model
+
+Basket = get_model('basket', 'Basket')
+Line = get_model('basket', 'Line')
+invalidate_basket_summary = get_class(
+    'basket.summary', 'invalidate_basket_summary')
+
+
+@receiver(post_save, sender=Basket)
+@receiver(post_delete, sender=Basket)
+@receiver(post_save, sender=Line)
+@receiver(post_delete, sender=Line)
+@receiver(m2m_changed, sender=Basket.vouchers.through)
+def invalidate_summary(sender, instance, **kwargs):
+    """
+    Remove the cached summary (see ``basket.summary``) of a changed basket
+    """
+    if not settings.OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT:
+        return
+    if isinstance(instance, Line):
+        invalidate_basket_summary(instance.basket_id)
+    elif isinstance(instance, Basket):
+        invalidate_basket_summary(instance.id)
+    else:
+        # A voucher was added to or removed from baskets
+        for basket_id in kwargs.get('pk_set') or ():
+            invalidate_basket_summary(basket_id)
@@ -0,0 +1,92 @@
+from decimal import Decimal as D
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.encoding import force_text
+
+from oscar.core.loading import get_class, get_classes
+
+get_offer_version = get_class('offer.cache', 'get_offer_version')
+PlainValues, get_primary_image_name = get_classes(
+    'catalogue.cards', ['PlainValues', 'get_primary_image_name'])
+
+BASKET_SUMMARY_CACHE_KEY = 'oscar_basket_summary_%s_%s'
+
+
+class BasketSummary(PlainValues):
+    """
+    A compact representation of a basket as it's rendered in the page header
+    (see ``partials/mini_basket.html``).
+
+    Summaries only hold plain values, so they can be stored in the cache and
+    rendered without loading the basket, its lines and offers.
+    """
+
+    @classmethod
+    def empty(cls):
+        """
+        Return the summary of an empty basket
+        """
+        return cls(basket_id=None, num_lines=0, num_items=0, is_empty=True,
+                   is_tax_known=True, total_excl_tax=D('0.00'),
+                   total_incl_tax=D('0.00'), currency=None, lines=[])
+
+    @classmethod
+    def from_basket(cls, basket):
+        lines = []
+        for line in basket.all_lines():
+            product = line.product
+            lines.append(dict(
+                id=line.id,
+                product_id=product.id,
+                url=product.get_absolute_url(),
+                title=force_text(product.get_title()),
+                image=get_primary_image_name(product),
+                description=force_text(line.description),
+                quantity=line.quantity,
+                unit_price_excl_tax=line.unit_price_excl_tax))
+        is_tax_known = basket.is_tax_known
+        return cls(
+            basket_id=basket.id,
+            num_lines=len(lines),
+            num_items=sum(line['quantity'] for line in lines),
+            is_empty=not lines,
+            is_tax_known=is_tax_known,
+            total_excl_tax=basket.total_excl_tax,
+            total_incl_tax=basket.total_incl_tax if is_tax_known else None,
+            currency=basket.currency,
+            lines=lines)
+
+    @property
+    def total(self):
+        if self.is_tax_known:
+            return self.total_incl_tax
+        return self.total_excl_tax
+
+
+def get_basket_summary_key(basket_id):
+    # The offer version is part of the key, as the totals depend on the
+    # offers applied to the basket
+    return BASKET_SUMMARY_CACHE_KEY % (get_offer_version(), basket_id)
+
+
+def get_cached_basket_summary(basket_id):
+    """
+    Return the cached summary of the passed basket, or None
+    """
+    data = cache.get(get_basket_summary_key(basket_id))
+    if data is not None:
+        return BasketSummary(**data)
+
+
+def cache_basket_summary(summary):
+    cache.set(get_basket_summary_key(summary.basket_id), summary.to_dict(),
+              settings.OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT)
+
+
+def invalidate_basket_summary(basket_id):
+    """
+    Remove the cached summary of the passed basket
+    """
+    if basket_id:
+        cache.delete(get_basket_summary_key(basket_id))
@@ -33,6 +33,7 @@ ProductManager, BrowsableProductManager = get_classes(
     'catalogue.managers', ['ProductManager', 'BrowsableProductManager'])
 
 Selector = get_class('partner.strategy', 'Selector')
+category_moved = get_class('catalogue.signals', 'category_moved')
 
 
 @python_2_unicode_compatible
@@ -98,6 +99,11 @@ class AbstractCategory(MP_Node):
     _slug_separator = '/'
     _full_name_separator = ' > '
 
+    # Full names and slugs can be precomputed for a whole tree at once (see
+    # set_full_names_and_slugs) to avoid looking up ancestors per category.
+    _full_name = None
+    _full_slug = None
+
     def __str__(self):
         return self.full_name
 
@@ -111,6 +117,8 @@ class AbstractCategory(MP_Node):
         CharField and is hence kept for backwards compatibility. It's also
         sufficiently useful to keep around.
         """
+        if self._full_name is not None:
+            return self._full_name
         names = [category.name for category in self.get_ancestors_and_self()]
         return self._full_name_separator.join(names)
 
@@ -124,9 +132,32 @@ class AbstractCategory(MP_Node):
         has been re-purposed to only store this category's slug and to not
         include it's ancestors' slugs.
         """
+        if self._full_slug is not None:
+            return self._full_slug
         slugs = [category.slug for category in self.get_ancestors_and_self()]
         return self._slug_separator.join(slugs)
 
+    @classmethod
+    def set_full_names_and_slugs(cls, categories, ancestors=None):
+        """
+        Precompute the full names and slugs of a list of categories, as
+        returned by get_tree or get_descendants (ie ordered by path).
+
+        If the list doesn't start at the root of the tree, the ancestors of
+        its first category have to be passed in.
+        """
+        # Stack of the (name, slug) pairs of the current category's ancestors
+        stack = [(c.name, c.slug) for c in ancestors or []]
+        # Depth of the first category on the stack
+        offset = categories[0].depth - len(stack) if categories else 0
+        for category in categories:
+            del stack[category.depth - offset:]
+            stack.append((category.name, category.slug))
+            category._full_name = cls._full_name_separator.join(
+                name for name, slug in stack)
+            category._full_slug = cls._slug_separator.join(
+                slug for name, slug in stack)
+
     def generate_slug(self):
         """
         Generates a slug for a category. This makes no attempt at generating
@@ -158,6 +189,8 @@ class AbstractCategory(MP_Node):
         instances with a slug already set, or expose a field on the
         appropriate forms.
         """
+        # Precomputed names and slugs might be outdated now
+        self._full_name = self._full_slug = None
         if self.slug:
             # Slug was supplied. Hands off!
             super(AbstractCategory, self).save(*args, **kwargs)
@@ -170,6 +203,19 @@ class AbstractCategory(MP_Node):
             # update the slug and save again if necessary.
             self.ensure_slug_uniqueness()
 
+    def move(self, target, pos=None):
+        """
+        Move the category within the tree.
+
+        Treebeard moves nodes using queryset updates, which don't send any
+        model signals, so we send category_moved instead.
+        """
+        super(AbstractCategory, self).move(target, pos)
+        self._full_name = self._full_slug = None
+        category_moved.send(
+            sender=self.__class__, category=self, target=target, pos=pos)
+    move.alters_data = True
+
     def get_ancestors_and_self(self):
         """
         Gets ancestors and includes itself. Use treebeard's get_ancestors
@@ -723,10 +769,10 @@ class ProductAttributesContainer(object):
 
     def __getattr__(self, name):
         if not name.startswith('_') and not self.initialised:
-            values = self.get_values().select_related('attribute')
-            for v in values:
-                setattr(self, v.attribute.code, v.value)
-            self.initialised = True
+            values = self.get_values()
+            if not self.values_are_prefetched():
+                values = values.select_related('attribute')
+            self.initialise(values)
             return getattr(self, name)
         raise AttributeError(
             _("%(obj)s has no attribute named '%(attr)s'") % {
@@ -748,6 +794,19 @@ class ProductAttributesContainer(object):
                         _("%(attr)s attribute %(err)s") %
                         {'attr': attribute.code, 'err': e})
 
+    def initialise(self, values):
+        """
+        Set the attributes from the passed attribute values, eg ones that were
+        fetched in bulk (see ``catalogue.managers.prefetch_attribute_values``)
+        """
+        for v in values:
+            setattr(self, v.attribute.code, v.value)
+        self.initialised = True
+
+    def values_are_prefetched(self):
+        return 'attribute_values' in getattr(
+            self.product, '_prefetched_objects_cache', {})
+
     def get_values(self):
         return self.product.attribute_values.all()
 
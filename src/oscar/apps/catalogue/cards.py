@@ -0,0 +1,152 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.forms.forms import pretty_name
+from django.utils.encoding import force_text
+from django.utils.translation import get_language
+
+from oscar.core.loading import get_class, get_model
+
+Product = get_model('catalogue', 'Product')
+Selector = get_class('partner.strategy', 'Selector')
+
+PRODUCT_CARD_CACHE_KEY = 'oscar_product_card_%s_%s'
+
+
+def get_primary_image_name(product):
+    """
+    Return the file name of the product's primary image, or of the "missing
+    image" placeholder
+    """
+    image = product.primary_image()
+    if isinstance(image, dict):
+        return image['original'].name
+    return image.original.name
+
+
+class PlainValues(object):
+    """
+    Base class for compact representations that only hold plain values, so
+    that they can be stored in the cache as dictionaries (see ``to_dict``)
+    """
+
+    def __init__(self, **data):
+        self.__dict__.update(data)
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+class ProductCard(PlainValues):
+    """
+    A compact representation of a product as it's rendered in product lists
+    (see ``catalogue/partials/product_card.html``).
+
+    Cards only hold plain values, so they can be stored in the cache. Their
+    prices and availabilities are those of the default strategy (the one
+    returned by ``Selector().strategy()`` without a request), so they are only
+    suitable for sites whose strategy doesn't depend on the request or user.
+    """
+
+    @classmethod
+    def from_product(cls, product, purchase_info):
+        price = purchase_info.price
+        availability = purchase_info.availability
+        return cls(
+            id=product.id,
+            upc=product.upc,
+            product_class=product.get_product_class().slug,
+            title=force_text(product.get_title()),
+            url=product.get_absolute_url(),
+            image=get_primary_image_name(product),
+            rating=product.rating,
+            is_parent=product.is_parent,
+            # Mirrors the option fields of the add-to-basket form
+            options=sorted((option.code, pretty_name(option.code))
+                           for option in product.options),
+            price_exists=price.exists,
+            price_excl_tax=price.excl_tax if price.exists else None,
+            price_incl_tax=(price.incl_tax if price.exists and
+                            price.is_tax_known else None),
+            is_tax_known=price.is_tax_known,
+            currency=price.currency if price.exists else None,
+            availability_code=availability.code,
+            availability_message=force_text(availability.short_message),
+            is_available_to_buy=availability.is_available_to_buy)
+
+
+def get_product_card_key(product_id, language=None):
+    if language is None:
+        language = get_language()
+    return PRODUCT_CARD_CACHE_KEY % (language, product_id)
+
+
+def build_product_cards(product_ids):
+    """
+    Build the cards of the passed products, keyed by product ID
+    """
+    products = Product._default_manager.base_queryset().filter(
+        id__in=product_ids)
+    strategy = Selector().strategy()
+    purchase_infos = strategy.fetch_for_products(products)
+    return dict(
+        (product.id,
+         ProductCard.from_product(product, purchase_infos[product.id]))
+        for product in products)
+
+
+def get_product_cards(product_ids):
+    """
+    Return the cards of the passed products, in the same order.
+
+    The cards are fetched from the cache with a single multi-get; the ones
+    that are missing are built and cached. IDs of products that don't exist
+    are skipped.
+    """
+    product_ids = list(product_ids)
+    keys = dict((get_product_card_key(product_id), product_id)
+                for product_id in product_ids)
+    cards = dict((keys[key], ProductCard(**data))
+                 for key, data in cache.get_many(list(keys)).items())
+    missing_ids = [product_id for product_id in product_ids
+                   if product_id not in cards]
+    if missing_ids:
+        built_cards = build_product_cards(missing_ids)
+        cache.set_many(
+            dict((get_product_card_key(product_id), card.to_dict())
+                 for product_id, card in built_cards.items()),
+            settings.OSCAR_PRODUCT_CARD_CACHE_TIMEOUT)
+        cards.update(built_cards)
+    return [cards[product_id] for product_id in product_ids
+            if product_id in cards]
+
+
+def invalidate_product_cards(product_ids):
+    """
+    Remove the cached cards of the passed products in all languages
+    """
+    languages = set(code for code, name in settings.LANGUAGES)
+    languages.add(settings.LANGUAGE_CODE)
+    cache.delete_many([
+        get_product_card_key(product_id, language)
+        for product_id in set(product_ids) if product_id
+        for language in languages])
+
+
+def invalidate_cards_of_products(product_ids):
+    """
+    Remove the cached cards of the passed products and of their parents,
+    whose price and availability depend on their children.
+
+    This is for code that changes products or stock records without sending
+    signals, eg with ``QuerySet.update``.
+    """
+    if not settings.OSCAR_PRODUCT_CARD_CACHE_TIMEOUT:
+        return
+    product_ids = set(product_ids)
+    product_ids.discard(None)
+    if not product_ids:
+        return
+    parent_ids = Product._default_manager.filter(
+        id__in=product_ids, parent__isnull=False).values_list(
+            'parent_id', flat=True)
+    invalidate_product_cards(product_ids.union(parent_ids))
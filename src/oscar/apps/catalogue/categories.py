@@ -1,7 +1,24 @@
+from oscar.core.cache import bump_cache_version, get_cache_version
 from oscar.core.loading import get_model
 
 Category = get_model('catalogue', 'category')
 
+CATEGORY_TREE_VERSION_CACHE_KEY = 'oscar_category_tree_version'
+
+
+def get_category_tree_version():
+    """
+    Return the current version of the category tree, for use in cache keys
+    """
+    return get_cache_version(CATEGORY_TREE_VERSION_CACHE_KEY)
+
+
+def bump_category_tree_version():
+    """
+    Invalidate all cached category tree data
+    """
+    bump_cache_version(CATEGORY_TREE_VERSION_CACHE_KEY)
+
 
 def create_from_sequence(bits):
     """
@@ -1,4 +1,32 @@
 from django.db import models
+from django.db.models import Prefetch
+
+from oscar.core.compat import prefetch_related_objects
+from oscar.core.loading import get_model
+
+
+def attribute_values_prefetch(lookup='attribute_values'):
+    """
+    Return a prefetch of the attribute values of products, together with
+    their attributes and option values, which are needed to decode the values
+    """
+    ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+    return Prefetch(
+        lookup, queryset=ProductAttributeValue._default_manager.select_related(
+            'attribute', 'value_option').prefetch_related('value_entity'))
+
+
+def prefetch_attribute_values(products):
+    """
+    Fetch the attribute values of a list of products with a single query, and
+    populate their attribute containers (``product.attr``). Returns the
+    products as a list.
+    """
+    products = list(products)
+    prefetch_related_objects(products, attribute_values_prefetch())
+    for product in products:
+        product.attr.initialise(product.attribute_values.all())
+    return products
 
 
 class ProductQuerySet(models.query.QuerySet):
@@ -14,6 +42,9 @@ class ProductQuerySet(models.query.QuerySet):
                               'product_class__options',
                               'stockrecords',
                               'images',
+                              attribute_values_prefetch(),
+                              attribute_values_prefetch(
+                                  'children__attribute_values'),
                               )
 
     def browsable(self):
@@ -1,20 +1,29 @@
 # -*- coding: utf-8 -*-
 
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
-if settings.OSCAR_DELETE_IMAGE_FILES:
+from oscar.core.loading import get_class, get_classes, get_model
+
+Category = get_model('catalogue', 'Category')
+Product = get_model('catalogue', 'Product')
+ProductImage = get_model('catalogue', 'ProductImage')
+StockRecord = get_model('partner', 'StockRecord')
+bump_category_tree_version = get_class(
+    'catalogue.categories', 'bump_category_tree_version')
+category_moved = get_class('catalogue.signals', 'category_moved')
+invalidate_product_cards, invalidate_cards_of_products = get_classes(
+    'catalogue.cards',
+    ['invalidate_product_cards', 'invalidate_cards_of_products'])
 
-    from oscar.core.loading import get_model
+if settings.OSCAR_DELETE_IMAGE_FILES:
 
     from django.db import models
-    from django.db.models.signals import post_delete
 
     from sorl import thumbnail
     from sorl.thumbnail.helpers import ThumbnailError
 
-    ProductImage = get_model('catalogue', 'ProductImage')
-    Category = get_model('catalogue', 'Category')
-
     def delete_image_files(sender, instance, **kwargs):
         """
         Deletes the original image, created thumbnails, and any entries
@@ -34,3 +43,32 @@ if settings.OSCAR_DELETE_IMAGE_FILES:
     models_with_images = [ProductImage, Category]
     for sender in models_with_images:
         post_delete.connect(delete_image_files, sender=sender)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(category_moved)
+def invalidate_category_tree(sender, **kwargs):
+    """
+    Invalidate cached category trees (see the category_tree template tag)
+    """
+    bump_category_tree_version()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=StockRecord)
+@receiver(post_delete, sender=StockRecord)
+def invalidate_product_card(sender, instance, **kwargs):
+    """
+    Remove the cached cards (see ``catalogue.cards``) of a changed product and
+    of its parent, whose price and availability depend on its children
+    """
+    if not settings.OSCAR_PRODUCT_CARD_CACHE_TIMEOUT:
+        return
+    if sender is Product:
+        invalidate_product_cards([instance.id, instance.parent_id])
+    else:
+        invalidate_cards_of_products([instance.product_id])
@@ -4,11 +4,13 @@ from django.views.generic.list import MultipleObjectMixin
 
 from oscar.core.decorators import deprecated
 from oscar.core.loading import get_class, get_model
+from oscar.views.generic import KeysetPaginationMixin
 
 BrowseCategoryForm = get_class('search.forms', 'BrowseCategoryForm')
 SearchHandler = get_class('search.search_handlers', 'SearchHandler')
 is_solr_supported = get_class('search.features', 'is_solr_supported')
 is_elasticsearch_supported = get_class('search.features', 'is_elasticsearch_supported')
+get_product_cards = get_class('catalogue.cards', 'get_product_cards')
 Product = get_model('catalogue', 'Product')
 
 
@@ -82,7 +84,7 @@ class ESProductSearchHandler(SearchHandler):
         return sqs
 
 
-class SimpleProductSearchHandler(MultipleObjectMixin):
+class SimpleProductSearchHandler(KeysetPaginationMixin, MultipleObjectMixin):
     """
     A basic implementation of the full-featured SearchHandler that has no
     faceting support, but doesn't require a Haystack backend. It only
@@ -90,6 +92,13 @@ class SimpleProductSearchHandler(MultipleObjectMixin):
 
     Note that is meant as a replacement search handler and not as a view
     mixin; the mixin just does most of what we need it to do.
+
+    If ``OSCAR_PRODUCT_CARD_CACHE_TIMEOUT`` is set, only the IDs of the
+    products are paginated, and the page is rendered from cached product
+    cards instead of product instances.
+
+    If ``OSCAR_KEYSET_PAGINATION`` is set, the next and previous pages are
+    found by seeking rather than with offsets (see ``KeysetPaginator``).
     """
     paginate_by = settings.OSCAR_PRODUCTS_PER_PAGE
 
@@ -108,6 +117,16 @@ class SimpleProductSearchHandler(MultipleObjectMixin):
         # Set the context_object_name instance property as it's needed
         # internally by MultipleObjectMixin
         self.context_object_name = context_object_name
-        context = self.get_context_data(object_list=self.object_list)
-        context[context_object_name] = context['page_obj'].object_list
+        object_list = self.object_list
+        if settings.OSCAR_PRODUCT_CARD_CACHE_TIMEOUT:
+            # The sort keys are needed for keyset pagination
+            ordering = (object_list.query.order_by or
+                        object_list.model._meta.ordering)
+            object_list = object_list.prefetch_related(None).values(
+                'id', *[field.lstrip('-') for field in ordering])
+        context = self.get_context_data(object_list=object_list)
+        products = context['page_obj'].object_list
+        if settings.OSCAR_PRODUCT_CARD_CACHE_TIMEOUT:
+            products = get_product_cards(row['id'] for row in products)
+        context[context_object_name] = products
         return context
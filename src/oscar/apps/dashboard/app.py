@@ -1,7 +1,7 @@
-from django.conf.urls import include, url
+from django.conf.urls import url
 
-from oscar.core.application import Application
-from oscar.core.loading import get_class
+from oscar.core.application import Application, lazy_include
+from oscar.core.loading import get_class, get_class_lazily
 
 
 class DashboardApplication(Application):
@@ -11,36 +11,39 @@ class DashboardApplication(Application):
     }
 
     index_view = get_class('dashboard.views', 'IndexView')
-    reports_app = get_class('dashboard.reports.app', 'application')
-    orders_app = get_class('dashboard.orders.app', 'application')
-    users_app = get_class('dashboard.users.app', 'application')
-    catalogue_app = get_class('dashboard.catalogue.app', 'application')
-    promotions_app = get_class('dashboard.promotions.app', 'application')
-    pages_app = get_class('dashboard.pages.app', 'application')
-    partners_app = get_class('dashboard.partners.app', 'application')
-    offers_app = get_class('dashboard.offers.app', 'application')
-    ranges_app = get_class('dashboard.ranges.app', 'application')
-    reviews_app = get_class('dashboard.reviews.app', 'application')
-    vouchers_app = get_class('dashboard.vouchers.app', 'application')
-    comms_app = get_class('dashboard.communications.app', 'application')
-    shipping_app = get_class('dashboard.shipping.app', 'application')
+    reports_app = get_class_lazily('dashboard.reports.app', 'application')
+    orders_app = get_class_lazily('dashboard.orders.app', 'application')
+    users_app = get_class_lazily('dashboard.users.app', 'application')
+    catalogue_app = get_class_lazily(
+        'dashboard.catalogue.app', 'application')
+    promotions_app = get_class_lazily('dashboard.promotions.app', 'application')
+    pages_app = get_class_lazily('dashboard.pages.app', 'application')
+    partners_app = get_class_lazily('dashboard.partners.app', 'application')
+    offers_app = get_class_lazily('dashboard.offers.app', 'application')
+    ranges_app = get_class_lazily('dashboard.ranges.app', 'application')
+    reviews_app = get_class_lazily('dashboard.reviews.app', 'application')
+    vouchers_app = get_class_lazily('dashboard.vouchers.app', 'application')
+    comms_app = get_class_lazily('dashboard.communications.app', 'application')
+    shipping_app = get_class_lazily('dashboard.shipping.app', 'application')
 
     def get_urls(self):
+        # The sub-apps are only imported and their URLs only built when a URL
+        # under their prefix is first resolved
         urls = [
             url(r'^$', self.index_view.as_view(), name='index'),
-            url(r'^catalogue/', include(self.catalogue_app.urls)),
-            url(r'^reports/', include(self.reports_app.urls)),
-            url(r'^orders/', include(self.orders_app.urls)),
-            url(r'^users/', include(self.users_app.urls)),
-            url(r'^content-blocks/', include(self.promotions_app.urls)),
-            url(r'^pages/', include(self.pages_app.urls)),
-            url(r'^partners/', include(self.partners_app.urls)),
-            url(r'^offers/', include(self.offers_app.urls)),
-            url(r'^ranges/', include(self.ranges_app.urls)),
-            url(r'^reviews/', include(self.reviews_app.urls)),
-            url(r'^vouchers/', include(self.vouchers_app.urls)),
-            url(r'^comms/', include(self.comms_app.urls)),
-            url(r'^shipping/', include(self.shipping_app.urls)),
+            url(r'^catalogue/', lazy_include(self.catalogue_app)),
+            url(r'^reports/', lazy_include(self.reports_app)),
+            url(r'^orders/', lazy_include(self.orders_app)),
+            url(r'^users/', lazy_include(self.users_app)),
+            url(r'^content-blocks/', lazy_include(self.promotions_app)),
+            url(r'^pages/', lazy_include(self.pages_app)),
+            url(r'^partners/', lazy_include(self.partners_app)),
+            url(r'^offers/', lazy_include(self.offers_app)),
+            url(r'^ranges/', lazy_include(self.ranges_app)),
+            url(r'^reviews/', lazy_include(self.reviews_app)),
+            url(r'^vouchers/', lazy_include(self.vouchers_app)),
+            url(r'^comms/', lazy_include(self.comms_app)),
+            url(r'^shipping/', lazy_include(self.shipping_app)),
         ]
         return self.post_process_urls(urls)
 
@@ -10,7 +10,7 @@ from django.views import generic
 from django_tables2 import SingleTableMixin
 
 from oscar.core.loading import get_classes, get_model
-from oscar.views.generic import ObjectLookupView
+from oscar.views.generic import KeysetTablePaginationMixin, ObjectLookupView
 
 (ProductForm,
  ProductClassSelectForm,
@@ -61,7 +61,8 @@ def filter_products(queryset, user):
     return queryset.filter(stockrecords__partner__users__pk=user.pk).distinct()
 
 
-class ProductListView(SingleTableMixin, generic.TemplateView):
+class ProductListView(KeysetTablePaginationMixin, SingleTableMixin,
+                      generic.TemplateView):
     """
     Dashboard view of the product list.
     Supports the permission-based dashboard.
@@ -71,6 +72,7 @@ class ProductListView(SingleTableMixin, generic.TemplateView):
     form_class = ProductSearchForm
     productclass_form_class = ProductClassSelectForm
     table_class = ProductTable
+    table_pagination = dict(per_page=20)
     context_table_name = 'products'
 
     def get_context_data(self, **kwargs):
@@ -92,9 +94,6 @@ class ProductListView(SingleTableMixin, generic.TemplateView):
         table.caption = self.get_description(self.form)
         return table
 
-    def get_table_pagination(self):
-        return dict(per_page=20)
-
     def filter_queryset(self, queryset):
         """
         Apply any filters to restrict the products that appear on the list
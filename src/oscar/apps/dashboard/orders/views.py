@@ -8,7 +8,8 @@ from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import reverse
 from django.db.models import Q, Count, Sum, fields
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.db.models.query import QuerySet
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import DetailView, FormView, ListView, UpdateView
@@ -16,10 +17,11 @@ from django.views.generic import DetailView, FormView, ListView, UpdateView
 from oscar.apps.order import exceptions as order_exceptions
 from oscar.apps.payment.exceptions import PaymentError
 from oscar.core.compat import UnicodeCSVWriter
-from oscar.core.loading import get_class, get_model
-from oscar.core.utils import datetime_combine, format_datetime
+from oscar.core.loading import get_class, get_classes, get_model
+from oscar.core.timeseries import aggregate_by_period
+from oscar.core.utils import chunked, datetime_combine, format_datetime
 from oscar.views import sort_queryset
-from oscar.views.generic import BulkEditMixin
+from oscar.views.generic import BulkEditMixin, KeysetPaginationMixin
 
 Partner = get_model('partner', 'Partner')
 Transaction = get_model('payment', 'Transaction')
@@ -28,15 +30,20 @@ Order = get_model('order', 'Order')
 OrderNote = get_model('order', 'OrderNote')
 ShippingAddress = get_model('order', 'ShippingAddress')
 Line = get_model('order', 'Line')
+HourlyOrderRecord = get_model('analytics', 'HourlyOrderRecord')
 ShippingEventType = get_model('order', 'ShippingEventType')
 PaymentEventType = get_model('order', 'PaymentEventType')
 EventHandler = get_class('order.processing', 'EventHandler')
+CSVBuffer = get_class('dashboard.reports.reports', 'CSVBuffer')
 OrderStatsForm = get_class('dashboard.orders.forms', 'OrderStatsForm')
 OrderSearchForm = get_class('dashboard.orders.forms', 'OrderSearchForm')
 OrderNoteForm = get_class('dashboard.orders.forms', 'OrderNoteForm')
 ShippingAddressForm = get_class(
     'dashboard.orders.forms', 'ShippingAddressForm')
 OrderStatusForm = get_class('dashboard.orders.forms', 'OrderStatusForm')
+get_hour_filters, get_order_stats, get_order_status_breakdown = get_classes(
+    'analytics.stats', ['get_hour_filters', 'get_order_stats',
+                        'get_order_status_breakdown'])
 
 
 def queryset_orders_for_user(user):
@@ -72,6 +79,8 @@ class OrderStatsView(FormView):
     """
     template_name = 'dashboard/orders/statistics.html'
     form_class = OrderStatsForm
+    # The longest date range that is broken down by day
+    max_days_in_breakdown = 92
 
     def get(self, request, *args, **kwargs):
         return self.post(request, *args, **kwargs)
@@ -91,9 +100,47 @@ class OrderStatsView(FormView):
         filters = kwargs.get('filters', {})
         ctx.update(self.get_stats(filters))
         ctx['title'] = kwargs['form'].get_filter_description()
+        ctx['daily_breakdown'] = self.get_daily_breakdown(kwargs['form'])
         return ctx
 
+    def get_daily_breakdown(self, form):
+        """
+        Return the number of orders and the revenue of every day of the
+        selected date range, or None if no (or too long a) range is selected
+        """
+        if not form.is_valid():
+            return None
+        date_from = form.cleaned_data['date_from']
+        date_to = form.cleaned_data['date_to']
+        if not (date_from and date_to) or date_to < date_from or (
+                (date_to - date_from).days >= self.max_days_in_breakdown):
+            return None
+
+        user = self.request.user
+        if settings.OSCAR_DASHBOARD_USE_STATS_RECORDS and user.is_staff:
+            # See analytics.stats
+            queryset, field_name = HourlyOrderRecord.objects.all(), 'hour'
+            num_orders = Sum('num_orders')
+        else:
+            queryset, field_name = Order._default_manager.all(), 'date_placed'
+            if not user.is_staff:
+                queryset = queryset.filter(
+                    pk__in=queryset_orders_for_user(user).values('pk'))
+            num_orders = Count('id')
+        return aggregate_by_period(
+            queryset, field_name,
+            datetime_combine(date_from, datetime.time.min),
+            datetime_combine(date_to + datetime.timedelta(days=1),
+                             datetime.time.min),
+            period='day', default={'num_orders': 0, 'revenue': D('0.00')},
+            num_orders=num_orders, revenue=Sum('total_incl_tax'))
+
     def get_stats(self, filters):
+        if (settings.OSCAR_DASHBOARD_USE_STATS_RECORDS
+                and self.request.user.is_staff):
+            hour_filters = get_hour_filters(filters)
+            if hour_filters is not None:
+                return self.get_recorded_stats(hour_filters)
         orders = queryset_orders_for_user(self.request.user).filter(**filters)
         stats = {
             'total_orders': orders.count(),
@@ -105,8 +152,18 @@ class OrderStatsView(FormView):
         }
         return stats
 
+    def get_recorded_stats(self, hour_filters):
+        """
+        Read the statistics of all orders from the hourly order records (see
+        ``analytics.stats``), whose hours are filtered by *hour_filters*
+        """
+        stats = get_order_stats(**hour_filters)
+        stats['order_status_breakdown'] = get_order_status_breakdown(
+            **hour_filters)
+        return stats
+
 
-class OrderListView(BulkEditMixin, ListView):
+class OrderListView(BulkEditMixin, KeysetPaginationMixin, ListView):
     """
     Dashboard view for a list of orders.
     Supports the permission-based dashboard.
@@ -369,10 +426,23 @@ class OrderListView(BulkEditMixin, ListView):
         return 'orders.csv'
 
     def download_selected_orders(self, request, orders):
-        response = HttpResponse(content_type='text/csv')
+        if isinstance(orders, QuerySet):
+            orders = orders.select_related(
+                'shipping_address', 'billing_address').prefetch_related(
+                    'lines')
+        response = StreamingHttpResponse(
+            self.generate_csv(orders), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename=%s' \
             % self.get_download_filename(request)
-        writer = UnicodeCSVWriter(open_file=response)
+        return response
+
+    def generate_csv(self, orders):
+        """
+        Yield the CSV of the orders in chunks, fetching the orders in chunks
+        too
+        """
+        buffer = CSVBuffer()
+        writer = UnicodeCSVWriter(open_file=buffer)
 
         meta_data = (('number', _('Order number')),
                      ('value', _('Order value')),
@@ -388,24 +458,27 @@ class OrderListView(BulkEditMixin, ListView):
             columns[k] = v
 
         writer.writerow(columns.values())
-        for order in orders:
-            row = columns.copy()
-            row['number'] = order.number
-            row['value'] = order.total_incl_tax
-            row['date'] = format_datetime(order.date_placed, 'DATETIME_FORMAT')
-            row['num_items'] = order.num_items
-            row['status'] = order.status
-            row['customer'] = order.email
-            if order.shipping_address:
-                row['shipping_address_name'] = order.shipping_address.name
-            else:
-                row['shipping_address_name'] = ''
-            if order.billing_address:
-                row['billing_address_name'] = order.billing_address.name
-            else:
-                row['billing_address_name'] = ''
-            writer.writerow(row.values())
-        return response
+        yield buffer.pop()
+        for chunk in chunked(orders):
+            for order in chunk:
+                row = columns.copy()
+                row['number'] = order.number
+                row['value'] = order.total_incl_tax
+                row['date'] = format_datetime(
+                    order.date_placed, 'DATETIME_FORMAT')
+                row['num_items'] = order.num_items
+                row['status'] = order.status
+                row['customer'] = order.email
+                if order.shipping_address:
+                    row['shipping_address_name'] = order.shipping_address.name
+                else:
+                    row['shipping_address_name'] = ''
+                if order.billing_address:
+                    row['billing_address_name'] = order.billing_address.name
+                else:
+                    row['billing_address_name'] = ''
+                writer.writerow(row.values())
+            yield buffer.pop()
 
     def change_order_statuses(self, request, orders):
         for order in orders:
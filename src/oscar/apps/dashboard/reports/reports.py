@@ -1,7 +1,7 @@
 from datetime import datetime, time
 
-from django.http import HttpResponse
-from django.utils import timezone
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import six, timezone
 from django.utils.translation import ugettext_lazy as _
 
 from oscar.core import utils
@@ -98,16 +98,73 @@ class ReportFormatter(object):
         return self.filename_template
 
 
+class CSVBuffer(object):
+    """
+    File-like object that collects the output of a CSV writer, so that it can
+    be streamed
+    """
+
+    def __init__(self):
+        self.data = []
+
+    def write(self, value):
+        self.data.append(value)
+
+    def pop(self):
+        """
+        Return and clear the collected output
+        """
+        data = ''.join(self.data)
+        self.data = []
+        return data
+
+
 class ReportCSVFormatter(ReportFormatter):
+    """
+    Formatters that implement ``get_header_row`` and ``get_row`` stream their
+    CSV, fetching the objects in chunks of ``chunk_size``. Formatters that
+    override ``generate_csv`` instead build the whole CSV in memory.
+    """
+    chunk_size = 500
 
     def get_csv_writer(self, file_handle, **kwargs):
         return UnicodeCSVWriter(open_file=file_handle, **kwargs)
 
+    def get_header_row(self):
+        raise NotImplementedError
+
+    def get_row(self, obj):
+        raise NotImplementedError
+
+    def generate_csv(self, response, objects):
+        writer = self.get_csv_writer(response)
+        writer.writerow(self.get_header_row())
+        for obj in objects:
+            writer.writerow(self.get_row(obj))
+
+    def stream_csv(self, objects):
+        buffer = CSVBuffer()
+        writer = self.get_csv_writer(buffer)
+        writer.writerow(self.get_header_row())
+        yield buffer.pop()
+        for chunk in utils.chunked(objects, self.chunk_size):
+            for obj in chunk:
+                writer.writerow(self.get_row(obj))
+            yield buffer.pop()
+
+    def is_streamed(self):
+        return (six.get_unbound_function(type(self).generate_csv) is
+                six.get_unbound_function(ReportCSVFormatter.generate_csv))
+
     def generate_response(self, objects, **kwargs):
-        response = HttpResponse(content_type='text/csv')
+        if self.is_streamed():
+            response = StreamingHttpResponse(
+                self.stream_csv(objects), content_type='text/csv')
+        else:
+            response = HttpResponse(content_type='text/csv')
+            self.generate_csv(response, objects)
         response['Content-Disposition'] = 'attachment; filename=%s' \
             % self.filename(**kwargs)
-        self.generate_csv(response, objects)
         return response
 
 
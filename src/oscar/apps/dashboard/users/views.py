@@ -13,7 +13,7 @@ from django_tables2 import SingleTableMixin
 from oscar.apps.customer.utils import normalise_email
 from oscar.core.compat import get_user_model
 from oscar.core.loading import get_class, get_classes, get_model
-from oscar.views.generic import BulkEditMixin
+from oscar.views.generic import BulkEditMixin, KeysetTablePaginationMixin
 
 UserSearchForm, ProductAlertSearchForm, ProductAlertUpdateForm = get_classes(
     'dashboard.users.forms', ('UserSearchForm', 'ProductAlertSearchForm',
@@ -24,7 +24,8 @@ ProductAlert = get_model('customer', 'ProductAlert')
 User = get_user_model()
 
 
-class IndexView(BulkEditMixin, SingleTableMixin, FormMixin, TemplateView):
+class IndexView(BulkEditMixin, KeysetTablePaginationMixin, SingleTableMixin,
+                FormMixin, TemplateView):
     template_name = 'dashboard/users/index.html'
     table_pagination = True
     model = User
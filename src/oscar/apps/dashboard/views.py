@@ -2,13 +2,15 @@ from datetime import timedelta
 from decimal import Decimal as D
 from decimal import ROUND_UP
 
+from django.conf import settings
 from django.db.models import Avg, Count, Sum
 from django.utils.timezone import now
 from django.views.generic import TemplateView
 
 from oscar.apps.promotions.models import AbstractPromotion
 from oscar.core.compat import get_user_model
-from oscar.core.loading import get_model
+from oscar.core.loading import get_classes, get_model
+from oscar.core.timeseries import aggregate_by_period
 
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Voucher = get_model('voucher', 'Voucher')
@@ -17,7 +19,12 @@ StockAlert = get_model('partner', 'StockAlert')
 Product = get_model('catalogue', 'Product')
 Order = get_model('order', 'Order')
 Line = get_model('order', 'Line')
+HourlyOrderRecord = get_model('analytics', 'HourlyOrderRecord')
 User = get_user_model()
+get_hour, get_order_stats, get_order_status_breakdown, get_customer_count = (
+    get_classes('analytics.stats', [
+        'get_hour', 'get_order_stats', 'get_order_status_breakdown',
+        'get_customer_count']))
 
 
 class IndexView(TemplateView):
@@ -92,24 +99,18 @@ class IndexView(TemplateView):
         when generating the y-axis labels (default=10).
         """
         # Get datetime for 24 hours agao
-        time_now = now().replace(minute=0, second=0)
+        time_now = now().replace(minute=0, second=0, microsecond=0)
         start_time = time_now - timedelta(hours=hours - 1)
 
-        orders_last_day = Order.objects.filter(date_placed__gt=start_time)
-
+        hourly_totals = self.get_hourly_totals(start_time, hours)
         order_total_hourly = []
-        for hour in range(0, hours, 2):
-            end_time = start_time + timedelta(hours=2)
-            hourly_orders = orders_last_day.filter(date_placed__gt=start_time,
-                                                   date_placed__lt=end_time)
-            total = hourly_orders.aggregate(
-                Sum('total_incl_tax')
-            )['total_incl_tax__sum'] or D('0.0')
+        for i in range(0, len(hourly_totals), 2):
+            chunk = hourly_totals[i:i + 2]
             order_total_hourly.append({
-                'end_time': end_time,
-                'total_incl_tax': total
+                'end_time': chunk[-1]['end'],
+                'total_incl_tax': sum(
+                    (period['total_incl_tax'] for period in chunk), D('0.0'))
             })
-            start_time = end_time
 
         max_value = max([x['total_incl_tax'] for x in order_total_hourly])
         divisor = 1
@@ -138,18 +139,32 @@ class IndexView(TemplateView):
         }
         return ctx
 
-    def get_stats(self):
+    def get_hourly_totals(self, start_time, hours):
+        """
+        Return the revenue of every hour of the report, with a single query
+        """
+        if settings.OSCAR_DASHBOARD_USE_STATS_RECORDS:
+            # See analytics.stats
+            queryset, field_name = HourlyOrderRecord.objects.all(), 'hour'
+        else:
+            queryset, field_name = Order.objects.all(), 'date_placed'
+        return aggregate_by_period(
+            queryset, field_name, start_time,
+            start_time + timedelta(hours=hours), default=D('0.0'),
+            total_incl_tax=Sum('total_incl_tax'))
+
+    def get_order_stats(self):
+        """
+        Return the statistics of the orders and customers
+        """
         datetime_24hrs_ago = now() - timedelta(hours=24)
 
         orders = Order.objects.filter()
         orders_last_day = orders.filter(date_placed__gt=datetime_24hrs_ago)
 
-        open_alerts = StockAlert.objects.filter(status=StockAlert.OPEN)
-        closed_alerts = StockAlert.objects.filter(status=StockAlert.CLOSED)
-
         total_lines_last_day = Line.objects.filter(
             order__in=orders_last_day).count()
-        stats = {
+        return {
             'total_orders_last_day': orders_last_day.count(),
             'total_lines_last_day': total_lines_last_day,
 
@@ -161,10 +176,64 @@ class IndexView(TemplateView):
                 Sum('total_incl_tax')
             )['total_incl_tax__sum'] or D('0.00'),
 
-            'hourly_report_dict': self.get_hourly_report(hours=24),
             'total_customers_last_day': User.objects.filter(
                 date_joined__gt=datetime_24hrs_ago,
             ).count(),
+            'total_customers': User.objects.count(),
+
+            'total_orders': orders.count(),
+            'total_lines': Line.objects.filter(order__in=orders).count(),
+            'total_revenue': orders.aggregate(
+                Sum('total_incl_tax')
+            )['total_incl_tax__sum'] or D('0.00'),
+
+            'order_status_breakdown': orders.order_by(
+                'status'
+            ).values('status').annotate(freq=Count('id'))
+        }
+
+    def get_recorded_order_stats(self):
+        """
+        Like ``get_order_stats``, but reads the statistics from the hourly
+        order and customer records (see ``analytics.stats``). The last day
+        consists of the current hour and the 23 hours before it.
+        """
+        start_hour = get_hour(now()) - timedelta(hours=23)
+        last_day = get_order_stats(hour__gte=start_hour)
+        all_time = get_order_stats()
+        average_order_costs = D('0.00')
+        if last_day['total_orders']:
+            average_order_costs = (
+                last_day['total_revenue'] / last_day['total_orders'])
+        return {
+            'total_orders_last_day': last_day['total_orders'],
+            'total_lines_last_day': last_day['total_lines'],
+            'average_order_costs': average_order_costs,
+            'total_revenue_last_day': last_day['total_revenue'],
+
+            'total_customers_last_day': get_customer_count(
+                hour__gte=start_hour),
+            'total_customers': get_customer_count(),
+
+            'total_orders': all_time['total_orders'],
+            'total_lines': all_time['total_lines'],
+            'total_revenue': all_time['total_revenue'],
+
+            'order_status_breakdown': get_order_status_breakdown(),
+        }
+
+    def get_stats(self):
+        datetime_24hrs_ago = now() - timedelta(hours=24)
+
+        open_alerts = StockAlert.objects.filter(status=StockAlert.OPEN)
+        closed_alerts = StockAlert.objects.filter(status=StockAlert.CLOSED)
+
+        if settings.OSCAR_DASHBOARD_USE_STATS_RECORDS:
+            stats = self.get_recorded_order_stats()
+        else:
+            stats = self.get_order_stats()
+        stats.update({
+            'hourly_report_dict': self.get_hourly_report(hours=24),
 
             'total_open_baskets_last_day': self.get_open_baskets({
                 'date_created__gt': datetime_24hrs_ago
@@ -178,16 +247,6 @@ class IndexView(TemplateView):
             'total_vouchers': self.get_active_vouchers().count(),
             'total_promotions': self.get_number_of_promotions(),
 
-            'total_customers': User.objects.count(),
             'total_open_baskets': self.get_open_baskets().count(),
-            'total_orders': orders.count(),
-            'total_lines': Line.objects.filter(order__in=orders).count(),
-            'total_revenue': orders.aggregate(
-                Sum('total_incl_tax')
-            )['total_incl_tax__sum'] or D('0.00'),
-
-            'order_status_breakdown': orders.order_by(
-                'status'
-            ).values('status').annotate(freq=Count('id'))
-        }
+        })
         return stats
@@ -7,6 +7,7 @@ from decimal import ROUND_DOWN
 
 from django.conf import settings
 from django.core import exceptions
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.db import models
 from django.db.models.query import Q
@@ -597,24 +598,34 @@ class AbstractBenefit(models.Model):
         """
         if range is None:
             range = self.range
-        line_tuples = []
-        for line in basket.all_lines():
-            product = line.product
 
-            if (not range.contains(product) or
-                    not self.can_apply_benefit(line)):
-                continue
-
-            price = utils.unit_price(offer, line)
-            if not price:
-                # Avoid zero price products
-                continue
-            if line.quantity_without_discount == 0:
-                continue
-            line_tuples.append((price, line))
-
-        # We sort lines to be cheapest first to ensure consistent applications
-        return sorted(line_tuples, key=operator.itemgetter(0))
+        def get_line_tuples():
+            line_tuples = []
+            for line in basket.all_lines():
+                if (not utils.line_in_range(line, range) or
+                        not self.can_apply_benefit(line)):
+                    continue
+
+                price = utils.unit_price(offer, line)
+                if not price:
+                    # Avoid zero price products
+                    continue
+                line_tuples.append((price, line))
+
+            # We sort lines to be cheapest first to ensure consistent
+            # applications
+            return sorted(line_tuples, key=operator.itemgetter(0))
+
+        # The prices and eligibility of the lines don't change while the
+        # basket is priced, so the sorted lines are shared between all
+        # offers and applications with this benefit class and range.
+        if range.pk is None:
+            line_tuples = get_line_tuples()
+        else:
+            line_tuples = utils.memoise_for_lines(
+                basket, ('benefit', type(self), range.pk), get_line_tuples)
+        return [(price, line) for price, line in line_tuples
+                if line.quantity_without_discount > 0]
 
     def shipping_discount(self, charge):
         return D('0.00')
@@ -730,26 +741,32 @@ class AbstractCondition(models.Model):
         if not line.stockrecord_id:
             return False
         product = line.product
-        return (self.range.contains_product(product)
+        return (utils.line_in_range(line, self.range)
                 and product.get_is_discountable())
 
     def get_applicable_lines(self, offer, basket, most_expensive_first=True):
         """
         Return line data for the lines that can be consumed by this condition
         """
-        line_tuples = []
-        for line in basket.all_lines():
-            if not self.can_apply_condition(line):
-                continue
-
-            price = utils.unit_price(offer, line)
-            if not price:
-                continue
-            line_tuples.append((price, line))
-        key = operator.itemgetter(0)
-        if most_expensive_first:
-            return sorted(line_tuples, reverse=True, key=key)
-        return sorted(line_tuples, key=key)
+        def get_line_tuples():
+            line_tuples = []
+            for line in basket.all_lines():
+                if not self.can_apply_condition(line):
+                    continue
+
+                price = utils.unit_price(offer, line)
+                if not price:
+                    continue
+                line_tuples.append((price, line))
+            return sorted(line_tuples, reverse=most_expensive_first,
+                          key=operator.itemgetter(0))
+
+        if self.range.pk is None:
+            return get_line_tuples()
+        # Shared between all offers and applications with this condition
+        # class and range while the basket is priced
+        key = ('condition', type(self), self.range.pk, most_expensive_first)
+        return list(utils.memoise_for_lines(basket, key, get_line_tuples))
 
 
 @python_2_unicode_compatible
@@ -797,6 +814,7 @@ class AbstractRange(models.Model):
     __excluded_product_ids = None
     __class_ids = None
     __category_ids = None
+    __product_index = None
 
     objects = models.Manager()
     browsable = BrowsableRangeManager()
@@ -857,6 +875,9 @@ class AbstractRange(models.Model):
         if self.proxy:
             return self.proxy.contains_product(product)
 
+        if self.uses_product_index:
+            return self._index_contains_product(product)
+
         excluded_product_ids = self._excluded_product_ids()
         if product.id in excluded_product_ids:
             return False
@@ -930,6 +951,100 @@ class AbstractRange(models.Model):
 
         return self.__category_ids
 
+    # Product index
+    #
+    # If OSCAR_RANGE_INDEX_CACHE_TIMEOUT is set, the IDs of the products in
+    # the range are materialised and stored in the cache backend, which turns
+    # contains_product into a set lookup.  The index only holds parent and
+    # standalone products (plus any child products that were added
+    # explicitly), as child products inherit their parent's membership.
+    # It is kept up-to-date by the receivers in oscar.apps.offer.receivers.
+
+    @property
+    def uses_product_index(self):
+        return bool(
+            self.id and
+            getattr(settings, 'OSCAR_RANGE_INDEX_CACHE_TIMEOUT', 0))
+
+    @property
+    def product_index_cache_key(self):
+        # The creation date guards against IDs being reused for new ranges
+        return 'oscar_range_index_%s_%s' % (
+            self.id, self.date_created.strftime('%Y%m%d%H%M%S%f'))
+
+    def _index_contains_product(self, product):
+        included_ids, excluded_ids = self.get_product_index()
+        product_ids = [product.id]
+        if product.is_child:
+            product_ids.append(product.parent_id)
+        if any(pk in excluded_ids for pk in product_ids):
+            return False
+        if self.includes_all_products:
+            return True
+        return any(pk in included_ids for pk in product_ids)
+
+    def get_product_index(self):
+        """
+        Return a tuple of the sets of included and excluded product IDs
+        """
+        if self.__product_index is None:
+            index = cache.get(self.product_index_cache_key)
+            if index is None:
+                index = self.build_product_index()
+                self._store_product_index(index)
+            self.__product_index = index
+        return self.__product_index
+
+    def build_product_index(self):
+        excluded_ids = set(
+            self.excluded_products.values_list('pk', flat=True))
+        if self.includes_all_products:
+            return set(), excluded_ids
+        return self._query_included_product_ids(), excluded_ids
+
+    def update_product_index(self, product_ids):
+        """
+        Re-check the membership of the passed products and update the stored
+        index accordingly.  Does nothing if no index is stored.
+        """
+        index = cache.get(self.product_index_cache_key)
+        if index is None:
+            return
+        included_ids, excluded_ids = index
+        if not self.includes_all_products:
+            product_ids = set(product_ids)
+            found_ids = self._query_included_product_ids(product_ids)
+            included_ids = (included_ids - product_ids) | found_ids
+        self._store_product_index((included_ids, excluded_ids))
+    update_product_index.alters_data = True
+
+    def invalidate_product_index(self):
+        cache.delete(self.product_index_cache_key)
+        self.__product_index = None
+    invalidate_product_index.alters_data = True
+
+    def _store_product_index(self, index):
+        timeout = getattr(settings, 'OSCAR_RANGE_INDEX_CACHE_TIMEOUT', 0)
+        cache.set(self.product_index_cache_key, index, timeout)
+        self.__product_index = index
+
+    def _query_included_product_ids(self, product_ids=None):
+        """
+        Return the IDs of the products that are included in this range,
+        optionally restricted to the passed IDs.  Exclusions are ignored.
+        """
+        Product = get_model("catalogue", "Product")
+        # Child products are only matched by their parent's class and
+        # categories
+        queryset = Product.objects.filter(
+            Q(id__in=self.included_products.values('pk')) |
+            Q(parent=None, product_class_id__in=self._class_ids()) |
+            Q(parent=None,
+              productcategory__category_id__in=self._category_ids()))
+        if product_ids is not None:
+            queryset = queryset.filter(id__in=product_ids)
+        return set(queryset.values_list('pk', flat=True))
+
     def num_products(self):
         # Delegate to a proxy class if one is provided
         if self.proxy:
@@ -1,10 +1,14 @@
+import hashlib
 import logging
 from itertools import chain
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils.timezone import now
 
 from oscar.apps.offer import results
+from oscar.apps.offer.cache import get_offer_version, site_offer_cache
 from oscar.core.loading import get_model
 
 logger = logging.getLogger('oscar.offers')
@@ -22,9 +26,24 @@ class Applicator(object):
 
         The request is passed too as sometimes the available offers
         are dependent on the user (eg session-based offers).
+
+        If OSCAR_BASKET_PRICING_CACHE_TIMEOUT is set, the resulting offer
+        applications and line discounts are cached (see ``get_cache_key``), so
+        an unchanged basket isn't priced again.
         """
+        timeout = getattr(settings, 'OSCAR_BASKET_PRICING_CACHE_TIMEOUT', 0)
+        if not timeout or not basket.id:
+            offers = self.get_offers(basket, user, request)
+            self.apply_offers(basket, offers)
+            return
+
+        cache_key = self.get_cache_key(basket, user, request)
+        state = cache.get(cache_key)
+        if state is not None and self.restore_state(basket, state):
+            return
         offers = self.get_offers(basket, user, request)
         self.apply_offers(basket, offers)
+        cache.set(cache_key, self.get_state(basket), timeout)
 
     def apply_offers(self, basket, offers):
         applications = results.OfferApplications()
@@ -46,6 +65,83 @@ class Applicator(object):
         # rendered in templates
         basket.offer_applications = applications
 
+    def get_cache_key(self, basket, user=None, request=None):
+        """
+        Return the key under which the result of pricing the basket is
+        cached.
+
+        The key is built from the basket's content fingerprint, the user and
+        the version of the offer set. Extend this method if your offers depend
+        on anything else, eg the session.
+        """
+        user_id = user.pk if user and user.is_authenticated() else None
+        key = '%s|%s|%s|%s' % (
+            get_offer_version(), basket.id, user_id,
+            basket.get_content_fingerprint())
+        return 'oscar_basket_pricing_%s' % hashlib.sha1(
+            key.encode('utf8')).hexdigest()
+
+    def get_state(self, basket):
+        """
+        Return the offer applications and line discounts of the basket in a
+        form that can be cached
+        """
+        lines = dict(
+            (line.id, (line._discount_excl_tax, line._discount_incl_tax,
+                       line._affected_quantity))
+            for line in basket.all_lines())
+        applications = [
+            (offer_id, application['voucher'].id
+             if application['voucher'] else None,
+             application['result'], application['name'],
+             application['description'], application['freq'],
+             application['discount'])
+            for offer_id, application in
+            basket.offer_applications.applications.items()]
+        return lines, applications
+
+    def restore_state(self, basket, state):
+        """
+        Restore the offer applications and line discounts from a cached state.
+
+        Returns False if the state doesn't match the basket anymore.
+        """
+        ConditionalOffer = get_model('offer', 'ConditionalOffer')
+        Voucher = get_model('voucher', 'Voucher')
+        lines, applications = state
+        basket_lines = basket.all_lines()
+        if set(lines) != set(line.id for line in basket_lines):
+            return False
+
+        offers = ConditionalOffer.objects.in_bulk(
+            [application[0] for application in applications])
+        voucher_ids = [application[1] for application in applications
+                       if application[1] is not None]
+        vouchers = Voucher.objects.in_bulk(voucher_ids) if voucher_ids else {}
+        offer_applications = results.OfferApplications()
+        for (offer_id, voucher_id, result, name, description, freq,
+                discount) in applications:
+            offer = offers.get(offer_id)
+            if offer is None or (
+                    voucher_id is not None and voucher_id not in vouchers):
+                return False
+            if voucher_id is not None:
+                offer.set_voucher(vouchers[voucher_id])
+            offer_applications.applications[offer_id] = {
+                'offer': offer,
+                'result': result,
+                'name': name,
+                'description': description,
+                'voucher': offer.get_voucher(),
+                'freq': freq,
+                'discount': discount}
+
+        for line in basket_lines:
+            (line._discount_excl_tax, line._discount_incl_tax,
+             line._affected_quantity) = lines[line.id]
+        basket.offer_applications = offer_applications
+        return True
+
     def get_offers(self, basket, user=None, request=None):
         """
         Return all offers to apply to the basket.
@@ -67,6 +163,9 @@ class Applicator(object):
         """
         Return site offers that are available to all users
         """
+        if getattr(settings, 'OSCAR_SITE_OFFER_CACHE_TIMEOUT', 0):
+            return site_offer_cache.get_available_offers()
+
         cutoff = now()
         date_based = Q(
             Q(start_datetime__lte=cutoff),
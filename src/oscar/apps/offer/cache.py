@@ -0,0 +1,130 @@
+import copy
+import time
+
+from django.conf import settings
+from django.utils.timezone import now
+
+from oscar.core.cache import bump_cache_version, get_cache_version
+from oscar.core.loading import get_model
+
+OFFER_VERSION_CACHE_KEY = 'oscar_offer_version'
+
+
+def get_offer_version():
+    """
+    Return the current version of the offer set.
+    """
+    return get_cache_version(OFFER_VERSION_CACHE_KEY)
+
+
+def bump_offer_version():
+    """
+    Invalidate all cached offer data
+    """
+    bump_cache_version(OFFER_VERSION_CACHE_KEY)
+
+
+def is_in_date_window(offer, test_date):
+    """
+    Test whether the offer's date window contains the test date.
+
+    This is an in-memory version of the date filter that
+    Applicator.get_site_offers applies to the database query.
+    """
+    start, end = offer.start_datetime, offer.end_datetime
+    if start is None and end is None:
+        return True
+    return (start is not None and start <= test_date and
+            (end is None or end >= test_date))
+
+
+class SiteOfferCache(object):
+    """
+    Process-local cache of the open site offers.
+
+    Offers are loaded together with their conditions, benefits and ranges, and
+    conditions and benefits are resolved to their proxy classes up front. The
+    loaded offers are only used as templates: every lookup returns shallow
+    copies, as condition proxies memoise basket-specific data on themselves.
+    Ranges are shared between lookups, which lets them keep their memoised
+    product and class IDs for as long as the offer set doesn't change.
+
+    The cache is tied to the offer version (see ``get_offer_version``), which
+    is bumped whenever an offer, condition, benefit or range changes. As a
+    safety net, entries also expire after ``OSCAR_SITE_OFFER_CACHE_TIMEOUT``
+    seconds.
+    """
+
+    def __init__(self):
+        # (version, expiry timestamp, offers)
+        self._entry = None
+
+    def clear(self):
+        self._entry = None
+
+    def get_offers(self):
+        """
+        Return all open site offers, regardless of their date window.
+        """
+        version = get_offer_version()
+        entry = self._entry
+        if entry is None or entry[0] != version or entry[1] < time.time():
+            # Note that the version is read before loading the offers, so an
+            # invalidation that happens while loading causes a reload on the
+            # next lookup.
+            timeout = getattr(settings, 'OSCAR_SITE_OFFER_CACHE_TIMEOUT', 0)
+            entry = (version, time.time() + timeout, self.load_offers())
+            self._entry = entry
+        return entry[2]
+
+    def get_available_offers(self, test_date=None):
+        """
+        Return copies of the open site offers that are within their date
+        window.
+        """
+        if test_date is None:
+            test_date = now()
+        return [self.copy_offer(offer) for offer in self.get_offers()
+                if is_in_date_window(offer, test_date)]
+
+    def load_offers(self):
+        ConditionalOffer = get_model('offer', 'ConditionalOffer')
+        Range = get_model('offer', 'Range')
+
+        offers = list(ConditionalOffer.objects.filter(
+            offer_type=ConditionalOffer.SITE,
+            status=ConditionalOffer.OPEN).select_related(
+                'condition', 'benefit'))
+
+        range_ids = set()
+        for offer in offers:
+            range_ids.update([offer.condition.range_id,
+                              offer.benefit.range_id])
+        range_ids.discard(None)
+        ranges = Range.objects.filter(id__in=range_ids).prefetch_related(
+            'included_categories')
+        ranges = dict((rng.id, rng) for rng in ranges)
+
+        for offer in offers:
+            offer.condition = self.resolve_proxy(offer.condition, ranges)
+            offer.benefit = self.resolve_proxy(offer.benefit, ranges)
+        return offers
+
+    def resolve_proxy(self, instance, ranges):
+        """
+        Return the proxy instance of a condition or benefit with its (shared)
+        range attached
+        """
+        proxy = instance.proxy()
+        if proxy.range_id is not None:
+            proxy.range = ranges[proxy.range_id]
+        return proxy
+
+    def copy_offer(self, offer):
+        offer = copy.copy(offer)
+        offer.condition = copy.copy(offer.condition)
+        offer.benefit = copy.copy(offer.benefit)
+        return offer
+
+
+site_offer_cache = SiteOfferCache()
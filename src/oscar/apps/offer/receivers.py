@@ -0,0 +1,116 @@
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from oscar.apps.offer.cache import bump_offer_version
+from oscar.core.loading import get_class, get_model
+
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Condition = get_model('offer', 'Condition')
+Benefit = get_model('offer', 'Benefit')
+Range = get_model('offer', 'Range')
+RangeProduct = get_model('offer', 'RangeProduct')
+Category = get_model('catalogue', 'Category')
+Product = get_model('catalogue', 'Product')
+ProductCategory = get_model('catalogue', 'ProductCategory')
+category_moved = get_class('catalogue.signals', 'category_moved')
+
+# Conditions and benefits are often saved through their proxy models, so we
+# check the sender's class hierarchy instead of connecting a receiver per
+# model.
+OFFER_MODELS = (ConditionalOffer, Condition, Benefit, Range, RangeProduct)
+RANGE_RELATIONS = (Range.excluded_products.through, Range.classes.through,
+                   Range.included_categories.through)
+
+
+def is_range_index_enabled():
+    return bool(getattr(settings, 'OSCAR_RANGE_INDEX_CACHE_TIMEOUT', 0))
+
+
+def update_range_indexes(ranges, product_ids):
+    """
+    Update the product indexes of the passed ranges for the given products
+    """
+    ranges = list(ranges)
+    for rng in ranges:
+        rng.update_product_index(product_ids)
+    if ranges:
+        # Cached site offers hold on to their ranges' indexes
+        bump_offer_version()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_offers(sender, **kwargs):
+    """
+    Invalidate the cached offer data when any part of an offer changes
+    """
+    if issubclass(sender, OFFER_MODELS):
+        bump_offer_version()
+
+
+@receiver(m2m_changed)
+def invalidate_offers_on_range_change(sender, instance, action, **kwargs):
+    if sender not in RANGE_RELATIONS or not action.startswith('post_'):
+        return
+    if is_range_index_enabled():
+        if isinstance(instance, Range):
+            ranges = [instance]
+        else:
+            # The relation was changed from the other side; we don't know
+            # which ranges were affected when it was cleared.
+            ranges = Range.objects.all()
+            if kwargs.get('pk_set'):
+                ranges = ranges.filter(pk__in=kwargs['pk_set'])
+        for rng in ranges:
+            rng.invalidate_product_index()
+    bump_offer_version()
+
+
+# Range product indexes
+
+@receiver(post_save, sender=Range)
+def invalidate_range_index(sender, instance, **kwargs):
+    if is_range_index_enabled():
+        instance.invalidate_product_index()
+
+
+@receiver(post_save, sender=RangeProduct)
+@receiver(post_delete, sender=RangeProduct)
+def update_range_index_for_range_product(sender, instance, **kwargs):
+    if is_range_index_enabled():
+        # The range might be in the process of being deleted
+        update_range_indexes(
+            Range.objects.filter(pk=instance.range_id),
+            [instance.product_id])
+
+
+@receiver(post_save, sender=ProductCategory)
+@receiver(post_delete, sender=ProductCategory)
+def update_range_indexes_for_product_category(sender, instance, **kwargs):
+    if is_range_index_enabled():
+        update_range_indexes(
+            Range.objects.filter(included_categories__isnull=False)
+                         .distinct(),
+            [instance.product_id])
+
+
+@receiver(post_save, sender=Product)
+def update_range_indexes_for_product(sender, instance, **kwargs):
+    # Only the product class can change a saved product's membership, and
+    # child products don't have their own
+    if is_range_index_enabled() and not instance.is_child:
+        update_range_indexes(
+            Range.objects.filter(classes__isnull=False).distinct(),
+            [instance.pk])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(category_moved)
+def invalidate_range_indexes_for_category(sender, **kwargs):
+    if is_range_index_enabled():
+        ranges = Range.objects.filter(included_categories__isnull=False)
+        for rng in ranges.distinct():
+            rng.invalidate_product_index()
+        bump_offer_version()
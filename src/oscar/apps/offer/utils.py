@@ -21,6 +21,43 @@ def unit_price(offer, line):
     return line.unit_effective_price
 
 
+def line_in_range(line, range):
+    """
+    Return whether the product of the basket line is in the range.
+
+    The result is memoised on the line. As the basket caches its lines until
+    its offer applications are reset, each line is checked against each range
+    only once per pricing pass, however many offers and applications use the
+    range.
+    """
+    if range.pk is None:
+        return range.contains_product(line.product)
+    try:
+        matches = line._range_matches
+    except AttributeError:
+        matches = line._range_matches = {}
+    if range.pk not in matches:
+        matches[range.pk] = range.contains_product(line.product)
+    return matches[range.pk]
+
+
+def memoise_for_lines(basket, key, func):
+    """
+    Return the result of calling ``func``, memoised for the current set of
+    basket lines.
+
+    This is used to sort the applicable lines of a range only once per pricing
+    pass. The memo is discarded when the basket reloads its lines.
+    """
+    lines = basket.all_lines()
+    memo = getattr(basket, '_lines_memo', None)
+    if memo is None or memo[0] is not lines:
+        memo = basket._lines_memo = (lines, {})
+    if key not in memo[1]:
+        memo[1][key] = func()
+    return memo[1][key]
+
+
 def load_proxy(proxy_class):
     module, classname = proxy_class.rsplit('.', 1)
     try:
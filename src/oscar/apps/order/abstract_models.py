@@ -12,12 +12,14 @@ from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import pgettext_lazy
 
 from oscar.core.compat import AUTH_USER_MODEL
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 from oscar.core.utils import get_default_currency
 from oscar.models.fields import AutoSlugField
 
 from . import exceptions
 
+order_status_changed = get_class('order.signals', 'order_status_changed')
+
 
 @python_2_unicode_compatible
 class AbstractOrder(models.Model):
@@ -127,12 +129,16 @@ class AbstractOrder(models.Model):
                 % {'new_status': new_status,
                    'number': self.number,
                    'status': self.status})
+        old_status = self.status
         self.status = new_status
         if new_status in self.cascade:
             for line in self.lines.all():
                 line.status = self.cascade[self.status]
                 line.save()
         self.save()
+        order_status_changed.send(sender=self, order=self,
+                                  old_status=old_status,
+                                  new_status=new_status)
     set_status.alters_data = True
 
     @property
@@ -15,22 +15,20 @@ Order = get_model('order', 'Order')
 class OrderReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'orders-%s-to-%s.csv'
 
-    def generate_csv(self, response, orders):
-        writer = self.get_csv_writer(response)
-        header_row = [_('Order number'),
-                      _('Name'),
-                      _('Email'),
-                      _('Total incl. tax'),
-                      _('Date placed')]
-        writer.writerow(header_row)
-        for order in orders:
-            row = [
-                order.number,
-                '-' if order.is_anonymous else order.user.get_full_name(),
-                order.email,
-                order.total_incl_tax,
-                self.format_datetime(order.date_placed)]
-            writer.writerow(row)
+    def get_header_row(self):
+        return [_('Order number'),
+                _('Name'),
+                _('Email'),
+                _('Total incl. tax'),
+                _('Date placed')]
+
+    def get_row(self, order):
+        return [
+            order.number,
+            '-' if order.is_anonymous else order.user.get_full_name(),
+            order.email,
+            order.total_incl_tax,
+            self.format_datetime(order.date_placed)]
 
     def filename(self, **kwargs):
         return self.filename_template % (
@@ -52,7 +50,7 @@ class OrderReportGenerator(ReportGenerator):
     }
 
     def generate(self):
-        qs = Order._default_manager.all()
+        qs = Order._default_manager.select_related('user')
 
         if self.start_date:
             qs = qs.filter(date_placed__gte=self.start_date)
@@ -1,3 +1,5 @@
 import django.dispatch
 
 order_placed = django.dispatch.Signal(providing_args=["order", "user"])
+order_status_changed = django.dispatch.Signal(
+    providing_args=["order", "old_status", "new_status"])
@@ -1,16 +1,23 @@
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from decimal import Decimal as D
 
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.utils.translation import ugettext_lazy as _
 
+from oscar.core.compat import prefetch_related_objects
 from oscar.core.loading import get_class, get_model
 
 from . import exceptions
 
 Order = get_model('order', 'Order')
 Line = get_model('order', 'Line')
+LinePrice = get_model('order', 'LinePrice')
+LineAttribute = get_model('order', 'LineAttribute')
 OrderDiscount = get_model('order', 'OrderDiscount')
+StockAllocator = get_class('partner.allocation', 'StockAllocator')
 order_placed = get_class('order.signals', 'order_placed')
 
 
@@ -32,8 +39,31 @@ class OrderNumberGenerator(object):
 class OrderCreator(object):
     """
     Places the order by writing out the various models
+
+    If OSCAR_BULK_ORDER_PLACEMENT is set, the lines, line prices, line
+    attributes and discounts of the order are written with bulk inserts and
+    stock is allocated with a few UPDATEs for all lines. This skips
+    ``create_line_models``, ``create_line_price_models``,
+    ``create_line_attributes`` and ``create_discount_model``, so extend their
+    ``get_*`` counterparts instead.
+
+    After an order has been placed, ``timings`` maps the phases of placing it
+    to the seconds they took.
     """
 
+    def __init__(self):
+        self.timings = OrderedDict()
+
+    @contextmanager
+    def timed(self, phase):
+        """
+        Record the time spent in the wrapped block
+        """
+        start = time.time()
+        yield
+        self.timings[phase] = self.timings.get(phase, 0) + (
+            time.time() - start)
+
     def place_order(self, basket, total,  # noqa (too complex (12))
                     shipping_method, shipping_charge, user=None,
                     shipping_address=None, billing_address=None,
@@ -57,39 +87,64 @@ class OrderCreator(object):
             raise ValueError(_("There is already an order with number %s")
                              % order_number)
 
+        bulk = getattr(settings, 'OSCAR_BULK_ORDER_PLACEMENT', False)
+        self.timings = OrderedDict()
+
         # Ok - everything seems to be in order, let's place the order
-        order = self.create_order_model(
-            user, basket, shipping_address, shipping_method, shipping_charge,
-            billing_address, total, order_number, status, **kwargs)
-        for line in basket.all_lines():
-            self.create_line_models(order, line)
-            self.update_stock_records(line)
+        with self.timed('order'):
+            order = self.create_order_model(
+                user, basket, shipping_address, shipping_method,
+                shipping_charge, billing_address, total, order_number, status,
+                **kwargs)
+        if bulk:
+            with self.timed('lines'):
+                self.create_line_models_in_bulk(order, basket.all_lines())
+            with self.timed('stock'):
+                self.update_stock_records_in_bulk(basket.all_lines())
+        else:
+            for line in basket.all_lines():
+                with self.timed('lines'):
+                    self.create_line_models(order, line)
+                with self.timed('stock'):
+                    self.update_stock_records(line)
+        with self.timed('stock'):
+            # Stock reserved for the basket is now allocated to the order
+            self.release_stock_reservations(basket)
 
         # Record any discounts associated with this order
-        for application in basket.offer_applications:
-            # Trigger any deferred benefits from offers and capture the
-            # resulting message
-            application['message'] \
-                = application['offer'].apply_deferred_benefit(basket, order,
-                                                              application)
-            # Record offer application results
-            if application['result'].affects_shipping:
-                # Skip zero shipping discounts
-                shipping_discount = shipping_method.discount(basket)
-                if shipping_discount <= D('0.00'):
-                    continue
-                # If a shipping offer, we need to grab the actual discount off
-                # the shipping method instance, which should be wrapped in an
-                # OfferDiscount instance.
-                application['discount'] = shipping_discount
-            self.create_discount_model(order, application)
-            self.record_discount(application)
-
-        for voucher in basket.vouchers.all():
-            self.record_voucher_usage(order, voucher, user)
+        order_discounts = []
+        with self.timed('discounts'):
+            for application in basket.offer_applications:
+                # Trigger any deferred benefits from offers and capture the
+                # resulting message
+                application['message'] \
+                    = application['offer'].apply_deferred_benefit(
+                        basket, order, application)
+                # Record offer application results
+                if application['result'].affects_shipping:
+                    # Skip zero shipping discounts
+                    shipping_discount = shipping_method.discount(basket)
+                    if shipping_discount <= D('0.00'):
+                        continue
+                    # If a shipping offer, we need to grab the actual discount
+                    # off the shipping method instance, which should be
+                    # wrapped in an OfferDiscount instance.
+                    application['discount'] = shipping_discount
+                if bulk:
+                    order_discounts.append(
+                        self.get_discount_model(order, application))
+                else:
+                    self.create_discount_model(order, application)
+                self.record_discount(application)
+            OrderDiscount._default_manager.bulk_create(order_discounts)
+
+        with self.timed('vouchers'):
+            for voucher in basket.vouchers.all():
+                self.record_voucher_usage(order, voucher, user)
 
         # Send signal for analytics to pick up
-        order_placed.send(sender=self, order=order, user=user)
+        with self.timed('signal'):
+            order_placed.send(sender=self, order=order, user=user)
 
         return order
 
@@ -130,6 +185,47 @@ class OrderCreator(object):
         You can set extra fields by passing a dictionary as the
         extra_line_fields value
         """
+        order_line = self.get_line_model(
+            order, basket_line, extra_line_fields)
+        order_line.save()
+        self.create_line_price_models(order, order_line, basket_line)
+        self.create_line_attributes(order, order_line, basket_line)
+        self.create_additional_line_models(order, order_line, basket_line)
+
+        return order_line
+
+    def create_line_models_in_bulk(self, order, basket_lines):
+        """
+        Create the line models, and their prices and attributes, of all basket
+        lines with bulk inserts
+        """
+        basket_lines = list(basket_lines)
+        prefetch_related_objects(
+            basket_lines, 'attributes__option', 'stockrecord__partner')
+        Line._default_manager.bulk_create([
+            self.get_line_model(order, basket_line)
+            for basket_line in basket_lines])
+        # Bulk inserts don't set primary keys on all databases, so we fetch
+        # the lines again. They are created in the order of the basket lines.
+        order_lines = list(order.lines.order_by('pk'))
+
+        line_prices, line_attributes = [], []
+        for order_line, basket_line in zip(order_lines, basket_lines):
+            line_prices.extend(self.get_line_price_models(
+                order, order_line, basket_line))
+            line_attributes.extend(self.get_line_attributes(
+                order, order_line, basket_line))
+        LinePrice._default_manager.bulk_create(line_prices)
+        LineAttribute._default_manager.bulk_create(line_attributes)
+
+        for order_line, basket_line in zip(order_lines, basket_lines):
+            self.create_additional_line_models(order, order_line, basket_line)
+        return order_lines
+
+    def get_line_model(self, order, basket_line, extra_line_fields=None):
+        """
+        Return an unsaved line model for the basket line
+        """
         product = basket_line.product
         stockrecord = basket_line.stockrecord
         if not stockrecord:
@@ -174,12 +270,7 @@ class OrderCreator(object):
         if extra_line_fields:
             line_data.update(extra_line_fields)
 
-        order_line = Line._default_manager.create(**line_data)
-        self.create_line_price_models(order, order_line, basket_line)
-        self.create_line_attributes(order, order_line, basket_line)
-        self.create_additional_line_models(order, order_line, basket_line)
-
-        return order_line
+        return Line(**line_data)
 
     def update_stock_records(self, line):
         """
@@ -188,6 +279,22 @@ class OrderCreator(object):
         if line.product.get_product_class().track_stock:
             line.stockrecord.allocate(line.quantity)
 
+    def update_stock_records_in_bulk(self, lines):
+        """
+        Allocate the stock of all lines at once
+        """
+        quantities = defaultdict(int)
+        for line in lines:
+            if line.product.get_product_class().track_stock:
+                quantities[line.stockrecord_id] += line.quantity
+        StockAllocator().allocate(quantities)
+
+    def release_stock_reservations(self, basket):
+        """
+        Release the stock reserved for the basket, if any
+        """
+        StockAllocator().release(basket)
+
     def create_additional_line_models(self, order, order_line, basket_line):
         """
         Empty method designed to be overridden.
@@ -202,23 +309,39 @@ class OrderCreator(object):
         """
         Creates the batch line price models
         """
+        for line_price in self.get_line_price_models(
+                order, order_line, basket_line):
+            line_price.save()
+
+    def get_line_price_models(self, order, order_line, basket_line):
+        """
+        Return the unsaved batch line price models
+        """
         breakdown = basket_line.get_price_breakdown()
-        for price_incl_tax, price_excl_tax, quantity in breakdown:
-            order_line.prices.create(
-                order=order,
-                quantity=quantity,
-                price_incl_tax=price_incl_tax,
-                price_excl_tax=price_excl_tax)
+        return [LinePrice(order=order,
+                          line=order_line,
+                          quantity=quantity,
+                          price_incl_tax=price_incl_tax,
+                          price_excl_tax=price_excl_tax)
+                for price_incl_tax, price_excl_tax, quantity in breakdown]
 
     def create_line_attributes(self, order, order_line, basket_line):
         """
         Creates the batch line attributes.
         """
-        for attr in basket_line.attributes.all():
-            order_line.attributes.create(
-                option=attr.option,
-                type=attr.option.code,
-                value=attr.value)
+        for line_attribute in self.get_line_attributes(
+                order, order_line, basket_line):
+            line_attribute.save()
+
+    def get_line_attributes(self, order, order_line, basket_line):
+        """
+        Return the unsaved batch line attributes
+        """
+        return [LineAttribute(line=order_line,
+                              option=attr.option,
+                              type=attr.option.code,
+                              value=attr.value)
+                for attr in basket_line.attributes.all()]
 
     def create_discount_model(self, order, discount):
 
@@ -226,6 +349,13 @@ class OrderCreator(object):
         Create an order discount model for each offer application attached to
         the basket.
         """
+        order_discount = self.get_discount_model(order, discount)
+        order_discount.save()
+
+    def get_discount_model(self, order, discount):
+        """
+        Return an unsaved order discount model for an offer application
+        """
         order_discount = OrderDiscount(
             order=order,
             message=discount['message'] or '',
@@ -241,7 +371,7 @@ class OrderCreator(object):
         if voucher:
             order_discount.voucher_id = voucher.id
             order_discount.voucher_code = voucher.code
-        order_discount.save()
+        return order_discount
 
     def record_discount(self, discount):
         discount['offer'].record_usage(discount)
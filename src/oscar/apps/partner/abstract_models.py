@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
@@ -178,6 +178,23 @@ class AbstractStockRecord(models.Model):
         return self.num_in_stock - self.num_allocated
 
     # 2-stage stock management model
+    #
+    # Stock adjustments lock the database row of the stock record and refresh
+    # the stock levels from it first, so that concurrent adjustments of the
+    # same record can't overwrite each other.
+
+    def refresh_stock_levels(self):
+        """
+        Lock the database row and load the current stock levels from it.
+
+        This has to be called within a transaction.
+        """
+        if self.pk is None:
+            return
+        levels = self.__class__._default_manager.select_for_update().filter(
+            pk=self.pk).values('num_in_stock', 'num_allocated').get()
+        self.num_in_stock = levels['num_in_stock']
+        self.num_allocated = levels['num_allocated']
 
     def allocate(self, quantity):
         """
@@ -186,10 +203,12 @@ class AbstractStockRecord(models.Model):
         This normally happens when a product is bought at checkout.  When the
         product is actually shipped, then we 'consume' the allocation.
         """
-        if self.num_allocated is None:
-            self.num_allocated = 0
-        self.num_allocated += quantity
-        self.save()
+        with transaction.atomic():
+            self.refresh_stock_levels()
+            if self.num_allocated is None:
+                self.num_allocated = 0
+            self.num_allocated += quantity
+            self.save()
     allocate.alters_data = True
 
     def is_allocation_consumption_possible(self, quantity):
@@ -205,19 +224,23 @@ class AbstractStockRecord(models.Model):
         This is used when an item is shipped.  We remove the original
         allocation and adjust the number in stock accordingly
         """
-        if not self.is_allocation_consumption_possible(quantity):
-            raise InvalidStockAdjustment(
-                _('Invalid stock consumption request'))
-        self.num_allocated -= quantity
-        self.num_in_stock -= quantity
-        self.save()
+        with transaction.atomic():
+            self.refresh_stock_levels()
+            if not self.is_allocation_consumption_possible(quantity):
+                raise InvalidStockAdjustment(
+                    _('Invalid stock consumption request'))
+            self.num_allocated -= quantity
+            self.num_in_stock -= quantity
+            self.save()
     consume_allocation.alters_data = True
 
     def cancel_allocation(self, quantity):
-        # We ignore requests that request a cancellation of more than the
-        # amount already allocated.
-        self.num_allocated -= min(self.num_allocated, quantity)
-        self.save()
+        with transaction.atomic():
+            self.refresh_stock_levels()
+            # We ignore requests that request a cancellation of more than the
+            # amount already allocated.
+            self.num_allocated -= min(self.num_allocated, quantity)
+            self.save()
     cancel_allocation.alters_data = True
 
     @property
@@ -262,3 +285,38 @@ class AbstractStockAlert(models.Model):
         ordering = ('-date_created',)
         verbose_name = _('Stock alert')
         verbose_name_plural = _('Stock alerts')
+
+
+@python_2_unicode_compatible
+class AbstractStockReservation(models.Model):
+    """
+    A short-lived reservation of stock for a basket.
+
+    Reserved stock is allocated on the stock record, so it isn't available to
+    other customers. Reservations are released when the basket's order is
+    placed, or cancelled in bulk once they have expired. See
+    ``oscar.apps.partner.allocation.StockAllocator``.
+    """
+    stockrecord = models.ForeignKey(
+        'partner.StockRecord', related_name='reservations',
+        verbose_name=_("Stock record"))
+    # Expired reservations of deleted baskets still need to be cancelled, so
+    # we keep them around.
+    basket = models.ForeignKey(
+        'basket.Basket', related_name='stock_reservations',
+        verbose_name=_("Basket"), null=True, blank=True,
+        on_delete=models.SET_NULL)
+    quantity = models.PositiveIntegerField(_("Quantity"))
+    date_created = models.DateTimeField(_("Date created"), auto_now_add=True)
+    date_expires = models.DateTimeField(_("Date expires"), db_index=True)
+
+    def __str__(self):
+        return _("%(quantity)d of %(stock)s until %(expires)s") % {
+            'quantity': self.quantity, 'stock': self.stockrecord,
+            'expires': self.date_expires}
+
+    class Meta:
+        abstract = True
+        app_label = 'partner'
+        verbose_name = _('Stock reservation')
+        verbose_name_plural = _('Stock reservations')
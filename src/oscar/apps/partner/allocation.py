@@ -0,0 +1,188 @@
+import datetime
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from django.utils.translation import ugettext_lazy as _
+
+from oscar.core.loading import get_class, get_model
+
+InsufficientStock = get_class('partner.exceptions', 'InsufficientStock')
+invalidate_cards_of_products = get_class(
+    'catalogue.cards', 'invalidate_cards_of_products')
+StockRecord = get_model('partner', 'StockRecord')
+StockReservation = get_model('partner', 'StockReservation')
+
+
+class StockAllocator(object):
+    """
+    Adjusts the stock allocations of many stock records at once.
+
+    The rows of the stock records are locked (``SELECT ... FOR UPDATE``) in
+    the order of their primary keys before they are changed. Concurrent
+    allocations therefore can't overwrite each other, and two baskets sharing
+    some products can't deadlock by locking them in different orders.
+
+    The allocator can also reserve the stock of a basket for a short time,
+    eg while the customer enters their payment details. Reserved stock is
+    allocated straight away; the reservations are released when the order is
+    placed (see ``OrderCreator``) or cancelled in bulk once they have expired
+    (see the ``oscar_expire_stock_reservations`` command).
+    """
+
+    def lock_stockrecords(self, stockrecord_ids):
+        """
+        Lock the passed stock records and return them keyed by ID.
+
+        This has to be called within a transaction.
+        """
+        stockrecords = StockRecord._default_manager.select_for_update().filter(
+            id__in=list(stockrecord_ids)).order_by('pk')
+        return dict((stockrecord.pk, stockrecord)
+                    for stockrecord in stockrecords)
+
+    def allocate(self, quantities, check_availability=False):
+        """
+        Allocate stock
+
+        :param quantities: A dict mapping stock record IDs to the quantities
+                           to allocate
+        :param check_availability: Whether to raise ``InsufficientStock``
+                                   instead of allocating more stock than is
+                                   available. Stock records that don't track
+                                   their stock level are never checked.
+        """
+        with transaction.atomic():
+            stockrecords = self.lock_stockrecords(quantities)
+            for stockrecord_id, quantity in quantities.items():
+                stockrecord = stockrecords[stockrecord_id]
+                if (check_availability and
+                        stockrecord.num_in_stock is not None and
+                        stockrecord.net_stock_level < quantity):
+                    raise InsufficientStock(
+                        _("Only %(num)d of %(stock)s are available") % {
+                            'num': max(stockrecord.net_stock_level, 0),
+                            'stock': stockrecord})
+                stockrecord.num_allocated = (
+                    (stockrecord.num_allocated or 0) + quantity)
+            self.save_stock_levels(stockrecords.values())
+    allocate.alters_data = True
+
+    def cancel(self, quantities):
+        """
+        Cancel stock allocations
+
+        As with ``StockRecord.cancel_allocation``, cancelling more than the
+        allocated quantity only resets the allocation to zero.
+        """
+        with transaction.atomic():
+            stockrecords = self.lock_stockrecords(quantities)
+            for stockrecord_id, quantity in quantities.items():
+                stockrecord = stockrecords[stockrecord_id]
+                num_allocated = stockrecord.num_allocated or 0
+                stockrecord.num_allocated = (
+                    num_allocated - min(num_allocated, quantity))
+            self.save_stock_levels(stockrecords.values())
+    cancel.alters_data = True
+
+    def save_stock_levels(self, stockrecords):
+        """
+        Write the allocations of locked stock records.
+
+        Stock records with a low-stock threshold are saved one by one, so that
+        low-stock alerts are raised. The others are written with one UPDATE
+        per distinct allocation.
+        """
+        by_allocation = defaultdict(list)
+        product_ids = set()
+        for stockrecord in stockrecords:
+            if stockrecord.low_stock_threshold is not None:
+                stockrecord.save()
+            else:
+                by_allocation[stockrecord.num_allocated].append(stockrecord.pk)
+                product_ids.add(stockrecord.product_id)
+        timestamp = now()
+        for num_allocated, ids in by_allocation.items():
+            StockRecord._default_manager.filter(id__in=ids).update(
+                num_allocated=num_allocated, date_updated=timestamp)
+        # The updates don't send signals, so the cached product cards are
+        # invalidated here
+        invalidate_cards_of_products(product_ids)
+
+    # Reservations
+
+    def get_basket_quantities(self, basket):
+        """
+        Return the quantities of the basket's lines that are stock tracked,
+        keyed by stock record ID
+        """
+        quantities = defaultdict(int)
+        for line in basket.all_lines():
+            if (line.stockrecord_id and
+                    line.product.get_product_class().track_stock):
+                quantities[line.stockrecord_id] += line.quantity
+        return quantities
+
+    def reserve(self, basket, timeout=None):
+        """
+        Reserve the stock of the basket's lines for ``timeout`` seconds.
+
+        Existing reservations of the basket are replaced. Raises
+        ``InsufficientStock`` (and reserves nothing) if any of the lines
+        isn't available in the requested quantity.
+        """
+        if timeout is None:
+            timeout = settings.OSCAR_STOCK_RESERVATION_TIMEOUT
+        date_expires = now() + datetime.timedelta(seconds=timeout)
+        quantities = self.get_basket_quantities(basket)
+        with transaction.atomic():
+            self.release(basket)
+            self.allocate(quantities, check_availability=True)
+            StockReservation._default_manager.bulk_create([
+                StockReservation(
+                    stockrecord_id=stockrecord_id, basket=basket,
+                    quantity=quantity, date_expires=date_expires)
+                for stockrecord_id, quantity in quantities.items()])
+    reserve.alters_data = True
+
+    def release(self, basket):
+        """
+        Cancel the reservations of a basket
+        """
+        return self.cancel_reservations(
+            StockReservation._default_manager.filter(basket=basket))
+    release.alters_data = True
+
+    def expire_reservations(self):
+        """
+        Cancel all expired reservations and return their number
+        """
+        return self.cancel_reservations(
+            StockReservation._default_manager.filter(
+                date_expires__lte=now()))
+    expire_reservations.alters_data = True
+
+    def cancel_reservations(self, reservations):
+        """
+        Cancel the allocations of the passed reservations and delete them.
+
+        The reservations are locked before the stock records, so that a
+        reservation that is cancelled concurrently by another process isn't
+        cancelled twice.
+        """
+        with transaction.atomic():
+            reservations = list(
+                reservations.select_for_update().order_by('pk').values_list(
+                    'pk', 'stockrecord_id', 'quantity'))
+            if not reservations:
+                return 0
+            quantities = defaultdict(int)
+            for __, stockrecord_id, quantity in reservations:
+                quantities[stockrecord_id] += quantity
+            self.cancel(quantities)
+            StockReservation._default_manager.filter(
+                id__in=[reservation[0] for reservation in reservations]
+            ).delete()
+        return len(reservations)
+    cancel_reservations.alters_data = True
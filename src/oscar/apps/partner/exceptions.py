@@ -8,3 +8,7 @@ class CatalogueImportError(Exception):
 
 class InvalidStockAdjustment(Exception):
     pass
+
+
+class InsufficientStock(InvalidStockAdjustment):
+    pass
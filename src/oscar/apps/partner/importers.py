@@ -1,14 +1,25 @@
 import os
+import time
+from collections import OrderedDict
 from decimal import Decimal as D
 
+from django.db.models import Q
 from django.db.transaction import atomic
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from oscar.apps.catalogue.categories import create_from_breadcrumbs
 from oscar.core.compat import UnicodeCSVReader
-from oscar.core.loading import get_class, get_classes
+from oscar.core.loading import get_class, get_classes, get_model
+from oscar.core.utils import slugify
 
 ImportingError = get_class('partner.exceptions', 'ImportingError')
+invalidate_cards_of_products = get_class(
+    'catalogue.cards', 'invalidate_cards_of_products')
+is_range_index_enabled, update_range_indexes = get_classes(
+    'offer.receivers', ['is_range_index_enabled', 'update_range_indexes'])
+queue_product_updates = get_class('search.indexing', 'queue_product_updates')
+Range = get_model('offer', 'Range')
 Partner, StockRecord = get_classes('partner.models', ['Partner',
                                                       'StockRecord'])
 ProductClass, Product, Category, ProductCategory = get_classes(
@@ -20,14 +31,37 @@ class CatalogueImporter(object):
     """
     CSV product importer used to built sandbox. Might not work very well
     for anything else.
+
+    By default, each row is imported on its own and the whole file is imported
+    in one transaction. If a batch size is given, rows are instead imported
+    in batches, each in its own transaction, with bulk queries for the
+    products, categories and stock records of a batch. As a failed import
+    keeps the batches that were committed, it can be resumed by passing the
+    number of rows to skip as the offset.
+
+    Note that the batched import doesn't call ``save`` on products, product
+    categories and stock records, so no signals are sent for them. Instead,
+    the product cards, range indexes and queued search index updates of the
+    changed products are updated after each batch; other receivers of these
+    signals aren't run.
     """
 
     _flush = False
 
-    def __init__(self, logger, delimiter=",", flush=False):
+    def __init__(self, logger, delimiter=",", flush=False, batch_size=None,
+                 offset=0):
         self.logger = logger
         self._delimiter = delimiter
         self._flush = flush
+        self._batch_size = batch_size
+        self._offset = offset
+        self._reset_caches()
+
+    def _reset_caches(self):
+        # In-memory caches of the batched import, by name
+        self._product_classes = {}
+        self._categories = {}
+        self._partners = {}
 
     def handle(self, file_path=None):
         u"""Handles the actual import process"""
@@ -37,7 +71,10 @@ class CatalogueImporter(object):
         if self._flush is True:
             self.logger.info(" - Flushing product data before import")
             self._flush_product_data()
-        self._import(file_path)
+        if self._batch_size:
+            self._import_in_batches(file_path)
+        else:
+            self._import(file_path)
 
     def _flush_product_data(self):
         u"""Flush out product and stock models"""
@@ -45,6 +82,7 @@ class CatalogueImporter(object):
         ProductClass.objects.all().delete()
         Partner.objects.all().delete()
         StockRecord.objects.all().delete()
+        self._reset_caches()
 
     @atomic
     def _import(self, file_path):
@@ -116,6 +154,184 @@ class CatalogueImporter(object):
         stock.num_in_stock = num_in_stock
         stock.save()
 
+    # Batched import
+
+    def _read_rows(self, file_path):
+        u"""Yields the row number and fields of the rows after the offset"""
+        with UnicodeCSVReader(
+                file_path, delimiter=self._delimiter,
+                quotechar='"', escapechar='\\') as reader:
+            for row_number, row in enumerate(reader, 1):
+                if row_number > self._offset:
+                    yield row_number, row
+
+    def _import_in_batches(self, file_path):
+        u"""Imports given file in batches"""
+        stats = {'new_items': 0,
+                 'updated_items': 0}
+        start_time = time.time()
+        num_rows = 0
+        batch = []
+        for row_number, row in self._read_rows(file_path):
+            num_rows += 1
+            if len(row) != 5 and len(row) != 9:
+                self.logger.error(
+                    "Row number %d has an invalid number of fields"
+                    " (%d), skipping..." % (row_number, len(row)))
+            else:
+                batch.append(row)
+            if num_rows % self._batch_size == 0:
+                self._import_batch(batch, stats)
+                batch = []
+                self.logger.info(
+                    "Imported rows up to row %d (%.1f rows/sec)" % (
+                        row_number,
+                        num_rows / max(time.time() - start_time, 0.001)))
+        if batch:
+            self._import_batch(batch, stats)
+        msg = ("New items: %d, updated items: %d, %d rows in %.1f seconds" % (
+            stats['new_items'], stats['updated_items'], num_rows,
+            time.time() - start_time))
+        self.logger.info(msg)
+
+    @atomic
+    def _import_batch(self, rows, stats):
+        # Later rows for the same product or stock record win, as they would
+        # when importing row by row.
+        items = OrderedDict()
+        stock = OrderedDict()
+        product_categories = []
+        for row in rows:
+            product_class, category_str, upc, title, description = row[:5]
+            items[upc] = (product_class, title,
+                          '' if description == 'NULL' else description)
+            product_categories.append(
+                (upc, self._get_category(category_str).id))
+            if len(row) == 9:
+                partner_name, partner_sku, price_excl_tax, num_in_stock = (
+                    row[5:9])
+                stock[partner_sku] = (upc, partner_name, D(price_excl_tax),
+                                      int(num_in_stock))
+
+        changed_ids = set()
+        product_ids = self._import_products(items, stats, changed_ids)
+        self._import_product_categories(
+            product_ids, product_categories, changed_ids)
+        self._import_stockrecords(product_ids, stock, changed_ids)
+        self._handle_changed_products(changed_ids)
+
+    def _handle_changed_products(self, product_ids):
+        u"""
+        Does what the signal receivers would do for the changed products, as
+        batches are written without sending signals
+        """
+        invalidate_cards_of_products(product_ids)
+        if is_range_index_enabled():
+            update_range_indexes(
+                Range.objects.filter(Q(classes__isnull=False) |
+                                     Q(included_categories__isnull=False))
+                             .distinct(),
+                product_ids)
+        queue_product_updates(product_ids)
+
+    def _import_products(self, items, stats, changed_ids):
+        u"""Creates or updates products and returns their IDs by UPC"""
+        existing = dict(
+            (product.upc, product) for product in
+            Product.objects.filter(upc__in=list(items)).only(
+                'id', 'upc', 'title', 'description', 'product_class'
+            ).order_by())
+        new_products = []
+        for upc, (class_name, title, description) in items.items():
+            product_class = self._get_product_class(class_name)
+            product = existing.get(upc)
+            if product is None:
+                stats['new_items'] += 1
+                new_products.append(Product(
+                    upc=upc, title=title, description=description,
+                    product_class=product_class, slug=slugify(title)))
+                continue
+            stats['updated_items'] += 1
+            # Only changed products are written, one by one
+            if (product.title, product.description,
+                    product.product_class_id) != (
+                        title, description, product_class.id):
+                # update() skips auto_now, so date_updated is set here for
+                # incremental reindexing to pick the product up
+                Product.objects.filter(id=product.id).update(
+                    title=title, description=description,
+                    product_class=product_class, date_updated=now())
+                changed_ids.add(product.id)
+        Product.objects.bulk_create(new_products)
+
+        product_ids = dict(
+            (upc, product.id) for upc, product in existing.items())
+        if new_products:
+            new_product_ids = dict(Product.objects.filter(
+                upc__in=[product.upc for product in new_products]
+            ).order_by().values_list('upc', 'id'))
+            product_ids.update(new_product_ids)
+            changed_ids.update(new_product_ids.values())
+        return product_ids
+
+    def _import_product_categories(self, product_ids, product_categories,
+                                   changed_ids):
+        existing = set(ProductCategory.objects.filter(
+            product_id__in=product_ids.values()).order_by().values_list(
+                'product_id', 'category_id'))
+        new_product_categories = []
+        for upc, category_id in product_categories:
+            key = (product_ids[upc], category_id)
+            if key not in existing:
+                existing.add(key)
+                new_product_categories.append(ProductCategory(
+                    product_id=key[0], category_id=category_id))
+                changed_ids.add(key[0])
+        ProductCategory.objects.bulk_create(new_product_categories)
+
+    def _import_stockrecords(self, product_ids, stock, changed_ids):
+        existing = dict(
+            (stockrecord.partner_sku, stockrecord) for stockrecord in
+            StockRecord.objects.filter(
+                partner_sku__in=list(stock)).order_by())
+        new_stockrecords = []
+        for partner_sku, (upc, partner_name, price_excl_tax,
+                          num_in_stock) in stock.items():
+            values = {'product_id': product_ids[upc],
+                      'partner_id': self._get_partner(partner_name).id,
+                      'price_excl_tax': price_excl_tax,
+                      'num_in_stock': num_in_stock}
+            stockrecord = existing.get(partner_sku)
+            if stockrecord is None:
+                new_stockrecords.append(
+                    StockRecord(partner_sku=partner_sku, **values))
+                changed_ids.add(values['product_id'])
+            elif any(getattr(stockrecord, key) != value
+                     for key, value in values.items()):
+                StockRecord.objects.filter(id=stockrecord.id).update(
+                    date_updated=now(), **values)
+                changed_ids.update(
+                    [stockrecord.product_id, values['product_id']])
+        StockRecord.objects.bulk_create(new_stockrecords)
+
+    def _get_product_class(self, name):
+        if name not in self._product_classes:
+            self._product_classes[name], __ = (
+                ProductClass.objects.get_or_create(name=name))
+        return self._product_classes[name]
+
+    def _get_category(self, category_str):
+        if category_str not in self._categories:
+            self._categories[category_str] = create_from_breadcrumbs(
+                category_str)
+        return self._categories[category_str]
+
+    def _get_partner(self, name):
+        if name not in self._partners:
+            self._partners[name], __ = Partner.objects.get_or_create(
+                name=name)
+        return self._partners[name]
+
 
 class Validator(object):
 
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('basket', '0006_auto_20160111_1108'),
+        ('partner', '0004_auto_20160107_1755'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockReservation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(verbose_name='Quantity')),
+                ('date_created', models.DateTimeField(auto_now_add=True, verbose_name='Date created')),
+                ('date_expires', models.DateTimeField(db_index=True, verbose_name='Date expires')),
+                ('basket', models.ForeignKey(related_name='stock_reservations', on_delete=django.db.models.deletion.SET_NULL, blank=True, to='basket.Basket', null=True, verbose_name='Basket')),
+                ('stockrecord', models.ForeignKey(related_name='reservations', to='partner.StockRecord', verbose_name='Stock record')),
+            ],
+            options={
+                'verbose_name_plural': 'Stock reservations',
+                'verbose_name': 'Stock reservation',
+                'abstract': False,
+            },
+            bases=(models.Model,),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from oscar.apps.address.abstract_models import AbstractPartnerAddress
 from oscar.apps.partner.abstract_models import (
-    AbstractPartner, AbstractStockAlert, AbstractStockRecord)
+    AbstractPartner, AbstractStockAlert, AbstractStockRecord,
+    AbstractStockReservation)
 from oscar.core.loading import is_model_registered
 
 __all__ = []
@@ -32,3 +33,10 @@ if not is_model_registered('partner', 'StockAlert'):
         pass
 
     __all__.append('StockAlert')
+
+
+if not is_model_registered('partner', 'StockReservation'):
+    class StockReservation(AbstractStockReservation):
+        pass
+
+    __all__.append('StockReservation')
@@ -1,6 +1,8 @@
 from collections import namedtuple
 from decimal import Decimal as D
 
+from oscar.core.compat import prefetch_related_objects
+
 from . import availability, prices
 
 # A container for policies
@@ -97,6 +99,31 @@ class Base(object):
         # do with them within Oscar - that's up to your project to implement.
         return self.fetch_for_product(line.product)
 
+    def fetch_for_products(self, products):
+        """
+        Given an iterable of products, return a dict of ``PurchaseInfo``
+        instances keyed by product ID.
+
+        Parent products are handled by ``fetch_for_parent``, all others by
+        ``fetch_for_product``.  This is meant for rendering lists of products;
+        strategies can override it to load the data they need in bulk.
+        """
+        infos = {}
+        for product in products:
+            if product.is_parent:
+                infos[product.id] = self.fetch_for_parent(product)
+            else:
+                infos[product.id] = self.fetch_for_product(product)
+        return infos
+
+    def fetch_for_lines(self, lines):
+        """
+        Given an iterable of basket lines, return a dict of ``PurchaseInfo``
+        instances keyed by line ID.
+        """
+        return dict((line.id, self.fetch_for_line(line, line.stockrecord))
+                    for line in lines)
+
 
 class Structured(Base):
     """
@@ -121,6 +148,37 @@ class Structured(Base):
             availability=self.availability_policy(product, stockrecord),
             stockrecord=stockrecord)
 
+    def fetch_for_products(self, products):
+        products = list(products)
+        self.prefetch_for_products(products)
+        return super(Structured, self).fetch_for_products(products)
+
+    def fetch_for_lines(self, lines):
+        lines = list(lines)
+        # Lines already know their stockrecord
+        prefetch_related_objects(
+            [line.product for line in lines],
+            'product_class', 'parent__product_class')
+        return super(Structured, self).fetch_for_lines(lines)
+
+    def prefetch_for_products(self, products):
+        """
+        Load the data that is needed to pick stockrecords and policies for the
+        passed products in bulk, so that a list of products costs a constant
+        number of queries.
+
+        The default stockrecord selection and policy mixins only use the
+        product's (or parent's) class, its stockrecords and its children's
+        stockrecords.  Strategies that need other related data should extend
+        this method.
+        """
+        lookups = ['product_class', 'stockrecords']
+        if any(product.is_parent for product in products):
+            lookups.append('children__stockrecords')
+        if any(product.is_child for product in products):
+            lookups.append('parent__product_class')
+        prefetch_related_objects(products, *lookups)
+
     def fetch_for_parent(self, product):
         # Select children and associated stockrecords
         children_stock = self.select_children_stockrecords(product)
@@ -0,0 +1,17 @@
+from oscar.core.cache import bump_cache_version, get_cache_version
+
+PROMOTIONS_VERSION_CACHE_KEY = 'oscar_promotions_version'
+
+
+def get_promotions_version():
+    """
+    Return the current version of the promotions, for use in cache keys
+    """
+    return get_cache_version(PROMOTIONS_VERSION_CACHE_KEY)
+
+
+def bump_promotions_version():
+    """
+    Invalidate all cached promotions
+    """
+    bump_cache_version(PROMOTIONS_VERSION_CACHE_KEY)
@@ -1,5 +1,11 @@
+import hashlib
 from itertools import chain
 
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.encoding import force_bytes
+
+from oscar.apps.promotions.cache import get_promotions_version
 from oscar.apps.promotions.models import KeywordPromotion, PagePromotion
 
 
@@ -7,15 +13,23 @@ def promotions(request):
     """
     For adding bindings for banners and pods to the template
     context.
-    """
-    promotions = get_request_promotions(request)
 
-    # Split the promotions into separate lists for each position, and add them
-    # to the template bindings
+    If OSCAR_PROMOTIONS_CACHE_TIMEOUT is set, the promotions of each page and
+    keyword are stored in the cache backend, already split by position. This
+    includes pages without promotions, which are the vast majority.
+    """
     context = {
         'url_path': request.path
     }
-    split_by_position(promotions, context)
+    timeout = getattr(settings, 'OSCAR_PROMOTIONS_CACHE_TIMEOUT', 0)
+    if timeout:
+        add_cached_promotions(request, context, timeout)
+    else:
+        promotions = get_request_promotions(request)
+
+        # Split the promotions into separate lists for each position, and add
+        # them to the template bindings
+        split_by_position(promotions, context)
 
     return context
 
@@ -24,20 +38,73 @@ def get_request_promotions(request):
     """
     Return promotions relevant to this request
     """
-    promotions = PagePromotion._default_manager.select_related() \
-        .prefetch_related('content_object') \
-        .filter(page_url=request.path) \
-        .order_by('display_order')
+    promotions = get_page_promotions(request.path)
 
     if 'q' in request.GET:
-        keyword_promotions \
-            = KeywordPromotion._default_manager.select_related()\
-            .filter(keyword=request.GET['q'])
+        keyword_promotions = get_keyword_promotions(request.GET['q'])
         if keyword_promotions.exists():
             promotions = list(chain(promotions, keyword_promotions))
     return promotions
 
 
+def get_page_promotions(page_url):
+    return PagePromotion._default_manager.select_related() \
+        .prefetch_related('content_object') \
+        .filter(page_url=page_url) \
+        .order_by('display_order')
+
+
+def get_keyword_promotions(keyword):
+    return KeywordPromotion._default_manager.select_related()\
+        .filter(keyword=keyword)
+
+
+def add_cached_promotions(request, context, timeout):
+    """
+    Add the cached promotions of the requested page and search keyword to
+    the context
+    """
+    version = get_promotions_version()
+    merge_positions(context, get_cached_positions(
+        'page', request.path, get_page_promotions, version, timeout))
+
+    if 'q' in request.GET:
+        keyword = request.GET['q']
+        # Keywords are user input, so instead of caching the (mostly empty)
+        # promotions of every searched keyword, we cache the set of keywords
+        # that have promotions.
+        keywords_key = 'oscar_promotion_keywords_%s' % version
+        keywords = cache.get(keywords_key)
+        if keywords is None:
+            keywords = set(KeywordPromotion._default_manager.values_list(
+                'keyword', flat=True))
+            cache.set(keywords_key, keywords, timeout)
+        if keyword in keywords:
+            merge_positions(context, get_cached_positions(
+                'keyword', keyword, get_keyword_promotions, version,
+                timeout))
+
+
+def get_cached_positions(kind, value, get_promotions, version, timeout):
+    """
+    Return the promotions of a page or keyword split by position, from the
+    cache if possible
+    """
+    cache_key = 'oscar_promotions_%s_%s_%s' % (
+        version, kind, hashlib.md5(force_bytes(value)).hexdigest())
+    positions = cache.get(cache_key)
+    if positions is None:
+        positions = {}
+        split_by_position(get_promotions(value), positions)
+        cache.set(cache_key, positions, timeout)
+    return positions
+
+
+def merge_positions(context, positions):
+    for key, promotions in positions.items():
+        context.setdefault(key, []).extend(promotions)
+
+
 def split_by_position(linked_promotions, context):
     """
     Split the list of promotions into separate lists, grouping
@@ -36,7 +36,7 @@ class LinkedPromotion(models.Model):
 
     def record_click(self):
         self.clicks += 1
-        self.save()
+        self.save(update_fields=['clicks'])
     record_click.alters_data = True
 
 
@@ -0,0 +1,23 @@
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from oscar.apps.promotions.cache import bump_promotions_version
+from oscar.apps.promotions.models import MultiImage
+
+
+def invalidate_promotions(sender, **kwargs):
+    """
+    Invalidate cached promotions (see the promotions context processor)
+    """
+    # Recording a click doesn't change what is displayed
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) == set(['clicks']):
+        return
+    bump_promotions_version()
+
+
+# Linked promotions, the promotions themselves and the models they consist of
+for model in apps.get_app_config('promotions').get_models():
+    post_save.connect(invalidate_promotions, sender=model)
+    post_delete.connect(invalidate_promotions, sender=model)
+m2m_changed.connect(invalidate_promotions, sender=MultiImage.images.through)
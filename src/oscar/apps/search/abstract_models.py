@@ -0,0 +1,29 @@
+from django.db import models
+from django.utils.encoding import python_2_unicode_compatible
+from django.utils.translation import ugettext_lazy as _
+
+
+@python_2_unicode_compatible
+class AbstractProductIndexUpdate(models.Model):
+    """
+    A product whose search index entry is out of date.
+
+    These records are written by the ``QueuedSignalProcessor`` and processed
+    in batches by the ``oscar_process_index_queue`` command. There is at most
+    one record per product, so that a product that changes several times
+    before the queue is processed is only indexed once.
+    """
+    # Not a foreign key, as deleted products need to be removed from the
+    # index too
+    product_id = models.IntegerField(_("Product ID"), unique=True)
+    date_queued = models.DateTimeField(_("Date queued"), db_index=True)
+
+    class Meta:
+        abstract = True
+        app_label = 'search'
+        verbose_name = _('Product index update')
+        verbose_name_plural = _('Product index updates')
+
+    def __str__(self):
+        return _("Update of product #%(id)d queued at %(date)s") % {
+            'id': self.product_id, 'date': self.date_queued}
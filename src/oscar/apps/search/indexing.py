@@ -0,0 +1,247 @@
+import logging
+import multiprocessing
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, connections, reset_queries, transaction
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+from haystack import connections as haystack_connections
+from haystack.constants import DEFAULT_ALIAS
+
+from oscar.core.loading import get_class, get_model
+
+logger = logging.getLogger('oscar.search')
+
+
+def index_range(kwargs):
+    """
+    Index the products of a primary key range with a new indexer. This is
+    the task run by the worker processes.
+    """
+    lower, upper = kwargs.pop('range')
+    return ProductIndexer(**kwargs).index_range(lower, upper)
+
+
+class ProductIndexer(object):
+    """
+    Updates the search index of the products.
+
+    Haystack's ``update_index`` command pages through the products with
+    offsets, which gets slower the further it gets into a large catalogue.
+    This indexer splits the products into ranges of primary keys instead
+    (keyset pagination), so that every batch is an index range scan. The
+    batches can be indexed by a pool of worker processes.
+
+    :param start_date: Only index products that (or whose stock records)
+                       changed since this date
+    """
+
+    def __init__(self, using=DEFAULT_ALIAS, batch_size=1000, workers=0,
+                 start_date=None, commit=True, logger=logger):
+        self.using = using
+        self.batch_size = batch_size
+        self.workers = workers
+        self.start_date = start_date
+        self.commit = commit
+        self.logger = logger
+
+    def get_index(self):
+        Product = get_model('catalogue', 'Product')
+        return haystack_connections[self.using].get_unified_index().get_index(
+            Product)
+
+    def get_queryset(self):
+        return self.get_index().build_queryset(
+            using=self.using, start_date=self.start_date)
+
+    def get_ranges(self):
+        """
+        Return the (exclusive lower, inclusive upper) primary key bounds of
+        the batches
+        """
+        ids = self.get_queryset().order_by('pk').values_list('pk', flat=True)
+        ranges = []
+        lower = 0
+        while True:
+            batch = list(ids.filter(pk__gt=lower)[:self.batch_size])
+            if not batch:
+                return ranges
+            ranges.append((lower, batch[-1]))
+            lower = batch[-1]
+
+    def index_range(self, lower, upper):
+        """
+        Index the products of a primary key range and return their number
+        """
+        index = self.get_index()
+        products = list(self.get_queryset().filter(
+            pk__gt=lower, pk__lte=upper))
+        if products:
+            backend = haystack_connections[self.using].get_backend()
+            backend.update(index, products, commit=self.commit)
+        # Queries are logged in debug mode, which would bloat up RAM
+        reset_queries()
+        return len(products)
+
+    def run(self):
+        """
+        Index all products and return their number
+        """
+        start = time.time()
+        ranges = self.get_ranges()
+        if self.workers > 0:
+            num_indexed = self.run_in_pool(ranges)
+        else:
+            num_indexed = 0
+            for lower, upper in ranges:
+                num_indexed += self.index_range(lower, upper)
+                self.log_progress(num_indexed, start)
+        self.logger.info("Indexed %d products in %.1f seconds",
+                         num_indexed, time.time() - start)
+        return num_indexed
+
+    def run_in_pool(self, ranges):
+        # Forked processes mustn't share the database connections of this
+        # process, so we close them and let every process open its own.
+        for connection in connections.all():
+            connection.close()
+        kwargs = dict(using=self.using, batch_size=self.batch_size,
+                      start_date=self.start_date, commit=self.commit)
+        pool = multiprocessing.Pool(self.workers)
+        start = time.time()
+        num_indexed = 0
+        try:
+            tasks = [dict(kwargs, range=bounds) for bounds in ranges]
+            for count in pool.imap_unordered(index_range, tasks):
+                num_indexed += count
+                self.log_progress(num_indexed, start)
+        finally:
+            pool.close()
+            pool.join()
+        return num_indexed
+
+    def log_progress(self, num_indexed, start):
+        elapsed = max(time.time() - start, 0.001)
+        self.logger.info("Indexed %d products (%.0f products/sec)",
+                         num_indexed, num_indexed / elapsed)
+
+
+class ProductIndexQueue(object):
+    """
+    A de-duplicating queue of products whose search index entries need to be
+    updated, stored in the ``ProductIndexUpdate`` table.
+
+    Re-queueing a product that is already queued only bumps its queue date,
+    and ``process`` only removes the entries that weren't bumped while their
+    products were being indexed. A change made during indexing therefore
+    isn't lost.
+    """
+
+    def __init__(self, using=DEFAULT_ALIAS, logger=logger):
+        self.using = using
+        self.logger = logger
+
+    def get_queue_model(self):
+        return get_model('search', 'ProductIndexUpdate')
+
+    def enqueue(self, product_id):
+        """
+        Queue a product for reindexing
+        """
+        queue = self.get_queue_model()._default_manager
+        date_queued = now()
+        if queue.filter(product_id=product_id).update(
+                date_queued=date_queued):
+            return
+        try:
+            with transaction.atomic():
+                queue.create(product_id=product_id, date_queued=date_queued)
+        except IntegrityError:
+            # Queued by another process in the meantime
+            queue.filter(product_id=product_id).update(
+                date_queued=date_queued)
+
+    def enqueue_many(self, product_ids):
+        """
+        Queue many products for reindexing with a few bulk queries
+        """
+        product_ids = set(product_ids)
+        if not product_ids:
+            return
+        model = self.get_queue_model()
+        queue = model._default_manager
+        date_queued = now()
+        queue.filter(product_id__in=product_ids).update(
+            date_queued=date_queued)
+        queued_ids = set(queue.filter(product_id__in=product_ids).values_list(
+            'product_id', flat=True))
+        try:
+            with transaction.atomic():
+                queue.bulk_create([
+                    model(product_id=product_id, date_queued=date_queued)
+                    for product_id in product_ids - queued_ids])
+        except IntegrityError:
+            # Some were queued by another process in the meantime
+            for product_id in product_ids - queued_ids:
+                self.enqueue(product_id)
+
+    def __len__(self):
+        return self.get_queue_model()._default_manager.count()
+
+    def process(self, batch_size=1000):
+        """
+        Index the longest-queued products and return their number
+        """
+        queue = self.get_queue_model()._default_manager
+        date_read = now()
+        product_ids = list(queue.order_by('date_queued').values_list(
+            'product_id', flat=True)[:batch_size])
+        if not product_ids:
+            return 0
+        self.update_index(product_ids)
+        queue.filter(product_id__in=product_ids,
+                     date_queued__lte=date_read).delete()
+        return len(product_ids)
+
+    def update_index(self, product_ids):
+        """
+        Update the index entries of the passed products.
+
+        Changes to child products affect the prices and stock levels indexed
+        for their parents, so parents are indexed instead of their children.
+        Products that no longer exist are removed from the index.
+        """
+        Product = get_model('catalogue', 'Product')
+        index = haystack_connections[self.using].get_unified_index().get_index(
+            Product)
+        backend = haystack_connections[self.using].get_backend()
+
+        structures = dict(Product._default_manager.filter(
+            id__in=product_ids).values_list('id', 'parent_id'))
+        ids_to_index = set(parent_id or product_id
+                           for product_id, parent_id in structures.items())
+        products = list(index.index_queryset(using=self.using).filter(
+            id__in=ids_to_index))
+        if products:
+            backend.update(index, products)
+
+        for product_id in set(product_ids) - set(structures):
+            backend.remove('catalogue.product.%d' % product_id)
+        self.logger.info("Indexed %d and removed %d products",
+                         len(products), len(product_ids) - len(structures))
+        reset_queries()
+
+
+def queue_product_updates(product_ids):
+    """
+    Queue products that were changed without sending signals (eg with bulk
+    queries) for reindexing, if the ``QueuedSignalProcessor`` is in use
+    """
+    QueuedSignalProcessor = get_class(
+        'search.signal_processors', 'QueuedSignalProcessor')
+    processor_class = import_string(getattr(
+        settings, 'HAYSTACK_SIGNAL_PROCESSOR',
+        'haystack.signals.BaseSignalProcessor'))
+    if issubclass(processor_class, QueuedSignalProcessor):
+        ProductIndexQueue().enqueue_many(product_ids)
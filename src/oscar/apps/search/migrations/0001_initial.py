@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductIndexUpdate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_id', models.IntegerField(unique=True, verbose_name='Product ID')),
+                ('date_queued', models.DateTimeField(db_index=True, verbose_name='Date queued')),
+            ],
+            options={
+                'verbose_name_plural': 'Product index updates',
+                'verbose_name': 'Product index update',
+                'abstract': False,
+            },
+            bases=(models.Model,),
+        ),
+    ]
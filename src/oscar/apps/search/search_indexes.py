@@ -1,8 +1,11 @@
+from django.db.models import Q
 from haystack import indexes
 
 from oscar.core.loading import get_class, get_model
 
 # Load default strategy (without a user/request)
+get_category_tree_version = get_class(
+    'catalogue.categories', 'get_category_tree_version')
 is_solr_supported = get_class('search.features', 'is_solr_supported')
 Selector = get_class('partner.strategy', 'Selector')
 strategy = Selector().strategy()
@@ -30,12 +33,67 @@ class ProductIndex(indexes.SearchIndex, indexes.Indexable):
     date_created = indexes.DateTimeField(model_attr='date_created')
     date_updated = indexes.DateTimeField(model_attr='date_updated')
 
+    def __init__(self, *args, **kwargs):
+        super(ProductIndex, self).__init__(*args, **kwargs)
+        # (category tree version, {category ID: full name})
+        self._category_full_names = None
+
     def get_model(self):
         return get_model('catalogue', 'Product')
 
     def index_queryset(self, using=None):
+        """
+        Return the products to index.
+
+        The related objects used to prepare products are prefetched, so each
+        batch of products costs a constant number of queries, and the full
+        names of all categories are computed up front.
+        """
+        self.load_category_full_names()
         # Only index browsable products (not each individual child product)
-        return self.get_model().browsable.order_by('-date_updated')
+        return self.get_model().browsable.order_by(
+            '-date_updated').select_related('product_class').prefetch_related(
+                'categories', 'stockrecords', 'children__stockrecords')
+
+    def build_queryset(self, using=None, start_date=None, end_date=None):
+        """
+        Return the products to index, optionally restricted to the products
+        that changed within a date range.
+
+        Unlike the default implementation, a product is also considered
+        changed if one of its (or its children's) stock records changed, as
+        prices and stock levels are indexed too.
+        """
+        queryset = self.index_queryset(using=using)
+        if not (start_date or end_date):
+            return queryset
+
+        date_filter = {}
+        if start_date:
+            date_filter['date_updated__gte'] = start_date
+        if end_date:
+            date_filter['date_updated__lte'] = end_date
+        StockRecord = get_model('partner', 'StockRecord')
+        stockrecords = StockRecord._default_manager.filter(**date_filter)
+        return queryset.filter(
+            Q(**date_filter) |
+            Q(id__in=stockrecords.values('product_id')) |
+            Q(id__in=stockrecords.values('product__parent_id')))
+
+    def load_category_full_names(self):
+        """
+        Compute the full names of all categories, unless the category tree
+        hasn't changed since they were last computed
+        """
+        version = get_category_tree_version()
+        if (self._category_full_names is None or
+                self._category_full_names[0] != version):
+            Category = get_model('catalogue', 'Category')
+            categories = list(Category.get_tree())
+            Category.set_full_names_and_slugs(categories)
+            self._category_full_names = (version, dict(
+                (category.pk, category.full_name)
+                for category in categories))
 
     def read_queryset(self, using=None):
         return self.get_model().browsable.base_queryset()
@@ -46,7 +104,11 @@ class ProductIndex(indexes.SearchIndex, indexes.Indexable):
     def prepare_category(self, obj):
         categories = obj.categories.all()
         if len(categories) > 0:
-            return [category.full_name for category in categories]
+            full_names = {}
+            if self._category_full_names is not None:
+                full_names = self._category_full_names[1]
+            return [full_names.get(category.pk) or category.full_name
+                    for category in categories]
 
     def prepare_rating(self, obj):
         if obj.rating is not None:
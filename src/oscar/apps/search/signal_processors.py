@@ -0,0 +1,57 @@
+from django.db.models import signals
+from haystack.signals import BaseSignalProcessor
+
+from oscar.core.loading import get_class, get_model
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """
+    Keeps the search index of products up to date without slowing down
+    saving them.
+
+    Instead of updating the search backend whenever a product, stock record
+    or product category is saved or deleted, the affected product is added
+    to a de-duplicating queue, which the ``oscar_process_index_queue``
+    command works through in batches. To use it, set::
+
+        HAYSTACK_SIGNAL_PROCESSOR = \\
+            'oscar.apps.search.signal_processors.QueuedSignalProcessor'
+    """
+
+    def setup(self):
+        # Haystack instantiates signal processors before the models are
+        # loaded, so we can't connect to specific senders here.
+        self._senders = None
+        signals.post_save.connect(self.handle_save)
+        signals.post_delete.connect(self.handle_delete)
+
+    def teardown(self):
+        signals.post_save.disconnect(self.handle_save)
+        signals.post_delete.disconnect(self.handle_delete)
+
+    def get_product_id(self, sender, instance):
+        """
+        Return the ID of the product whose index entry is affected by the
+        change of the passed instance, if any
+        """
+        if self._senders is None:
+            self._senders = (
+                get_model('catalogue', 'Product'),
+                (get_model('partner', 'StockRecord'),
+                 get_model('catalogue', 'ProductCategory')))
+        product_model, related_models = self._senders
+        if issubclass(sender, product_model):
+            return instance.pk
+        if issubclass(sender, related_models):
+            return instance.product_id
+
+    def handle_save(self, sender, instance, **kwargs):
+        if kwargs.get('raw', False):
+            return
+        product_id = self.get_product_id(sender, instance)
+        if product_id is not None:
+            ProductIndexQueue = get_class('search.indexing',
+                                          'ProductIndexQueue')
+            ProductIndexQueue().enqueue(product_id)
+
+    handle_delete = handle_save
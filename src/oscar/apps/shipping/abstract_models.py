@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import bisect
 from decimal import Decimal as D
 
 from django.core.validators import MinValueValidator
@@ -10,6 +11,7 @@ from oscar.core import loading, prices
 from oscar.models.fields import AutoSlugField
 
 Scale = loading.get_class('shipping.scales', 'Scale')
+weight_band_cache = loading.get_class('shipping.cache', 'weight_band_cache')
 
 
 @python_2_unicode_compatible
@@ -152,17 +154,35 @@ class AbstractWeightBased(AbstractBase):
         is NP-hard and solving it is left as an exercise to the reader.
         """
         weight = D(weight)  # weight really should be stored as a decimal
-        if not self.bands.exists():
+        bands = self.get_band_table()
+        if not bands:
             return D('0.00')
 
-        top_band = self.top_band
-        if weight < top_band.upper_limit:
-            band = self.get_band_for_weight(weight)
-            return band.charge
+        top_limit, top_charge = bands[-1]
+        if weight < top_limit:
+            return self.get_charge_for_weight(bands, weight)
         else:
-            quotient, remaining_weight = divmod(weight, top_band.upper_limit)
-            remainder_band = self.get_band_for_weight(remaining_weight)
-            return quotient * top_band.charge + remainder_band.charge
+            quotient, remaining_weight = divmod(weight, top_limit)
+            return (quotient * top_charge +
+                    self.get_charge_for_weight(bands, remaining_weight))
+
+    def get_band_table(self):
+        """
+        Return the bands of this method as a list of ``(upper_limit, charge)``
+        tuples, sorted by upper limit.
+
+        The table is read with a single query, or from a process-local cache
+        if ``OSCAR_SHIPPING_BAND_CACHE_TIMEOUT`` is set.
+        """
+        return weight_band_cache.get_band_table(self)
+
+    def get_charge_for_weight(self, bands, weight):
+        """
+        Return the charge of the closest matching band of the band table for
+        a given weight
+        """
+        index = bisect.bisect_left([limit for limit, charge in bands], weight)
+        return bands[index][1]
 
     def get_band_for_weight(self, weight):
         """
@@ -0,0 +1,99 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.utils.encoding import force_text
+
+from oscar.core.cache import bump_cache_version, get_cache_version
+from oscar.core.loading import get_class
+
+get_offer_version = get_class('offer.cache', 'get_offer_version')
+
+WEIGHT_BAND_VERSION_CACHE_KEY = 'oscar_weight_band_version'
+SHIPPING_QUOTE_VERSION_CACHE_KEY = 'oscar_shipping_quote_version'
+
+
+def get_weight_band_version():
+    """
+    Return the current version of the weight bands
+    """
+    return get_cache_version(WEIGHT_BAND_VERSION_CACHE_KEY)
+
+
+def bump_weight_band_version():
+    """
+    Invalidate all cached weight band tables
+    """
+    bump_cache_version(WEIGHT_BAND_VERSION_CACHE_KEY)
+
+
+def get_shipping_quote_version():
+    """
+    Return the current version of the shipping quotes
+    """
+    return get_cache_version(SHIPPING_QUOTE_VERSION_CACHE_KEY)
+
+
+def bump_shipping_quote_version():
+    """
+    Invalidate all cached shipping quotes
+    """
+    bump_cache_version(SHIPPING_QUOTE_VERSION_CACHE_KEY)
+
+
+def get_shipping_quote_key(basket, method_code, shipping_addr=None):
+    """
+    Return the key under which the charge of a shipping method for the
+    passed basket and shipping address is cached.
+
+    The key is built from the basket's content fingerprint, the address, the
+    version of the shipping quotes and the version of the offers, so quotes
+    are recalculated when a line, the address, a shipping method, a product
+    attribute or an offer changes. Offers matter as charges can depend on the
+    discounted basket total (eg free shipping thresholds).
+    """
+    address = shipping_addr.summary if shipping_addr is not None else ''
+    key = u'%s|%s|%s|%s|%s|%s' % (
+        get_shipping_quote_version(), get_offer_version(), basket.id,
+        basket.get_content_fingerprint(), force_text(address), method_code)
+    return 'oscar_shipping_quote_%s' % hashlib.sha1(
+        key.encode('utf8')).hexdigest()
+
+
+class WeightBandCache(object):
+    """
+    Process-local cache of the band tables of weight-based shipping methods.
+
+    A band table is a list of ``(upper_limit, charge)`` tuples, sorted by
+    upper limit. The cache is tied to the weight band version, which is bumped
+    whenever a band is saved or deleted. As a safety net, entries also expire
+    after ``OSCAR_SHIPPING_BAND_CACHE_TIMEOUT`` seconds.
+    """
+
+    def __init__(self):
+        # Method ID -> (version, expiry timestamp, band table)
+        self._entries = {}
+
+    def clear(self):
+        self._entries = {}
+
+    def get_band_table(self, method):
+        timeout = getattr(settings, 'OSCAR_SHIPPING_BAND_CACHE_TIMEOUT', 0)
+        if not timeout or method.pk is None:
+            return self.load_band_table(method)
+        version = get_weight_band_version()
+        entry = self._entries.get(method.pk)
+        if entry is None or entry[0] != version or entry[1] < time.time():
+            entry = (version, time.time() + timeout,
+                     self.load_band_table(method))
+            self._entries[method.pk] = entry
+        return entry[2]
+
+    def load_band_table(self, method):
+        if method.pk is None:
+            return []
+        return list(method.bands.order_by('upper_limit').values_list(
+            'upper_limit', 'charge'))
+
+
+weight_band_cache = WeightBandCache()
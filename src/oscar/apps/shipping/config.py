@@ -6,3 +6,6 @@ class ShippingConfig(AppConfig):
     label = 'shipping'
     name = 'oscar.apps.shipping'
     verbose_name = _('Shipping')
+
+    def ready(self):
+        from . import receivers  # noqa
@@ -1,8 +1,13 @@
 from decimal import Decimal as D
 
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 
 from oscar.core import prices
+from oscar.core.loading import get_class
+
+get_shipping_quote_key = get_class(
+    'shipping.cache', 'get_shipping_quote_key')
 
 
 class Base(object):
@@ -176,3 +181,56 @@ class TaxInclusiveOfferDiscount(OfferDiscount):
     def discount(self, basket):
         base_charge = self.method.calculate(basket)
         return self.offer.shipping_discount(base_charge.incl_tax)
+
+
+class CachedQuote(Base):
+    """
+    Wrapper class that caches the charges of an existing shipping method in
+    the cache backend, keyed by the basket's contents and the shipping
+    address (see ``get_shipping_quote_key``).
+
+    Attributes that aren't part of the shipping method interface are
+    forwarded to the wrapped method.
+    """
+
+    def __init__(self, method, shipping_addr=None, timeout=None):
+        self.method = method
+        self.shipping_addr = shipping_addr
+        self.timeout = timeout
+
+    def __getattr__(self, name):
+        if name == 'method':
+            # Not set yet, eg while unpickling
+            raise AttributeError(name)
+        return getattr(self.method, name)
+
+    # Forwarded properties
+
+    @property
+    def code(self):
+        return self.method.code
+
+    @property
+    def name(self):
+        return self.method.name
+
+    @property
+    def description(self):
+        return self.method.description
+
+    @property
+    def is_discounted(self):
+        return self.method.is_discounted
+
+    def calculate(self, basket):
+        if not basket.id:
+            return self.method.calculate(basket)
+        key = get_shipping_quote_key(basket, self.code, self.shipping_addr)
+        charge = cache.get(key)
+        if charge is None:
+            charge = self.method.calculate(basket)
+            cache.set(key, charge, self.timeout)
+        return charge
+
+    def discount(self, basket):
+        return self.method.discount(basket)
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from oscar.apps.shipping.cache import (
+    bump_shipping_quote_version, bump_weight_band_version)
+from oscar.core.loading import get_model
+
+OrderAndItemCharges = get_model('shipping', 'OrderAndItemCharges')
+WeightBased = get_model('shipping', 'WeightBased')
+WeightBand = get_model('shipping', 'WeightBand')
+ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+
+# Changes to these models change the charges of shipping methods
+SHIPPING_MODELS = (OrderAndItemCharges, WeightBased, WeightBand)
+
+
+@receiver(post_save, sender=WeightBand)
+@receiver(post_delete, sender=WeightBand)
+@receiver(post_delete, sender=WeightBased)
+def invalidate_weight_bands(sender, **kwargs):
+    bump_weight_band_version()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_shipping_quotes(sender, **kwargs):
+    if (getattr(settings, 'OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT', 0) and
+            issubclass(sender, SHIPPING_MODELS)):
+        bump_shipping_quote_version()
+
+
+@receiver(post_save, sender=ProductAttributeValue)
+@receiver(post_delete, sender=ProductAttributeValue)
+def invalidate_shipping_quotes_for_attribute(sender, **kwargs):
+    """
+    Invalidate the cached shipping quotes when a product attribute changes,
+    as charges can depend on them (eg weights)
+    """
+    if getattr(settings, 'OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT', 0):
+        bump_shipping_quote_version()
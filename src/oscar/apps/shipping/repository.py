@@ -1,5 +1,6 @@
 from decimal import Decimal as D
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import ugettext_lazy as _
 
@@ -31,6 +32,7 @@ class Repository(object):
 
         methods = self.get_available_shipping_methods(
             basket=basket, shipping_addr=shipping_addr, **kwargs)
+        methods = self.get_cached_quotes(basket, methods, shipping_addr)
         if basket.has_shipping_discounts:
             methods = self.apply_shipping_offers(basket, methods)
         return methods
@@ -60,6 +62,21 @@ class Repository(object):
         """
         return self.methods
 
+    def get_cached_quotes(self, basket, methods, shipping_addr=None):
+        """
+        Wrap the passed methods so that their charges are cached, if
+        ``OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT`` is set.
+
+        The charges are cached for the basket's contents and the shipping
+        address, so they are only calculated again when the basket or the
+        address change.
+        """
+        timeout = getattr(settings, 'OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT', 0)
+        if not timeout or not basket.id:
+            return methods
+        return [shipping_methods.CachedQuote(method, shipping_addr, timeout)
+                for method in methods]
+
     def apply_shipping_offers(self, basket, methods):
         """
         Apply shipping offers to the passed set of methods
@@ -1,5 +1,6 @@
 from decimal import Decimal as D
-from django.core.exceptions import ObjectDoesNotExist
+
+from oscar.core.loading import get_model
 
 
 class Scale(object):
@@ -11,29 +12,55 @@ class Scale(object):
         self.default_weight = default_weight
 
     def weigh_product(self, product):
-        weight = None
-        try:
-            weight = product.attribute_values.get(
-                attribute__code=self.attribute).value
-        except ObjectDoesNotExist:
-            if product.parent:
-                try:
-                    weight = product.parent.attribute_values.get(
-                        attribute__code=self.attribute).value
-                except ObjectDoesNotExist:
-                    pass
-
-        if weight is None:
-            if self.default_weight is None:
-                raise ValueError(
-                    "No attribute %s found for product %s" % (
-                        self.attribute, product))
-            weight = self.default_weight
-
-        return D(weight) if weight is not None else D('0.0')
+        return self.weigh_products([product])[product.id]
+
+    def weigh_products(self, products):
+        """
+        Return the weights of the passed products, keyed by product ID.
+
+        The weights of the products and their parents are read with a single
+        query.
+        """
+        products = list(products)
+        product_ids = set()
+        for product in products:
+            product_ids.add(product.id)
+            if product.parent_id:
+                product_ids.add(product.parent_id)
+        weights = self.get_attribute_weights(product_ids)
+
+        product_weights = {}
+        for product in products:
+            weight = weights.get(product.id)
+            if weight is None:
+                weight = weights.get(product.parent_id)
+            if weight is None:
+                if self.default_weight is None:
+                    raise ValueError(
+                        "No attribute %s found for product %s" % (
+                            self.attribute, product))
+                weight = self.default_weight
+            product_weights[product.id] = (
+                D(weight) if weight is not None else D('0.0'))
+        return product_weights
+
+    def get_attribute_weights(self, product_ids):
+        """
+        Return the weight attribute values of the passed products, keyed by
+        product ID
+        """
+        if not product_ids:
+            return {}
+        ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+        values = ProductAttributeValue._default_manager.filter(
+            product_id__in=product_ids,
+            attribute__code=self.attribute).select_related('attribute')
+        return dict((value.product_id, value.value) for value in values)
 
     def weigh_basket(self, basket):
+        lines = list(basket.all_lines())
+        weights = self.weigh_products(line.product for line in lines)
         weight = D('0.0')
-        for line in basket.lines.all():
-            weight += self.weigh_product(line.product) * line.quantity
+        for line in lines:
+            weight += weights[line.product_id] * line.quantity
         return weight
@@ -1,7 +1,57 @@
+from django.utils.functional import cached_property
+
 from oscar.core.loading import feature_hidden
 from oscar.views.decorators import permissions_required
 
 
+class LazyURLConf(object):
+    """
+    A URLconf whose patterns are built by an application the first time they
+    are accessed.
+
+    Django's URL resolvers only access the patterns of an included URLconf
+    when a URL under its prefix is resolved, or when reversing a URL needs
+    them. Decorators that a parent application wraps around the patterns are
+    applied once they are built.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.post_processors = []
+
+    @property
+    def is_loaded(self):
+        return 'urlpatterns' in self.__dict__
+
+    @cached_property
+    def urlpatterns(self):
+        urlpatterns = self.application.get_urls()
+        for post_process in self.post_processors:
+            urlpatterns = post_process(urlpatterns)
+        return urlpatterns
+
+    def add_post_processor(self, post_process):
+        self.post_processors.append(post_process)
+        if self.is_loaded:
+            self.__dict__['urlpatterns'] = post_process(self.urlpatterns)
+
+
+def lazy_include(application, namespace=None, app_name=None):
+    """
+    Include the URLs of an application without building them.
+
+    The application's ``get_urls`` is only called when a URL under the prefix
+    is first resolved, so the application can be a ``SimpleLazyObject`` that
+    only imports it then. The result has to be passed to ``url`` directly, as
+    Django's ``include`` accesses the patterns straight away::
+
+        url(r'^orders/', lazy_include(self.orders_app))
+
+    As the application isn't loaded, its namespace has to be passed.
+    """
+    return LazyURLConf(application), app_name, namespace
+
+
 class Application(object):
     """
     Base application class.
@@ -58,7 +108,11 @@ class Application(object):
             return []
 
         for pattern in urlpatterns:
-            if hasattr(pattern, 'url_patterns'):
+            urlconf = getattr(pattern, 'urlconf_name', None)
+            if isinstance(urlconf, LazyURLConf):
+                # Decorate the lazily included patterns once they're built
+                urlconf.add_post_processor(self.post_process_urls)
+            elif hasattr(pattern, 'url_patterns'):
                 self.post_process_urls(pattern.url_patterns)
             if not hasattr(pattern, '_callback'):
                 continue
@@ -0,0 +1,35 @@
+from __future__ import absolute_import  # for django.core.cache import below
+
+import time
+
+from django.core.cache import cache
+
+
+def get_cache_version(key):
+    """
+    Return the version number stored under the given cache key.
+
+    Version numbers are used to invalidate groups of cached data at once:
+    they are included in cache keys (or compared against process-local
+    caches) and bumped whenever the underlying data changes.  If the version
+    has been evicted, it is re-seeded with a timestamp so that it can't
+    collide with a version that has been seen before.
+    """
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time() * 1000)
+        # Don't clobber a value set by another process in the meantime
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_cache_version(key):
+    """
+    Bump the version number stored under the given cache key
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key isn't set; seeding it is as good as bumping it
+        get_cache_version(key)
@@ -69,6 +69,21 @@ def existing_user_fields(fields):
     return [field for field in fields if field in user_field_names]
 
 
+try:
+    # Django 1.10+
+    from django.db.models import prefetch_related_objects
+except ImportError:
+    from django.db.models.query import \
+        prefetch_related_objects as _prefetch_related_objects
+
+    def prefetch_related_objects(model_instances, *related_lookups):
+        """
+        Prefetch the given lookups on an iterable of model instances, using
+        the signature of the public function that Django 1.10 introduced.
+        """
+        return _prefetch_related_objects(model_instances, related_lookups)
+
+
 # Python3 compatibility layer
 
 """
@@ -1,4 +1,5 @@
 import sys
+import time
 import traceback
 from importlib import import_module
 
@@ -6,6 +7,9 @@ from django.apps import apps
 from django.apps.config import MODELS_MODULE_NAME
 from django.conf import settings
 from django.core.exceptions import AppRegistryNotReady
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import SimpleLazyObject
 
 from oscar.core.exceptions import (
     AppNotFoundError, ClassNotFoundError, ModuleNotFoundError)
@@ -29,6 +33,17 @@ def get_class(module_label, classname):
     return get_classes(module_label, [classname])[0]
 
 
+def get_class_lazily(module_label, classname):
+    """
+    Return a proxy that only imports the object with `get_class` when one of
+    its attributes is first accessed.
+
+    The proxy forwards attribute access but can't be called, so it's meant for
+    instances like an app's `application` rather than for classes.
+    """
+    return SimpleLazyObject(lambda: get_class(module_label, classname))
+
+
 def get_classes(module_label, classnames):
     """
     Dynamically import a list of classes from the given module.
@@ -71,7 +86,89 @@ def get_classes(module_label, classnames):
 
         ImportError: If the attempted import of a class raises an
             ``ImportError``, it is re-raised
+
+    Once the app registry is ready, resolved classes are memoised, so later
+    lookups don't walk ``INSTALLED_APPS`` or import anything. If
+    ``OSCAR_PROFILE_CLASS_LOADING`` is set, the time spent in this function
+    is recorded (see ``get_class_loading_stats``).
+    """
+    profile = getattr(settings, 'OSCAR_PROFILE_CLASS_LOADING', False)
+    if profile:
+        start = time.time()
+
+    keys = [(module_label, classname) for classname in classnames]
+    try:
+        classes = [_class_cache[key] for key in keys]
+        cached = True
+    except KeyError:
+        cached = False
+        _class_loading_depth[0] += 1
+        try:
+            classes = _load_classes(module_label, classnames)
+        finally:
+            _class_loading_depth[0] -= 1
+        # Classes resolved while the registry is being populated could come
+        # from partially imported modules, so we don't memoise those.
+        if apps.ready:
+            _class_cache.update(zip(keys, classes))
+
+    if profile:
+        _record_class_loading(module_label, cached, time.time() - start)
+    return classes
+
+
+# Resolved classes, keyed by (module label, class name)
+_class_cache = {}
+
+
+@receiver(setting_changed)
+def clear_class_cache(setting, **kwargs):
+    """
+    Clear the memoised classes when the installed apps change
+    """
+    if setting == 'INSTALLED_APPS':
+        _class_cache.clear()
+
+
+# {module label: [number of calls, number of memoised lookups, seconds]}
+_class_loading_stats = {}
+# Total seconds spent in outermost calls (importing a module usually loads
+# further classes), and the nesting level of the current call
+_class_loading_total = [0.0]
+_class_loading_depth = [0]
+
+
+def _record_class_loading(module_label, cached, duration):
+    stats = _class_loading_stats.setdefault(module_label, [0, 0, 0.0])
+    stats[0] += 1
+    stats[1] += int(cached)
+    stats[2] += duration
+    if _class_loading_depth[0] == 0:
+        _class_loading_total[0] += duration
+
+
+def get_class_loading_stats():
+    """
+    Return the statistics recorded while ``OSCAR_PROFILE_CLASS_LOADING`` is
+    set.
+
+    Returns:
+        A tuple of the total number of seconds spent loading classes, and a
+        dict mapping module labels to tuples of the number of calls, the
+        number of memoised lookups and the seconds spent loading classes
+        from the module (including classes loaded while importing it).
     """
+    return _class_loading_total[0], dict(
+        (label, tuple(stats))
+        for label, stats in _class_loading_stats.items())
+
+
+def reset_class_loading_stats():
+    _class_loading_stats.clear()
+    _class_loading_total[0] = 0.0
+
+
+def _load_classes(module_label, classnames):
     if '.' not in module_label:
         # Importing from top-level modules is not supported, e.g.
         # get_class('shipping', 'Scale'). That should be easy to fix,
@@ -0,0 +1,288 @@
+import base64
+import datetime
+import decimal
+import json
+import re
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils import six
+from django.utils.encoding import force_bytes, force_text
+from django.utils.functional import cached_property
+from django.utils.translation import ugettext_lazy as _
+
+SEEK_TOKEN_RE = re.compile(r'^(?P<number>\d+)\.(?P<direction>[np])\.'
+                           r'(?P<values>[A-Za-z0-9_=-]+)$')
+
+
+class KeysetPage(Page):
+    """
+    A page of a ``KeysetPaginator``.
+
+    The next and previous "page numbers" are seek tokens that hold the sort
+    keys of the last and first object of the page, and can be passed to
+    ``KeysetPaginator.page`` like page numbers.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next=None,
+                 has_previous=None):
+        super(KeysetPage, self).__init__(object_list, number, paginator)
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def has_next(self):
+        if self._has_next is None:
+            return super(KeysetPage, self).has_next()
+        return self._has_next
+
+    def has_previous(self):
+        if self._has_previous is None:
+            return super(KeysetPage, self).has_previous()
+        return self._has_previous
+
+    def next_page_number(self):
+        if not self.has_next():
+            raise EmptyPage(_('That page contains no results'))
+        return self.paginator.get_token(
+            self.number + 1, 'n', self.object_list[len(self.object_list) - 1])
+
+    def previous_page_number(self):
+        if not self.has_previous():
+            raise EmptyPage(_('That page number is less than 1'))
+        if self.number == 2:
+            return 1
+        return self.paginator.get_token(
+            self.number - 1, 'p', self.object_list[0])
+
+
+class KeysetPaginator(Paginator):
+    """
+    A paginator that seeks to the next or previous page from the sort keys of
+    the current one, rather than skipping the preceding rows with an offset.
+
+    Offset pagination reads (and throws away) all the rows before the
+    requested page, so deep pages of large tables get progressively slower.
+    Seeking with ``WHERE (date_placed, id) < (%s, %s)`` lets the database
+    start reading at the right place of an index instead.
+
+    Integer page numbers still work as with Django's paginator, so that pages
+    can be jumped to, but the next and previous pages of a page are addressed
+    by seek tokens (see ``KeysetPage``). The queryset is ordered by
+    ``ordering`` (its own ordering by default) and its primary key. None of
+    the ordering fields may be null; objects with null sort keys are linked to
+    by page number instead.
+
+    :param estimate_count: Whether to use the query planner's estimate of
+                           the number of objects rather than counting them.
+                           This is only supported on PostgreSQL, and the
+                           objects are still counted if there are fewer than
+                           ``exact_count_threshold``.
+    """
+    page_class = KeysetPage
+    exact_count_threshold = 10000
+
+    def __init__(self, object_list, per_page, ordering=None,
+                 estimate_count=False, **kwargs):
+        self.estimate_count = estimate_count
+        self.count_is_estimated = False
+        self.ordering = self.get_ordering(object_list, ordering)
+        super(KeysetPaginator, self).__init__(
+            object_list.order_by(*self.ordering), per_page, **kwargs)
+
+    def get_ordering(self, queryset, ordering=None):
+        if ordering is None:
+            ordering = (queryset.query.order_by or
+                        queryset.model._meta.ordering)
+        ordering = [field for field in ordering if field.lstrip('-') != '?']
+        pk_names = ('pk', 'id', queryset.model._meta.pk.name)
+        if not any(field.lstrip('-') in pk_names for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith('-')
+            ordering.append('-pk' if descending else 'pk')
+        return ordering
+
+    @cached_property
+    def key_fields(self):
+        """
+        The model fields of the ordering, as (lookup, field, descending)
+        """
+        fields = []
+        for field in self.ordering:
+            lookup = field.lstrip('-')
+            fields.append((lookup, self.get_field(lookup),
+                           field.startswith('-')))
+        return fields
+
+    def get_field(self, lookup):
+        model = self.object_list.model
+        field = None
+        for name in lookup.split('__'):
+            if field is not None:
+                model = field.rel.to
+            if name == 'pk':
+                field = model._meta.pk
+            else:
+                field = model._meta.get_field(name)
+        return field
+
+    # Counting
+
+    @cached_property
+    def count(self):
+        if self.estimate_count:
+            estimate = self.get_estimated_count()
+            if estimate is not None and estimate >= self.exact_count_threshold:
+                self.count_is_estimated = True
+                return estimate
+        return super(KeysetPaginator, self).count
+
+    def get_estimated_count(self):
+        """
+        Return the query planner's estimate of the number of objects, or
+        None if the database doesn't provide one
+        """
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        sql, params = self.object_list.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) %s' % sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, six.string_types):
+            plan = json.loads(plan)
+        return plan[0]['Plan']['Plan Rows']
+
+    def _get_page(self, *args, **kwargs):
+        return self.page_class(*args, **kwargs)
+
+    # Seeking
+
+    def page(self, number):
+        """
+        Return the page with the passed number or seek token
+        """
+        match = SEEK_TOKEN_RE.match(force_text(number))
+        if match is None:
+            if number == 'last':
+                number = self.num_pages
+            number = self.validate_number(number)
+            bottom = (number - 1) * self.per_page
+            top = bottom + self.per_page
+            if top + self.orphans >= self.count:
+                top = self.count
+            return self._get_page(self.object_list[bottom:top], number, self)
+        try:
+            values = self.decode_values(match.group('values'))
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page token is invalid'))
+        number = int(match.group('number'))
+        if match.group('direction') == 'n':
+            return self.seek(number, values, forwards=True)
+        return self.seek(number, values, forwards=False)
+
+    def seek(self, number, values, forwards=True):
+        ordering = self.ordering
+        if not forwards:
+            ordering = [self.reverse_ordering(field) for field in ordering]
+        queryset = self.object_list.filter(
+            self.get_seek_filter(values, forwards)).order_by(*ordering)
+        object_list = list(queryset[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if not object_list:
+            raise EmptyPage(_('That page contains no results'))
+        if forwards:
+            return self._get_page(object_list, number, self,
+                                  has_next=has_more, has_previous=True)
+        object_list.reverse()
+        return self._get_page(object_list, number, self, has_next=True,
+                              has_previous=has_more and number > 1)
+
+    def reverse_ordering(self, field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    def get_seek_filter(self, values, forwards=True):
+        """
+        Return the filter for the objects after (or before) the passed keys,
+        eg ``Q(date_placed__lt=d) | Q(date_placed=d, pk__lt=i)``
+        """
+        if len(values) != len(self.key_fields):
+            raise PageNotAnInteger(_('That page token is invalid'))
+        condition = Q()
+        for i, (lookup, field, descending) in enumerate(self.key_fields):
+            operator = 'lt' if descending == forwards else 'gt'
+            kwargs = dict(
+                (self.key_fields[j][0], values[j]) for j in range(i))
+            kwargs['%s__%s' % (lookup, operator)] = values[i]
+            condition |= Q(**kwargs)
+        return condition
+
+    # Tokens
+
+    def get_keys(self, obj):
+        keys = []
+        for lookup, field, descending in self.key_fields:
+            if isinstance(obj, dict):
+                # Rows of values() querysets
+                if lookup not in obj and field.primary_key:
+                    lookup = field.attname
+                keys.append(obj[lookup])
+                continue
+            value = obj
+            for name in lookup.split('__'):
+                value = getattr(value, name, None)
+            keys.append(value)
+        return keys
+
+    def get_token(self, number, direction, obj):
+        keys = self.get_keys(obj)
+        if any(key is None for key in keys):
+            return number
+        return '%d.%s.%s' % (number, direction, self.encode_values(keys))
+
+    def encode_values(self, values):
+        values = [self.serialise_value(value) for value in values]
+        return force_text(base64.urlsafe_b64encode(
+            force_bytes(json.dumps(values, separators=(',', ':')))))
+
+    def decode_values(self, encoded):
+        values = json.loads(force_text(base64.urlsafe_b64decode(
+            force_bytes(encoded))))
+        if not isinstance(values, list):
+            raise ValueError("Invalid token")
+        try:
+            return [field.to_python(value) for value, (__, field, __)
+                    in zip(values, self.key_fields)]
+        except Exception:
+            raise ValueError("Invalid token")
+
+    def serialise_value(self, value):
+        if isinstance(value, (datetime.date, datetime.time)):
+            # Unlike DjangoJSONEncoder, this keeps the microseconds
+            return value.isoformat()
+        if isinstance(value, decimal.Decimal):
+            return str(value)
+        if hasattr(value, 'pk'):
+            return value.pk
+        return value
+
+
+class KeysetTablePaginator(KeysetPaginator):
+    """
+    A ``KeysetPaginator`` for django-tables2 tables, which paginate their
+    rows rather than a queryset. Pass it as ``klass`` of the table's
+    pagination options.
+    """
+
+    def __init__(self, rows, per_page, **kwargs):
+        self.rows = rows
+        super(KeysetTablePaginator, self).__init__(
+            rows.data.queryset, per_page, **kwargs)
+
+    def _get_page(self, object_list, *args, **kwargs):
+        object_list = type(self.rows)(list(object_list), table=self.rows.table)
+        return super(KeysetTablePaginator, self)._get_page(
+            object_list, *args, **kwargs)
+
+    def get_keys(self, row):
+        return super(KeysetTablePaginator, self).get_keys(row.record)
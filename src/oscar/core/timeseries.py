@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.utils import typecast_timestamp
+from django.utils import six, timezone
+
+PERIODS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+}
+
+
+def get_period_start(value, period='hour'):
+    """
+    Return the start of the hour or day of a datetime, as a naive datetime in
+    the current time zone
+    """
+    if settings.USE_TZ and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    value = value.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    if period == 'day':
+        value = value.replace(hour=0)
+    return value
+
+
+def make_aware(value):
+    """
+    Make a naive datetime of the current time zone aware if time zone
+    support is active
+    """
+    if not settings.USE_TZ:
+        return value
+    tz = timezone.get_current_timezone()
+    if hasattr(tz, 'localize'):
+        # Unlike make_aware, pytz doesn't raise for times that are ambiguous
+        # or don't exist because of DST changes
+        return tz.localize(value)
+    return timezone.make_aware(value, tz)
+
+
+def aggregate_by_period(queryset, field_name, start, end, period='hour',
+                        default=0, **aggregates):
+    """
+    Aggregate the objects of a queryset by the hour or day of a datetime
+    field, with a single ``GROUP BY`` query.
+
+    Returns a list with a dictionary for every period between *start* and
+    *end*, holding its ``start`` and ``end`` and the values of the
+    *aggregates*. Empty values are replaced by *default*, which can also be a
+    dictionary of defaults by aggregate name. Periods are in the current time
+    zone, so that days start at midnight of the site's time zone. For
+    example::
+
+        aggregate_by_period(
+            Order.objects.all(), 'date_placed', now() - timedelta(days=7),
+            now(), period='day', default=D('0.00'),
+            total=Sum('total_incl_tax'))
+    """
+    if period not in PERIODS:
+        raise ValueError("Unsupported period: %s" % period)
+    connection = connections[queryset.db]
+    opts = queryset.model._meta
+    column = '%s.%s' % (connection.ops.quote_name(opts.db_table),
+                        connection.ops.quote_name(
+                            opts.get_field(field_name).column))
+    tzname = timezone.get_current_timezone_name() if settings.USE_TZ else None
+    sql, params = connection.ops.datetime_trunc_sql(period, column, tzname)
+
+    rows = queryset.filter(**{
+        '%s__gte' % field_name: start,
+        '%s__lt' % field_name: end,
+    }).order_by().extra(
+        select={'period_start': sql}, select_params=params,
+    ).values('period_start').annotate(**aggregates)
+
+    if not isinstance(default, dict):
+        default = dict((name, default) for name in aggregates)
+
+    values = {}
+    for row in rows:
+        period_start = row.pop('period_start')
+        if isinstance(period_start, six.string_types):
+            # SQLite returns strings
+            period_start = typecast_timestamp(period_start)
+        values[period_start.replace(tzinfo=None)] = row
+
+    periods = []
+    period_start = get_period_start(start, period)
+    while make_aware(period_start) < end:
+        period_end = period_start + PERIODS[period]
+        row = values.get(period_start, {})
+        data = dict((name, default.get(name) if row.get(name) is None
+                     else row[name]) for name in aggregates)
+        data['start'] = make_aware(period_start)
+        data['end'] = make_aware(period_end)
+        periods.append(data)
+        period_start = period_end
+    return periods
@@ -4,6 +4,7 @@ import datetime
 import logging
 
 from django.conf import settings
+from django.db.models.query import QuerySet
 from django.shortcuts import redirect, resolve_url
 from django.template.defaultfilters import date as date_filter
 from django.template.defaultfilters import slugify as django_slugify
@@ -128,3 +129,72 @@ def get_default_currency():
     OSCAR_DEFAULT_CURRENCY as something it needs to generate a migration for.
     """
     return settings.OSCAR_DEFAULT_CURRENCY
+
+
+def chunked(objects, chunk_size=500):
+    """
+    Yield the given objects in lists of up to ``chunk_size`` objects.
+
+    Querysets are fetched chunk by chunk, so that only one chunk is held in
+    memory. Querysets ordered by their primary key (or not at all) are
+    paginated by keyset, ie by filtering on the last primary key, which stays
+    fast for late chunks (unlike OFFSET). For other orderings, the primary keys
+    are fetched up front and each chunk is loaded by primary key. Either way,
+    ``select_related`` and ``prefetch_related`` are applied to each chunk.
+    """
+    if not isinstance(objects, QuerySet) or not objects.query.can_filter():
+        return _chunk_iterable(objects, chunk_size)
+
+    ordering = list(objects.query.order_by)
+    if not ordering and objects.query.default_ordering:
+        ordering = list(objects.model._meta.ordering)
+    pk_name = objects.model._meta.pk.name
+    if ordering in ([], ['pk'], [pk_name]):
+        return _chunk_by_keyset(objects, chunk_size)
+    if ordering in (['-pk'], ['-%s' % pk_name]):
+        return _chunk_by_keyset(objects, chunk_size, descending=True)
+    return _chunk_by_pk_list(objects, chunk_size)
+
+
+def _chunk_iterable(objects, chunk_size):
+    chunk = []
+    for obj in objects:
+        chunk.append(obj)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _chunk_by_keyset(queryset, chunk_size, descending=False):
+    """
+    Yield chunks of a queryset ordered by primary key, filtering on the last
+    primary key of the previous chunk
+    """
+    queryset = queryset.order_by('-pk' if descending else 'pk')
+    lookup = 'pk__lt' if descending else 'pk__gt'
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        yield chunk
+        if len(chunk) < chunk_size:
+            break
+        chunk = list(queryset.filter(**{lookup: chunk[-1].pk})[:chunk_size])
+
+
+def _chunk_by_pk_list(queryset, chunk_size):
+    """
+    Yield chunks of a queryset in its own ordering, loading each chunk by the
+    primary keys fetched up front
+    """
+    # Orderings across relations can return a primary key more than once
+    pks, seen = [], set()
+    for pk in queryset.values_list('pk', flat=True):
+        if pk not in seen:
+            seen.add(pk)
+            pks.append(pk)
+    for start in range(0, len(pks), chunk_size):
+        chunk_pks = pks[start:start + chunk_size]
+        positions = dict((pk, i) for i, pk in enumerate(chunk_pks))
+        chunk = queryset.filter(pk__in=chunk_pks)
+        yield sorted(chunk, key=lambda obj: positions[obj.pk])
@@ -12,6 +12,9 @@ OSCAR_BASKET_COOKIE_LIFETIME = 7 * 24 * 60 * 60
 OSCAR_BASKET_COOKIE_OPEN = 'oscar_open_basket'
 OSCAR_BASKET_COOKIE_SECURE = False
 OSCAR_MAX_BASKET_QUANTITY_THRESHOLD = 10000
+# Set to a number of seconds to cache the summaries of the baskets shown in
+# the page header. A value of 0 disables the cache.
+OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT = 0
 
 # Recently-viewed products
 OSCAR_RECENTLY_VIEWED_COOKIE_LIFETIME = 7 * 24 * 60 * 60
@@ -22,6 +25,10 @@ OSCAR_RECENTLY_VIEWED_PRODUCTS = 20
 # Currency
 OSCAR_DEFAULT_CURRENCY = 'GBP'
 
+# Set to record the time spent loading classes with get_class (see the
+# oscar_class_loading_report command)
+OSCAR_PROFILE_CLASS_LOADING = False
+
 # Paths
 OSCAR_IMAGE_FOLDER = 'images/products/%Y/%m/'
 OSCAR_PROMOTION_FOLDER = 'images/promotions/'
@@ -47,10 +54,32 @@ OSCAR_ORDERS_PER_PAGE = 20
 OSCAR_ADDRESSES_PER_PAGE = 20
 OSCAR_STOCK_ALERTS_PER_PAGE = 20
 OSCAR_DASHBOARD_ITEMS_PER_PAGE = 20
+# Whether to paginate product lists and the dashboard's order, product and
+# user lists with seek tokens rather than offsets
+OSCAR_KEYSET_PAGINATION = False
+# Whether keyset pagination uses the query planner's estimate of the number
+# of results rather than counting them (PostgreSQL only)
+OSCAR_PAGINATION_ESTIMATE_COUNT = False
 
 # Checkout
 OSCAR_ALLOW_ANON_CHECKOUT = False
 
+# Shipping
+# Set to a number of seconds to keep the band tables of weight-based shipping
+# methods in a process-local cache. The cache is invalidated whenever a band
+# changes; the timeout is only a safety net. A value of 0 disables the cache.
+OSCAR_SHIPPING_BAND_CACHE_TIMEOUT = 0
+# Set to a number of seconds to cache the charges of shipping methods, keyed
+# on the basket contents and shipping address. A value of 0 disables the
+# cache.
+OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT = 0
+
+# Orders
+OSCAR_BULK_ORDER_PLACEMENT = False
+
+# Partner
+OSCAR_STOCK_RESERVATION_TIMEOUT = 15 * 60
+
 # Promotions
 COUNTDOWN, LIST, SINGLE_PRODUCT, TABBED_BLOCK = (
     'Countdown', 'List', 'SingleProduct', 'TabbedBlock')
@@ -63,6 +92,29 @@ OSCAR_PROMOTION_MERCHANDISING_BLOCK_TYPES = (
 OSCAR_PROMOTION_POSITIONS = (('page', 'Page'),
                              ('right', 'Right-hand sidebar'),
                              ('left', 'Left-hand sidebar'))
+# Set to a number of seconds to cache the promotions of each page. A value of
+# 0 disables the cache.
+OSCAR_PROMOTIONS_CACHE_TIMEOUT = 0
+
+# Catalogue
+# Set to a number of seconds to cache the annotated category trees used for
+# navigation. A value of 0 disables the cache.
+OSCAR_CATEGORY_TREE_CACHE_TIMEOUT = 0
+# Set to a number of seconds to render product lists from cached product
+# cards. A value of 0 disables the cards.
+OSCAR_PRODUCT_CARD_CACHE_TIMEOUT = 0
+
+# Offers
+# Set to a number of seconds to keep the site offers in a process-local
+# cache. The cache is invalidated whenever an offer changes; the timeout is
+# only a safety net. A value of 0 disables the cache.
+OSCAR_SITE_OFFER_CACHE_TIMEOUT = 0
+# Set to a number of seconds to store an index of the products in each range
+# in the cache backend. A value of 0 disables the index.
+OSCAR_RANGE_INDEX_CACHE_TIMEOUT = 0
+# Set to a number of seconds to cache the result of applying offers to a
+# basket, keyed on the basket contents. A value of 0 disables the cache.
+OSCAR_BASKET_PRICING_CACHE_TIMEOUT = 0
 
 # Reviews
 OSCAR_ALLOW_ANON_REVIEWS = True
@@ -91,6 +143,11 @@ OSCAR_SLUG_BLACKLIST = []
 # Cookies
 OSCAR_COOKIES_DELETE_ON_LOGOUT = ['oscar_recently_viewed_products', ]
 
+# Analytics
+# Set to a number of seconds to buffer analytics data in memory and write it
+# in bulk at this interval. A value of 0 records everything immediately.
+OSCAR_ANALYTICS_FLUSH_INTERVAL = 0
+
 # Hidden Oscar features, e.g. wishlists or reviews
 OSCAR_HIDDEN_FEATURES = []
 
@@ -214,6 +271,9 @@ OSCAR_DASHBOARD_NAVIGATION = [
     },
 ]
 OSCAR_DASHBOARD_DEFAULT_ACCESS_FUNCTION = 'oscar.apps.dashboard.nav.default_access_fn'  # noqa
+# Read the order statistics of the dashboard from the hourly records of the
+# analytics app. Run "oscar_rebuild_order_stats" before enabling this.
+OSCAR_DASHBOARD_USE_STATS_RECORDS = False
 
 # Search facets
 OSCAR_SEARCH_FACETS = {
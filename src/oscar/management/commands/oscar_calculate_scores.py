@@ -1,4 +1,5 @@
 import logging
+from optparse import make_option
 
 from django.core.management.base import BaseCommand
 
@@ -12,5 +13,19 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Calculate product scores based on analytics data'
 
+    option_list = BaseCommand.option_list + (
+        make_option('--incremental', action='store_true', dest='incremental',
+                    default=False,
+                    help='Only update scores that are out of date'),
+        make_option('--chunk-size', dest='chunk_size', type='int',
+                    default=None,
+                    help='Update records in chunks of this many IDs'),
+        make_option('--dry-run', action='store_true', dest='dry_run',
+                    default=False,
+                    help='Count and time the records that would be updated '
+                         'without updating them'))
+
     def handle(self, *args, **options):
-        Calculator(logger).run()
+        Calculator(logger, incremental=options.get('incremental'),
+                   chunk_size=options.get('chunk_size'),
+                   dry_run=options.get('dry_run')).run()
@@ -0,0 +1,44 @@
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import get_resolver
+
+from oscar.core.loading import get_class_loading_stats
+
+
+class Command(BaseCommand):
+    """
+    Command to report the time spent in dynamic class loading
+    """
+    help = ("Report the time spent in get_class/get_classes while starting "
+            "up, ie loading the apps and the URLconf. Requires "
+            "OSCAR_PROFILE_CLASS_LOADING to be set.")
+
+    option_list = BaseCommand.option_list + (
+        make_option('--limit', dest='limit', type='int', default=20,
+                    help='Number of module labels to list'),
+    )
+
+    def handle(self, *args, **options):
+        if not getattr(settings, 'OSCAR_PROFILE_CLASS_LOADING', False):
+            raise CommandError(
+                "Set OSCAR_PROFILE_CLASS_LOADING to profile class loading")
+
+        # Loading the URLconf imports the views and forms, as the first
+        # request served by a worker would.
+        get_resolver(None).url_patterns
+
+        total, stats = get_class_loading_stats()
+        num_calls = sum(calls for calls, __, __ in stats.values())
+        num_memoised = sum(memoised for __, memoised, __ in stats.values())
+        self.stdout.write(
+            "%.1fms spent loading classes in %d calls (%d memoised) from %d "
+            "modules" % (total * 1000, num_calls, num_memoised, len(stats)))
+
+        self.stdout.write("\n%-50s %8s %8s %10s" % (
+            "Module", "Calls", "Memoised", "ms"))
+        rows = sorted(stats.items(), key=lambda item: -item[1][2])
+        for label, (calls, memoised, seconds) in rows[:options['limit']]:
+            self.stdout.write("%-50s %8d %8d %10.1f" % (
+                label, calls, memoised, seconds * 1000))
@@ -0,0 +1,21 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from oscar.core.loading import get_class
+
+StockAllocator = get_class('partner.allocation', 'StockAllocator')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to cancel expired stock reservations
+    """
+    help = ("Cancel the stock allocations of expired stock reservations. "
+            "Run this regularly if you reserve stock for baskets.")
+
+    def handle(self, *args, **options):
+        num_expired = StockAllocator().expire_reservations()
+        logger.info("Cancelled %d expired stock reservations", num_expired)
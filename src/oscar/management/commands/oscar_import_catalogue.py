@@ -19,7 +19,14 @@ class Command(BaseCommand):
         make_option('--flush', action='store_true', dest='flush',
                     default=False, help='Flush tables before importing'),
         make_option('--delimiter', dest='delimiter', default=",",
-                    help='Delimiter used within CSV file(s)'))
+                    help='Delimiter used within CSV file(s)'),
+        make_option('--batch-size', dest='batch_size', type='int',
+                    default=None,
+                    help='Import rows in batches of this size, each in its '
+                         'own transaction'),
+        make_option('--offset', dest='offset', type='int', default=0,
+                    help='Number of rows to skip, eg to resume a failed '
+                         'batched import'))
 
     def handle(self, *args, **options):
         if not args:
@@ -28,7 +35,8 @@ class Command(BaseCommand):
         logger.info("Starting catalogue import")
         importer = CatalogueImporter(
             logger, delimiter=options.get('delimiter'),
-            flush=options.get('flush'))
+            flush=options.get('flush'), batch_size=options.get('batch_size'),
+            offset=options.get('offset'))
         for file_path in args:
             logger.info(" - Importing records from '%s'" % file_path)
             try:
@@ -0,0 +1,42 @@
+import logging
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from haystack.constants import DEFAULT_ALIAS
+
+from oscar.core.loading import get_class
+
+ProductIndexQueue = get_class('search.indexing', 'ProductIndexQueue')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to update the search index of the products queued by the
+    ``QueuedSignalProcessor``
+    """
+    help = ("Update the search index of queued products. Runs until it is "
+            "stopped, unless --once is passed.")
+
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', dest='batch_size', type='int',
+                    default=1000,
+                    help='Number of products to index at once'),
+        make_option('--interval', dest='interval', type='float', default=1,
+                    help='Seconds to wait when the queue is empty'),
+        make_option('--once', dest='once', action='store_true',
+                    default=False,
+                    help='Exit once the queue is empty'),
+        make_option('--using', dest='using', default=DEFAULT_ALIAS,
+                    help='The search backend to update'),
+    )
+
+    def handle(self, *args, **options):
+        queue = ProductIndexQueue(using=options['using'], logger=logger)
+        while True:
+            if not queue.process(options['batch_size']):
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
@@ -0,0 +1,28 @@
+import logging
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from oscar.core.loading import get_classes
+
+rebuild_order_records, rebuild_customer_records = get_classes(
+    'analytics.stats', ['rebuild_order_records', 'rebuild_customer_records'])
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = ('Rebuild the hourly order and customer records of the dashboard '
+            'statistics from the order and user tables')
+
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', dest='batch_size', type='int',
+                    default=1000,
+                    help='Read orders and users in batches of this size'),)
+
+    def handle(self, *args, **options):
+        batch_size = options.get('batch_size')
+        num_orders = rebuild_order_records(batch_size)
+        num_customers = rebuild_customer_records(batch_size)
+        self.stdout.write("Rolled up %d orders and %d customers" % (
+            num_orders, num_customers))
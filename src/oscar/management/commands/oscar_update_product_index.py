@@ -0,0 +1,43 @@
+import logging
+from datetime import timedelta
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+from haystack.constants import DEFAULT_ALIAS
+
+from oscar.core.loading import get_class
+
+ProductIndexer = get_class('search.indexing', 'ProductIndexer')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to update the search index of the products
+    """
+    help = ("Update the search index of the products in batches of primary "
+            "key ranges, optionally in several processes")
+
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', dest='batch_size', type='int',
+                    default=1000,
+                    help='Number of products to index at once'),
+        make_option('--workers', dest='workers', type='int', default=0,
+                    help='Number of worker processes to index with'),
+        make_option('--age', dest='age', type='int', default=None,
+                    help='Only index products that (or whose stock records) '
+                         'changed in the last AGE hours'),
+        make_option('--using', dest='using', default=DEFAULT_ALIAS,
+                    help='The search backend to update'),
+    )
+
+    def handle(self, *args, **options):
+        start_date = None
+        if options['age'] is not None:
+            start_date = now() - timedelta(hours=options['age'])
+        ProductIndexer(
+            using=options['using'], batch_size=options['batch_size'],
+            workers=options['workers'], start_date=start_date,
+            logger=logger).run()
@@ -1,9 +1,13 @@
 from django import template
+from django.conf import settings
+from django.core.cache import cache
 
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 
 register = template.Library()
 Category = get_model('catalogue', 'category')
+get_category_tree_version = get_class(
+    'catalogue.categories', 'get_category_tree_version')
 
 
 @register.assignment_tag(name="category_tree")
@@ -11,6 +15,25 @@ def get_annotated_list(depth=None, parent=None):
     """
     Gets an annotated list from a tree branch.
 
+    If OSCAR_CATEGORY_TREE_CACHE_TIMEOUT is set, the annotated list is stored
+    in the cache, keyed on the branch, the depth and the version of the
+    category tree (which is bumped whenever a category changes).
+    """
+    timeout = getattr(settings, 'OSCAR_CATEGORY_TREE_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return build_annotated_list(depth, parent)
+
+    cache_key = 'oscar_category_tree_%s_%s_%s' % (
+        get_category_tree_version(), parent.pk if parent else '', depth)
+    annotated_categories = cache.get(cache_key)
+    if annotated_categories is None:
+        annotated_categories = build_annotated_list(depth, parent)
+        cache.set(cache_key, annotated_categories, timeout)
+    return annotated_categories
+
+
+def build_annotated_list(depth=None, parent=None):
+    """
     Borrows heavily from treebeard's get_annotated_list
     """
     # 'depth' is the backwards-compatible name for the template tag,
@@ -27,13 +50,20 @@ def get_annotated_list(depth=None, parent=None):
     else:
         categories = Category.get_tree()
 
+    if max_depth is not None:
+        categories = categories.filter(depth__lte=max_depth)
+    categories = list(categories)
+    # Templates normally link to the categories, so we precompute the full
+    # slugs (and names) needed for their URLs instead of looking up the
+    # ancestors of each category.
+    Category.set_full_names_and_slugs(
+        categories, parent.get_ancestors_and_self() if parent else None)
+
     info = {}
     for node in categories:
         node_depth = node.get_depth()
         if start_depth is None:
             start_depth = node_depth
-        if max_depth is not None and node_depth > max_depth:
-            continue
 
         # Update previous node's info
         info['has_children'] = prev_depth is None or node_depth > prev_depth
@@ -30,6 +30,10 @@ def ellipses_page_range(page, args="1,2"):
     list(range()) is used for subrange generation because Python3 would return
     generators instead of lists.
 
+    If the paginator only estimated the number of pages (see
+    ``oscar.core.paginator.KeysetPaginator``), the last pages are ellipsed,
+    as they might not exist.
+
     :param page: django's Page object for constructing the range
     :param args: optional arguments separated by ',' -- first is the number of
         pages at borders (N first pages, N last pages); second is the number of
@@ -71,6 +75,10 @@ def ellipses_page_range(page, args="1,2"):
         page_range.append(middle_end)
 
     # last
-    page_range += list(range(last_start, last_end))
+    if getattr(page.paginator, 'count_is_estimated', False):
+        if page_range[-1] is not None and middle_end < last_end:
+            page_range.append(None)
+    else:
+        page_range += list(range(last_start, last_end))
 
     return page_range
@@ -1,6 +1,10 @@
 from django import template
 from django.template.loader import select_template
 
+from oscar.core.loading import get_class
+
+ProductCard = get_class('catalogue.cards', 'ProductCard')
+
 register = template.Library()
 
 
@@ -12,16 +16,25 @@ def render_product(context, product):
     This templatetag looks for different templates depending on the UPC and
     product class of the passed product.  This allows alternative templates to
     be used for different product classes.
+
+    Product cards (see ``catalogue.cards``) are rendered with the
+    ``catalogue/partials/product_card.html`` templates instead.
     """
     if not product:
         # Search index is returning products that don't exist in the
         # database...
         return ''
 
-    names = ['catalogue/partials/product/upc-%s.html' % product.upc,
-             'catalogue/partials/product/class-%s.html'
-             % product.get_product_class().slug,
-             'catalogue/partials/product.html']
+    if isinstance(product, ProductCard):
+        names = ['catalogue/partials/product_card/upc-%s.html' % product.upc,
+                 'catalogue/partials/product_card/class-%s.html'
+                 % product.product_class,
+                 'catalogue/partials/product_card.html']
+    else:
+        names = ['catalogue/partials/product/upc-%s.html' % product.upc,
+                 'catalogue/partials/product/class-%s.html'
+                 % product.get_product_class().slug,
+                 'catalogue/partials/product.html']
     template_ = select_template(names)
     # Ensure the passed product is in the context as 'product'
     context['product'] = product
@@ -1,16 +1,48 @@
 from django import template
 
+from oscar.core.loading import get_class
+
+ProductCard = get_class('catalogue.cards', 'ProductCard')
+
 register = template.Library()
 
 
-@register.assignment_tag
-def purchase_info_for_product(request, product):
+@register.assignment_tag(takes_context=True)
+def purchase_info_for_product(context, request, product):
+    """
+    Return the ``PurchaseInfo`` for a product.
+
+    If the template context contains a ``purchase_infos`` dict (as assigned by
+    ``purchase_info_for_products``), the purchase info is taken from there.
+    """
+    purchase_infos = context.get('purchase_infos')
+    if purchase_infos and product.id in purchase_infos:
+        return purchase_infos[product.id]
+
     if product.is_parent:
         return request.strategy.fetch_for_parent(product)
 
     return request.strategy.fetch_for_product(product)
 
 
+@register.assignment_tag
+def purchase_info_for_products(request, products):
+    """
+    Return a dict of ``PurchaseInfo`` instances for a list of products, keyed
+    by product ID.  Search results are accepted as well; product cards are
+    skipped as they carry their own purchase info.
+
+    Assign the result to ``purchase_infos`` to make
+    ``purchase_info_for_product`` use it::
+
+        {% purchase_info_for_products request products as purchase_infos %}
+    """
+    products = [getattr(product, 'object', product) for product in products]
+    return request.strategy.fetch_for_products(
+        [product for product in products
+         if product is not None and not isinstance(product, ProductCard)])
+
+
 @register.assignment_tag
 def purchase_info_for_line(request, line):
     return request.strategy.fetch_for_line(line)
@@ -2,10 +2,12 @@ import json
 
 import phonenumbers
 from django import forms
+from django.conf import settings
 from django.contrib import messages
 from django.core import validators
 from django.core.exceptions import ValidationError
-from django.http import HttpResponse
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponse
 from django.shortcuts import redirect
 from django.utils import six
 from django.utils.encoding import smart_str
@@ -13,6 +15,7 @@ from django.utils.six.moves import map
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic.base import View
 
+from oscar.core.paginator import KeysetPaginator, KeysetTablePaginator
 from oscar.core.phonenumber import PhoneNumber
 from oscar.core.utils import safe_referrer
 
@@ -93,6 +96,70 @@ class BulkEditMixin(object):
         return self.get_queryset().in_bulk(ids)
 
 
+class KeysetPaginationMixin(object):
+    """
+    Mixin for list views (or anything else built on ``MultipleObjectMixin``)
+    to paginate with a ``KeysetPaginator`` if ``OSCAR_KEYSET_PAGINATION`` is
+    set.
+
+    The page parameter then takes seek tokens as well as page numbers.
+    """
+    #: The ordering to seek on; defaults to the ordering of the queryset
+    keyset_ordering = None
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        if not settings.OSCAR_KEYSET_PAGINATION:
+            return super(KeysetPaginationMixin, self).get_paginator(
+                queryset, per_page, orphans=orphans,
+                allow_empty_first_page=allow_empty_first_page, **kwargs)
+        return KeysetPaginator(
+            queryset, per_page, ordering=self.keyset_ordering,
+            estimate_count=settings.OSCAR_PAGINATION_ESTIMATE_COUNT,
+            orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+            **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        if not settings.OSCAR_KEYSET_PAGINATION:
+            return super(KeysetPaginationMixin, self).paginate_queryset(
+                queryset, page_size)
+        paginator = self.get_paginator(
+            queryset, page_size, orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty())
+        page_kwarg = self.page_kwarg
+        page = (self.kwargs.get(page_kwarg) or
+                self.request.GET.get(page_kwarg) or 1)
+        try:
+            page = paginator.page(page)
+        except InvalidPage as e:
+            raise Http404(_('Invalid page (%(page_number)s): %(message)s') % {
+                'page_number': page, 'message': str(e)})
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+
+class KeysetTablePaginationMixin(object):
+    """
+    Mixin for django-tables2 views to paginate their table with a
+    ``KeysetTablePaginator`` if ``OSCAR_KEYSET_PAGINATION`` is set
+    """
+
+    def get_table_pagination(self):
+        pagination = super(KeysetTablePaginationMixin,
+                           self).get_table_pagination()
+        if not settings.OSCAR_KEYSET_PAGINATION or pagination is False:
+            return pagination
+        if not isinstance(pagination, dict):
+            pagination = {}
+        pagination = dict(
+            pagination, klass=KeysetTablePaginator,
+            estimate_count=settings.OSCAR_PAGINATION_ESTIMATE_COUNT)
+        # django-tables2 only reads integer page numbers from the request
+        page = self.request.GET.get('page')
+        if page:
+            pagination['page'] = page
+        return pagination
+
+
 class ObjectLookupView(View):
     """Base view for json lookup for objects"""
     def get_queryset(self):
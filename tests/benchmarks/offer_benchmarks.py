@@ -0,0 +1,65 @@
+"""
+Benchmark of the time it takes to apply offers to baskets of different sizes.
+
+These benchmarks aren't collected with the test suite. Run them with::
+
+    py.test tests/benchmarks/offer_benchmarks.py -s
+"""
+import time
+from decimal import Decimal as D
+
+from django.test import TestCase
+
+from oscar.apps.offer import models
+from oscar.apps.offer.utils import Applicator
+from oscar.test.basket import add_product
+from oscar.test.factories import (
+    BasketFactory, BenefitFactory, ConditionalOfferFactory, ConditionFactory,
+    ProductFactory, RangeFactory)
+
+BASKET_SIZES = (1, 10, 50)
+NUMBERS_OF_OFFERS = (1, 10, 50)
+REPEAT = 5
+
+
+class TestOfferApplication(TestCase):
+
+    def create_offers(self, number, products):
+        offers = []
+        for i in range(number):
+            rng = RangeFactory(name='Range %d' % i)
+            # Every range includes half of the products
+            for product in products[i % 2::2]:
+                rng.add_product(product)
+            offers.append(ConditionalOfferFactory(
+                name='Offer %d' % i,
+                condition=ConditionFactory(
+                    range=rng, type=models.Condition.COUNT, value=2),
+                benefit=BenefitFactory(
+                    range=rng, type=models.Benefit.PERCENTAGE, value=5,
+                    max_affected_items=1)))
+        return offers
+
+    def time_pricing(self, basket, offers):
+        applicator = Applicator()
+        start = time.time()
+        for i in range(REPEAT):
+            basket.reset_offer_applications()
+            applicator.apply_offers(basket, offers)
+        return (time.time() - start) / REPEAT
+
+    def test_pricing_time(self):
+        products = [ProductFactory() for i in range(max(BASKET_SIZES))]
+        offers = self.create_offers(max(NUMBERS_OF_OFFERS), products)
+
+        print("\nMilliseconds to price a basket (lines x offers)")
+        print("lines " + "".join(
+            "%10d" % number for number in NUMBERS_OF_OFFERS))
+        for size in BASKET_SIZES:
+            basket = BasketFactory()
+            for product in products[:size]:
+                add_product(basket, D('10.00'), 2, product=product)
+            timings = [
+                self.time_pricing(basket, offers[:number]) * 1000
+                for number in NUMBERS_OF_OFFERS]
+            print("%5d " % size + "".join("%10.1f" % t for t in timings))
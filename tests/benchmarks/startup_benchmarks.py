@@ -0,0 +1,105 @@
+"""
+Benchmark of the time it takes a fresh worker process to serve its first
+response, as happens whenever an autoscaled server starts.
+
+Every run starts a new Python process that sets up Django, requests a page
+and reports the timings of each step. Storefront requests don't need to build
+(or import) the dashboard's URLs; the "eager" runs build the whole URL tree
+up front for comparison. These benchmarks aren't collected with the test
+suite. Run them with::
+
+    py.test tests/benchmarks/startup_benchmarks.py -s
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+REPEAT = 3
+
+SETUP = """
+import os, sys, time
+start = time.time()
+os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.settings'
+from tests import settings
+settings.DATABASES['default']['NAME'] = sys.argv[1]
+settings.ALLOWED_HOSTS = ['*']
+# Create the tables without running the migrations
+settings.MIGRATION_MODULES = dict(
+    (app.split('.')[-1], 'notmigrations') for app in settings.INSTALLED_APPS)
+import django
+django.setup()
+"""
+
+CREATE_DATABASE = SETUP + """
+from django.core.management import call_command
+call_command('migrate', run_syncdb=True, interactive=False, verbosity=0)
+"""
+
+FIRST_RESPONSE = SETUP + """
+import json
+from django.core.urlresolvers import get_resolver
+from django.test import Client
+
+def build(resolver):
+    for pattern in resolver.url_patterns:
+        if hasattr(pattern, 'url_patterns'):
+            build(pattern)
+
+timings = {'setup': time.time() - start}
+if sys.argv[3] == 'eager':
+    build(get_resolver(None))
+timings['urls'] = time.time() - start - timings['setup']
+client = Client()
+response = client.get(sys.argv[2])
+assert response.status_code in (200, 302), response.status_code
+timings['first response'] = time.time() - start
+started = time.time()
+client.get(sys.argv[2])
+timings['second response'] = time.time() - started
+timings['dashboard imported'] = 'oscar.apps.dashboard.orders.views' in (
+    sys.modules)
+print(json.dumps(timings))
+"""
+
+
+def run(script, *args):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT, os.path.join(ROOT, 'src'), env.get('PYTHONPATH', '')])
+    env.pop('DJANGO_SETTINGS_MODULE', None)
+    output = subprocess.check_output(
+        [sys.executable, '-c', script] + list(args), cwd=ROOT, env=env)
+    return output.decode('utf8')
+
+
+class TestTimeToFirstResponse(TestCase):
+
+    def setUp(self):
+        self.tmp_folder = tempfile.mkdtemp()
+        self.database = os.path.join(self.tmp_folder, 'db.sqlite3')
+        run(CREATE_DATABASE, self.database)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_folder)
+
+    def test_first_response(self):
+        print("\nSeconds until the first response of a fresh worker "
+              "(best of %d)" % REPEAT)
+        print("%-28s%10s%10s%10s%10s%11s" % (
+            "", "setup", "urls", "first", "second", "dashboard"))
+        for path in ('/', '/catalogue/', '/dashboard/orders/'):
+            for mode in ('lazy', 'eager'):
+                runs = [json.loads(run(FIRST_RESPONSE, self.database, path,
+                                       mode).splitlines()[-1])
+                        for i in range(REPEAT)]
+                best = min(runs, key=lambda timings: timings['first response'])
+                print("%-28s%10.3f%10.3f%10.3f%10.3f%11s" % (
+                    "%s (%s)" % (path, mode), best['setup'], best['urls'],
+                    best['first response'], best['second response'],
+                    best['dashboard imported']))
@@ -0,0 +1,90 @@
+"""
+Benchmark of allocating the stock of a single stock record from many threads,
+as happens when a popular product is on sale.
+
+Each thread allocates one item at a time. Naive read-modify-write allocations
+lose updates under contention, while locked allocations must account for
+every item. These benchmarks aren't collected with the test suite and need a
+database that supports ``SELECT ... FOR UPDATE`` (eg PostgreSQL). Run them
+with::
+
+    py.test tests/benchmarks/stock_benchmarks.py -s --ds=<settings>
+"""
+import threading
+import time
+from unittest import skipUnless
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+
+from oscar.apps.partner.allocation import StockAllocator
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+StockRecord = get_model('partner', 'StockRecord')
+
+NUMBERS_OF_THREADS = (1, 4, 16)
+ALLOCATIONS_PER_THREAD = 50
+
+
+def allocate_naively(stockrecord_id):
+    stockrecord = StockRecord.objects.get(pk=stockrecord_id)
+    stockrecord.num_allocated = (stockrecord.num_allocated or 0) + 1
+    stockrecord.save()
+
+
+def allocate_with_lock(stockrecord_id):
+    StockRecord.objects.get(pk=stockrecord_id).allocate(1)
+
+
+def allocate_with_allocator(stockrecord_id):
+    StockAllocator().allocate({stockrecord_id: 1})
+
+
+@skipUnless(connection.features.has_select_for_update,
+            "The database doesn't support row locks")
+class TestConcurrentAllocation(TransactionTestCase):
+
+    def hammer(self, allocate, stockrecord_id, num_threads):
+        errors = []
+
+        def worker():
+            try:
+                for i in range(ALLOCATIONS_PER_THREAD):
+                    with transaction.atomic():
+                        allocate(stockrecord_id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker)
+                   for i in range(num_threads)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.time() - start, errors
+
+    def test_allocation_under_contention(self):
+        print("\nAllocations per second and lost allocations (threads)")
+        print("%-12s" % "" + "".join(
+            "%20d" % number for number in NUMBERS_OF_THREADS))
+        for allocate in (allocate_naively, allocate_with_lock,
+                         allocate_with_allocator):
+            cells = []
+            for num_threads in NUMBERS_OF_THREADS:
+                stockrecord = factories.create_stockrecord(
+                    num_in_stock=100000)
+                duration, errors = self.hammer(
+                    allocate, stockrecord.pk, num_threads)
+                self.assertEqual([], errors)
+                expected = num_threads * ALLOCATIONS_PER_THREAD
+                lost = expected - (StockRecord.objects.get(
+                    pk=stockrecord.pk).num_allocated or 0)
+                if allocate is not allocate_naively:
+                    self.assertEqual(0, lost)
+                cells.append("%14.0f %5d" % (expected / duration, lost))
+            print("%-12s" % allocate.__name__[len('allocate_'):] +
+                  "".join(cells))
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils.six.moves import http_client
 
 from oscar.apps.catalogue.models import Category
@@ -68,6 +70,56 @@ class TestProductListView(WebTestCase):
         self.assertContains(page, "Page 1 of 2")
 
 
+@override_settings(OSCAR_PRODUCT_CARD_CACHE_TIMEOUT=60)
+class TestProductListViewWithProductCards(TestProductListView):
+
+    def setUp(self):
+        super(TestProductListViewWithProductCards, self).setUp()
+        cache.clear()
+
+    def test_renders_products_from_cached_cards(self):
+        product = create_product(title="Hamlet")
+        self.app.get(reverse('catalogue:index'))
+        with CaptureQueriesContext(connection) as context:
+            page = self.app.get(reverse('catalogue:index'))
+        # Counting and fetching the IDs of the products
+        product_queries = [query for query in context.captured_queries
+                           if 'catalogue_product' in query['sql']]
+        self.assertEqual(2, len(product_queries))
+        self.assertContains(page, "Hamlet")
+        self.assertContains(page, product.get_absolute_url())
+
+    def test_adds_products_to_the_basket(self):
+        product = create_product(num_in_stock=1)
+        page = self.app.get(reverse('catalogue:index'))
+        form = [form for form in page.forms.values()
+                if form.action.endswith('/basket/add/%d/' % product.pk)][0]
+        page = form.submit().follow()
+        self.assertEqual(1, page.context['basket'].num_items)
+        self.assertContains(page, product.title)
+
+
+@override_settings(OSCAR_KEYSET_PAGINATION=True)
+class TestProductListViewWithKeysetPagination(TestProductListView):
+
+    def test_paginates_with_seek_tokens(self):
+        products = [create_product()
+                    for i in range(settings.OSCAR_PRODUCTS_PER_PAGE + 1)]
+        page = self.app.get(reverse('catalogue:index'))
+        page = page.click(href=r'page=2\.n\.')
+        self.assertEqual([products[0]], list(page.context['products']))
+
+    @override_settings(OSCAR_PRODUCT_CARD_CACHE_TIMEOUT=60)
+    def test_paginates_product_cards(self):
+        cache.clear()
+        products = [create_product()
+                    for i in range(settings.OSCAR_PRODUCTS_PER_PAGE + 1)]
+        page = self.app.get(reverse('catalogue:index'))
+        page = page.click(href=r'page=2\.n\.')
+        self.assertEqual([products[0].id],
+                         [card.id for card in page.context['products']])
+
+
 class TestProductCategoryView(WebTestCase):
 
     def setUp(self):
@@ -1,4 +1,5 @@
 from django.core.urlresolvers import reverse
+from django.test.utils import override_settings
 from django.utils.six.moves import http_client
 
 from oscar.core.loading import get_model
@@ -24,6 +25,14 @@ class TestCatalogueViews(WebTestCase):
         for url in urls:
             self.assertIsOk(self.get(url))
     
+    @override_settings(OSCAR_KEYSET_PAGINATION=True)
+    def test_paginates_products_with_seek_tokens(self):
+        products = [create_product() for i in range(21)]
+        page = self.get(reverse('dashboard:catalogue-product-list'))
+        page = page.click(href=r'page=2\.n\.')
+        self.assertEqual([products[0]],
+                         [row.record for row in page.context['products'].page])
+
     def test_upc_filter(self):
         product1 = create_product(upc='123')
         product2 = create_product(upc='12')
@@ -1,6 +1,8 @@
 from decimal import Decimal as D
 
 from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from oscar.core import prices
 from oscar.apps.dashboard.views import IndexView
@@ -69,3 +71,39 @@ class TestDashboardIndexForStaffUser(WebTestCase):
         self.assertInContext(response, 'total_lines')
         self.assertInContext(response, 'total_revenue')
         self.assertInContext(response, 'order_status_breakdown')
+
+
+class TestDashboardIndexWithStatsRecords(WebTestCase):
+    is_staff = True
+
+    def setUp(self):
+        super(TestDashboardIndexWithStatsRecords, self).setUp()
+        for total in (D('34.05'), D('21.90')):
+            create_order(total=prices.Price('GBP', excl_tax=total,
+                                            tax=D('0.00')))
+
+    def get_stats(self):
+        stats = IndexView().get_stats()
+        stats['order_status_breakdown'] = list(
+            stats['order_status_breakdown'])
+        return stats
+
+    def test_reads_the_same_stats_from_the_records(self):
+        live_stats = self.get_stats()
+        with override_settings(OSCAR_DASHBOARD_USE_STATS_RECORDS=True):
+            with CaptureQueriesContext(connection) as queries:
+                recorded_stats = self.get_stats()
+        # Averaged in the database or in Python
+        self.assertAlmostEqual(
+            float(live_stats.pop('average_order_costs')),
+            float(recorded_stats.pop('average_order_costs')))
+        self.assertEqual(live_stats, recorded_stats)
+        tables = ('"order_order"', '"order_line"', '"auth_user"')
+        self.assertFalse([query for query in queries.captured_queries
+                          if any(table in query['sql'] for table in tables)])
+
+    def test_reads_order_statistics_from_the_records(self):
+        with override_settings(OSCAR_DASHBOARD_USE_STATS_RECORDS=True):
+            response = self.get(reverse('dashboard:order-stats'))
+        self.assertEqual(2, response.context['total_orders'])
+        self.assertEqual(D('55.95'), response.context['total_revenue'])
@@ -1,5 +1,9 @@
+import datetime
+
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.test.utils import override_settings
+from django.utils import timezone
 from django.utils.six.moves import http_client
 
 from oscar.core.loading import get_model
@@ -29,11 +33,22 @@ class TestOrderListDashboard(WebTestCase):
 
     def test_downloads_to_csv_without_error(self):
         address = ShippingAddressFactory()
-        create_order(shipping_address=address)
+        order = create_order(shipping_address=address)
         page = self.get(reverse('dashboard:order-list'))
         form = page.forms['orders_form']
         form['selected_order'].checked = True
-        form.submit('download_selected')
+        response = form.submit('action', value='download_selected_orders')
+        self.assertIn(str(order.number), response.text)
+
+    def test_downloads_all_orders_to_csv(self):
+        orders = [create_order() for i in range(3)]
+        response = self.get(
+            reverse('dashboard:order-list'), params={'response_format': 'csv'})
+        lines = response.text.splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertEqual(
+            [str(order.number) for order in reversed(orders)],
+            [line.split(',')[0] for line in lines[1:]])
 
     def test_allows_order_number_search(self):
         page = self.get(reverse('dashboard:order-list'))
@@ -41,6 +56,17 @@ class TestOrderListDashboard(WebTestCase):
         form['order_number'] = '+'
         form.submit()
 
+    @override_settings(OSCAR_KEYSET_PAGINATION=True)
+    def test_paginates_with_seek_tokens(self):
+        orders = [create_order() for i in range(
+            settings.OSCAR_DASHBOARD_ITEMS_PER_PAGE + 1)]
+        page = self.get(reverse('dashboard:order-list'))
+        page = page.click(href=r'page=2\.n\.')
+        self.assertEqual([orders[0]], list(page.context['orders']))
+        page = page.click(href=r'page=1')
+        self.assertEqual(settings.OSCAR_DASHBOARD_ITEMS_PER_PAGE,
+                         len(page.context['orders']))
+
 
 class PermissionBasedDashboardOrderTestsBase(WebTestCase):
     permissions = ['partner.dashboard_access', ]
@@ -350,3 +376,34 @@ class LineDetailTests(WebTestCase):
     def test_line_in_context(self):
         response = self.get(self.url)
         self.assertInContext(response, 'line')
+
+
+class TestOrderStatsDashboard(WebTestCase):
+    is_staff = True
+
+    def setUp(self):
+        super(TestOrderStatsDashboard, self).setUp()
+        self.order = create_order()
+        self.today = timezone.localtime(self.order.date_placed).date()
+
+    def get_breakdown(self, days):
+        date_from = self.today - datetime.timedelta(days=days - 1)
+        response = self.get(reverse('dashboard:order-stats'), params={
+            'date_from': date_from, 'date_to': self.today})
+        return response.context['daily_breakdown']
+
+    def test_breaks_down_date_ranges_by_day(self):
+        breakdown = self.get_breakdown(7)
+        self.assertEqual(7, len(breakdown))
+        self.assertEqual([0] * 6 + [1],
+                         [day['num_orders'] for day in breakdown])
+        self.assertEqual(self.order.total_incl_tax, breakdown[-1]['revenue'])
+
+    def test_breaks_down_date_ranges_by_day_from_stats_records(self):
+        with override_settings(OSCAR_DASHBOARD_USE_STATS_RECORDS=True):
+            breakdown = self.get_breakdown(90)
+        self.assertEqual(90, len(breakdown))
+        self.assertEqual(1, breakdown[-1]['num_orders'])
+
+    def test_doesnt_break_down_long_date_ranges(self):
+        self.assertIsNone(self.get_breakdown(365))
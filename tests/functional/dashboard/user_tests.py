@@ -1,5 +1,6 @@
 from django.core.urlresolvers import reverse
 from django.core import mail
+from django.test.utils import override_settings
 from django.utils.translation import ugettext_lazy as _
 from webtest import AppError
 
@@ -32,6 +33,17 @@ class IndexViewTests(WebTestCase):
         response = self.get(reverse('dashboard:users-index'))
         self.assertInContext(response, 'users')
 
+    @override_settings(OSCAR_KEYSET_PAGINATION=True)
+    def test_paginates_with_seek_tokens(self):
+        response = self.get(reverse('dashboard:users-index'))
+        ids = [row.record.id for row in response.context['users'].page]
+        response = response.click(href=r'page=2\.n\.')
+        ids.extend(row.record.id for row in response.context['users'].page)
+        self.assertEqual(
+            list(User.objects.order_by('-date_joined', '-pk').values_list(
+                'id', flat=True)[:len(ids)]),
+            ids)
+
     def test_make_active(self):
         params = {'action': 'make_active',
                   'selected_user': self.inactive_users_ids}
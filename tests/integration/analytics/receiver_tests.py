@@ -0,0 +1,94 @@
+from decimal import Decimal as D
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from oscar.apps.analytics import receivers
+from oscar.apps.analytics.buffer import analytics_buffer, update_counters
+from oscar.apps.analytics.models import (
+    ProductRecord, UserProductView, UserRecord)
+from oscar.test.basket import add_product
+from oscar.test.factories import (
+    BasketFactory, ProductFactory, UserFactory, create_order)
+
+
+class TestUpdateCounters(TestCase):
+
+    def test_updates_existing_and_creates_missing_records(self):
+        products = [ProductFactory() for i in range(3)]
+        ProductRecord.objects.create(product=products[0], num_views=2)
+        update_counters(ProductRecord, 'num_views', 'product_id', {
+            products[0].pk: 1, products[1].pk: 1, products[2].pk: 4})
+        views = dict(ProductRecord.objects.values_list(
+            'product_id', 'num_views'))
+        self.assertEqual(
+            {products[0].pk: 3, products[1].pk: 1, products[2].pk: 4}, views)
+
+    def test_issues_one_update_per_distinct_increment(self):
+        products = [ProductFactory() for i in range(4)]
+        for product in products:
+            ProductRecord.objects.create(product=product)
+        increments = dict((product.pk, 1) for product in products)
+        increments[products[0].pk] = 2
+        # One query to find the existing records plus two updates
+        with self.assertNumQueries(3):
+            update_counters(
+                ProductRecord, 'num_views', 'product_id', increments)
+
+
+class TestOrderReceiver(TestCase):
+
+    def test_records_purchases_in_bulk(self):
+        basket = BasketFactory()
+        products = [ProductFactory() for i in range(3)]
+        for product in products:
+            add_product(basket, D('10.00'), 2, product=product)
+        create_order(basket=basket)
+        self.assertEqual(
+            [2, 2, 2],
+            [ProductRecord.objects.get(product=product).num_purchases
+             for product in products])
+
+
+@override_settings(OSCAR_ANALYTICS_FLUSH_INTERVAL=3600)
+class TestBufferedRecording(TestCase):
+
+    def setUp(self):
+        analytics_buffer.clear()
+        self.product = ProductFactory()
+        self.user = UserFactory()
+
+    def tearDown(self):
+        analytics_buffer.clear()
+
+    def test_doesnt_write_to_the_database_until_flushed(self):
+        with self.assertNumQueries(0):
+            receivers.receive_product_view(
+                sender=self, product=self.product, user=self.user)
+            receivers.receive_basket_addition(
+                sender=self, product=self.product, user=self.user)
+        self.assertFalse(ProductRecord.objects.exists())
+        self.assertEqual(5, len(analytics_buffer))
+
+    def test_writes_buffered_data_when_flushed(self):
+        for i in range(3):
+            receivers.receive_product_view(
+                sender=self, product=self.product, user=self.user)
+        receivers.receive_basket_addition(
+            sender=self, product=self.product, user=self.user)
+        analytics_buffer.flush()
+
+        record = ProductRecord.objects.get(product=self.product)
+        self.assertEqual(3, record.num_views)
+        self.assertEqual(1, record.num_basket_additions)
+        user_record = UserRecord.objects.get(user=self.user)
+        self.assertEqual(3, user_record.num_product_views)
+        self.assertEqual(1, user_record.num_basket_additions)
+        self.assertEqual(3, UserProductView.objects.filter(
+            user=self.user, product=self.product).count())
+        self.assertEqual(0, len(analytics_buffer))
+
+    def test_is_due_when_it_gets_too_large(self):
+        self.assertFalse(analytics_buffer.is_due())
+        analytics_buffer._size = analytics_buffer.max_size + 1
+        self.assertTrue(analytics_buffer.is_due())
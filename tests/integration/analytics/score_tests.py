@@ -0,0 +1,59 @@
+import logging
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from oscar.apps.analytics.models import ProductRecord
+from oscar.apps.analytics.scores import Calculator
+from oscar.test.factories import ProductFactory
+
+logger = logging.getLogger(__name__)
+
+
+class TestCalculator(TestCase):
+
+    def setUp(self):
+        self.records = [
+            ProductRecord.objects.create(
+                product=ProductFactory(), num_views=i, num_purchases=1)
+            for i in range(5)]
+
+    def get_scores(self):
+        return list(ProductRecord.objects.order_by('id').values_list(
+            'score', flat=True))
+
+    def test_calculates_weighted_scores(self):
+        Calculator(logger).run()
+        self.assertEqual(
+            [(i + 5) / 9.0 for i in range(5)], self.get_scores())
+
+    def test_calculates_scores_in_chunks(self):
+        calculator = Calculator(logger, chunk_size=2)
+        self.assertEqual(5, calculator.calculate_scores())
+        self.assertEqual(
+            [(i + 5) / 9.0 for i in range(5)], self.get_scores())
+
+    def test_only_updates_stale_scores_in_incremental_mode(self):
+        Calculator(logger).run()
+        ProductRecord.objects.filter(id=self.records[0].id).update(
+            num_views=9)
+        calculator = Calculator(logger, incremental=True)
+        self.assertEqual(1, calculator.calculate_scores())
+        self.assertEqual(14 / 9.0, self.get_scores()[0])
+        self.assertEqual(0, calculator.calculate_scores())
+
+    def test_doesnt_update_scores_in_dry_run_mode(self):
+        calculator = Calculator(
+            logger, incremental=True, chunk_size=2, dry_run=True)
+        self.assertEqual(5, calculator.calculate_scores())
+        self.assertEqual([0.0] * 5, self.get_scores())
+
+
+class TestCalculateScoresCommand(TestCase):
+
+    def test_accepts_incremental_options(self):
+        record = ProductRecord.objects.create(
+            product=ProductFactory(), num_purchases=9)
+        call_command('oscar_calculate_scores', incremental=True, chunk_size=10)
+        record = ProductRecord.objects.get(id=record.id)
+        self.assertEqual(5.0, record.score)
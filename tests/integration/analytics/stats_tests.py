@@ -0,0 +1,78 @@
+from datetime import timedelta
+from decimal import Decimal as D
+
+from django.test import TestCase
+from django.utils.timezone import now
+
+from oscar.apps.analytics import stats
+from oscar.apps.analytics.models import (
+    HourlyCustomerRecord, HourlyOrderRecord)
+from oscar.core import prices
+from oscar.test.factories import UserFactory, create_order
+
+
+def get_records():
+    return list(HourlyOrderRecord.objects.exclude(num_orders=0).values_list(
+        'hour', 'status', 'num_orders', 'num_lines', 'total_incl_tax'))
+
+
+class TestHourlyOrderRecords(TestCase):
+
+    def setUp(self):
+        self.order = create_order(total=prices.Price(
+            'GBP', excl_tax=D('10.00'), tax=D('2.00')))
+        self.hour = stats.get_hour(self.order.date_placed)
+
+    def test_are_updated_when_orders_are_placed(self):
+        create_order(total=prices.Price(
+            'GBP', excl_tax=D('5.00'), tax=D('0.00')))
+        self.assertEqual(
+            [(self.hour, self.order.status, 2, 2, D('17.00'))], get_records())
+
+    def test_are_updated_when_orders_change_status(self):
+        self.order.set_status('B')
+        self.assertEqual([(self.hour, 'B', 1, 1, D('12.00'))], get_records())
+
+    def test_can_be_rebuilt_from_the_orders(self):
+        self.order.status = 'C'
+        self.order.save()
+        self.assertEqual(1, stats.rebuild_order_records(batch_size=1))
+        self.assertEqual([(self.hour, 'C', 1, 1, D('12.00'))], get_records())
+
+    def test_can_be_filtered_by_hour(self):
+        self.assertEqual(1, stats.get_order_stats(
+            hour__gte=self.hour)['total_orders'])
+        self.assertEqual(0, stats.get_order_stats(
+            hour__gte=self.hour + timedelta(hours=1))['total_orders'])
+        breakdown = stats.get_order_status_breakdown(hour__lt=self.hour)
+        self.assertEqual([], list(breakdown))
+
+
+class TestHourlyCustomerRecords(TestCase):
+
+    def test_count_registered_and_deleted_users(self):
+        users = [UserFactory() for i in range(3)]
+        users[0].delete()
+        self.assertEqual(2, stats.get_customer_count())
+        self.assertEqual(0, stats.get_customer_count(
+            hour__gte=stats.get_hour(now()) + timedelta(hours=1)))
+
+    def test_can_be_rebuilt_from_the_users(self):
+        UserFactory()
+        HourlyCustomerRecord.objects.all().delete()
+        self.assertEqual(1, stats.rebuild_customer_records())
+        self.assertEqual(1, stats.get_customer_count())
+
+
+class TestHourFilters(TestCase):
+
+    def test_translates_date_placed_lookups(self):
+        start, end = now() - timedelta(days=1), now()
+        self.assertEqual({'hour__gte': start, 'hour__lt': end},
+                         stats.get_hour_filters(
+                             {'date_placed__range': [start, end]}))
+        self.assertEqual({'hour__gte': start},
+                         stats.get_hour_filters({'date_placed__gte': start}))
+
+    def test_rejects_other_lookups(self):
+        self.assertIsNone(stats.get_hour_filters({'status': 'A'}))
@@ -0,0 +1,96 @@
+import logging
+from decimal import Decimal as D
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from oscar.apps.catalogue.cards import get_product_cards
+from oscar.apps.partner.allocation import StockAllocator
+from oscar.apps.partner.importers import CatalogueImporter
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+ProductImage = get_model('catalogue', 'ProductImage')
+
+
+@override_settings(OSCAR_PRODUCT_CARD_CACHE_TIMEOUT=60)
+class TestProductCards(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.product = factories.create_product(
+            title="Hamlet", price=D('12.00'), num_in_stock=5)
+
+    def get_card(self, product=None):
+        return get_product_cards([(product or self.product).id])[0]
+
+    def test_holds_what_product_lists_show(self):
+        card = self.get_card()
+        self.assertEqual("Hamlet", card.title)
+        self.assertEqual(self.product.get_absolute_url(), card.url)
+        self.assertEqual(D('12.00'), card.price_excl_tax)
+        self.assertEqual('instock', card.availability_code)
+        self.assertTrue(card.is_available_to_buy)
+        self.assertFalse(card.is_parent)
+
+    def test_keeps_the_order_and_skips_missing_products(self):
+        other = factories.create_product()
+        cards = get_product_cards([other.id, 0, self.product.id])
+        self.assertEqual([other.id, self.product.id],
+                         [card.id for card in cards])
+
+    def test_fetches_cached_cards_without_queries(self):
+        self.get_card()
+        with self.assertNumQueries(0):
+            self.assertEqual("Hamlet", self.get_card().title)
+
+    def test_is_invalidated_when_the_product_is_saved(self):
+        self.get_card()
+        self.product.title = "Macbeth"
+        self.product.save()
+        self.assertEqual("Macbeth", self.get_card().title)
+
+    def test_is_invalidated_when_the_stock_changes(self):
+        self.get_card()
+        stockrecord = self.product.stockrecords.get()
+        stockrecord.num_in_stock = 0
+        stockrecord.save()
+        self.assertFalse(self.get_card().is_available_to_buy)
+
+    def test_is_invalidated_when_stock_is_allocated_in_bulk(self):
+        self.assertTrue(self.get_card().is_available_to_buy)
+        stockrecord = self.product.stockrecords.get()
+        StockAllocator().allocate({stockrecord.pk: 5})
+        self.assertFalse(self.get_card().is_available_to_buy)
+
+    def test_is_invalidated_when_an_import_changes_the_stock(self):
+        self.product.upc = '9780141013077'
+        self.product.save()
+        self.get_card()
+        stockrecord = self.product.stockrecords.get()
+        importer = CatalogueImporter(logging.getLogger(__name__),
+                                     batch_size=10)
+        importer._import_batch([[
+            self.product.get_product_class().name, 'Books', self.product.upc,
+            'Hamlet', 'NULL', stockrecord.partner.name,
+            stockrecord.partner_sku, '12.00', '0']],
+            {'new_items': 0, 'updated_items': 0})
+        self.assertFalse(self.get_card().is_available_to_buy)
+
+    def test_is_invalidated_when_an_image_is_deleted(self):
+        image = ProductImage.objects.create(
+            product=self.product, original='image.jpg')
+        self.assertEqual('image.jpg', self.get_card().image)
+        image.delete()
+        self.assertNotEqual('image.jpg', self.get_card().image)
+
+    def test_parent_is_invalidated_when_the_stock_of_a_child_changes(self):
+        parent = factories.create_product(structure='parent')
+        child = factories.create_product(
+            parent=parent, structure='child', num_in_stock=0)
+        self.assertFalse(self.get_card(parent).is_available_to_buy)
+        stockrecord = child.stockrecords.get()
+        stockrecord.num_in_stock = 3
+        stockrecord.save()
+        self.assertTrue(self.get_card(parent).is_available_to_buy)
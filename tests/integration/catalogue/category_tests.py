@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from django import template
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from oscar.apps.catalogue.models import Category
 from oscar.apps.catalogue.categories import create_from_breadcrumbs
@@ -233,3 +234,41 @@ class TestCategoryTemplateTags(TestCase):
         actual_categories = self.get_category_names(depth=1, parent=parent)
         expected_categories = {'Horror', 'Comedy'}
         self.assertEqual(expected_categories, actual_categories)
+
+    def test_precomputes_full_names_and_slugs(self):
+        parent = Category.objects.get(name="Fiction")
+        for annotated_list in (get_annotated_list(),
+                               get_annotated_list(parent=parent)):
+            for category, __ in annotated_list:
+                fresh = Category.objects.get(pk=category.pk)
+                self.assertEqual(fresh.full_name, category.full_name)
+                self.assertEqual(fresh.full_slug, category.full_slug)
+
+    def test_doesnt_look_up_ancestors_for_urls(self):
+        annotated_list = get_annotated_list()
+        with self.assertNumQueries(0):
+            for category, __ in annotated_list:
+                category.full_slug
+
+
+@override_settings(OSCAR_CATEGORY_TREE_CACHE_TIMEOUT=60)
+class TestCachedCategoryTemplateTags(TestCategoryTemplateTags):
+
+    def test_caches_annotated_list(self):
+        get_annotated_list()
+        with self.assertNumQueries(0):
+            get_annotated_list()
+
+    def test_is_invalidated_when_a_category_is_saved(self):
+        get_annotated_list()
+        category = Category.objects.get(name="Children")
+        category.name = "Kids"
+        category.save()
+        self.assertIn('Kids', self.get_category_names())
+
+    def test_is_invalidated_when_a_category_is_moved(self):
+        parent = Category.objects.get(name="Fiction")
+        self.assertIn('Horror', self.get_category_names(parent=parent))
+        horror = Category.objects.get(name="Horror")
+        horror.move(Category.objects.get(name="Programming"))
+        self.assertNotIn('Horror', self.get_category_names(parent=parent))
@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from oscar.apps.catalogue.models import (Product, ProductClass,
                                          ProductAttribute,
                                          AttributeOption)
+from oscar.apps.catalogue.managers import prefetch_attribute_values
 from oscar.test import factories
 from oscar.test.decorators import ignore_deprecation_warnings
 
@@ -154,3 +155,41 @@ class ProductAttributeCreationTests(TestCase):
             attribute=attribute, value_entity=unrelated_object)
 
         self.assertEqual(attribute_value.value, unrelated_object)
+
+
+class TestBulkAttributeLoading(TestCase):
+
+    def setUp(self):
+        product_class = factories.ProductClassFactory()
+        weight = factories.ProductAttributeFactory(
+            product_class=product_class, name='Weight', code='weight',
+            type='integer')
+        colour = factories.ProductAttributeFactory(
+            product_class=product_class, name='Colour', code='colour',
+            type='option',
+            option_group=factories.AttributeOptionGroupFactory())
+        self.red = factories.AttributeOptionFactory(
+            group=colour.option_group, option='red')
+        for i in range(3):
+            product = factories.ProductFactory(product_class=product_class)
+            factories.ProductAttributeValueFactory(
+                product=product, attribute=weight, value_integer=i)
+            factories.ProductAttributeValueFactory(
+                product=product, attribute=colour, value_option=self.red)
+
+    def test_base_queryset_fetches_typed_values_up_front(self):
+        products = list(Product.objects.base_queryset().order_by('pk'))
+        with self.assertNumQueries(0):
+            self.assertEqual([0, 1, 2],
+                             [product.attr.weight for product in products])
+            self.assertEqual(self.red, products[0].attr.colour)
+            self.assertEqual('Colour: red, Weight: 0', ', '.join(
+                sorted(products[0].attribute_summary.split(', '))))
+
+    def test_prefetches_attributes_of_product_lists(self):
+        products = list(Product.objects.order_by('pk'))
+        with self.assertNumQueries(1):
+            prefetch_attribute_values(products)
+        with self.assertNumQueries(0):
+            self.assertEqual([0, 1, 2],
+                             [product.attr.weight for product in products])
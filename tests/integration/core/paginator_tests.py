@@ -0,0 +1,93 @@
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.test import TestCase
+from django.utils import timezone
+
+from oscar.core.loading import get_model
+from oscar.core.paginator import KeysetPaginator
+from oscar.templatetags.ellipses_pagination import ellipses_page_range
+from oscar.test import factories
+
+Product = get_model('catalogue', 'Product')
+
+
+class TestKeysetPaginator(TestCase):
+
+    def setUp(self):
+        for i in range(7):
+            factories.create_product(title="Product %d" % i)
+        # Products sharing a sort key are ordered by their primary key
+        Product.objects.filter(title__in=["Product 2", "Product 3"]).update(
+            date_created=timezone.now())
+        self.queryset = Product.objects.order_by('-date_created')
+        self.paginator = KeysetPaginator(self.queryset, 3)
+
+    def get_ids(self, page):
+        return [product.pk for product in page.object_list]
+
+    def test_orders_by_the_primary_key_as_well(self):
+        self.assertEqual(['-date_created', '-pk'], self.paginator.ordering)
+
+    def test_seeks_the_same_pages_as_offsets(self):
+        offset_ids = list(self.queryset.order_by(
+            '-date_created', '-pk').values_list('pk', flat=True))
+        page = self.paginator.page(1)
+        ids = self.get_ids(page)
+        while page.has_next():
+            page = self.paginator.page(page.next_page_number())
+            ids.extend(self.get_ids(page))
+        self.assertEqual(offset_ids, ids)
+        self.assertEqual(3, page.number)
+
+    def test_seeks_previous_pages(self):
+        first_page = self.paginator.page(1)
+        second_page = self.paginator.page(first_page.next_page_number())
+        third_page = self.paginator.page(second_page.next_page_number())
+        page = self.paginator.page(third_page.previous_page_number())
+        self.assertEqual(self.get_ids(second_page), self.get_ids(page))
+        self.assertEqual(2, page.number)
+        self.assertEqual(1, page.previous_page_number())
+
+    def test_uses_page_numbers_for_rows_with_null_keys(self):
+        paginator = KeysetPaginator(
+            Product.objects.order_by('parent__title'), 3)
+        self.assertEqual(2, paginator.page(1).next_page_number())
+
+    def test_paginates_rows_of_values_querysets(self):
+        paginator = KeysetPaginator(
+            self.queryset.values('id', 'date_created'), 3)
+        page = paginator.page(paginator.page(1).next_page_number())
+        self.assertEqual(
+            [row['id'] for row in page.object_list],
+            [product.pk for product in self.paginator.page(2).object_list])
+
+    def test_raises_for_invalid_tokens(self):
+        with self.assertRaises(PageNotAnInteger):
+            self.paginator.page('2.n.bm9wZQ==')
+
+    def test_raises_for_empty_pages(self):
+        last_product = self.paginator.page(3).object_list[0]
+        token = self.paginator.get_token(4, 'n', last_product)
+        with self.assertRaises(EmptyPage):
+            self.paginator.page(token)
+
+    def test_counts_exactly_without_an_estimate(self):
+        paginator = KeysetPaginator(self.queryset, 3, estimate_count=True)
+        self.assertEqual(7, paginator.count)
+        self.assertFalse(paginator.count_is_estimated)
+
+
+class TestEllipsesPageRange(TestCase):
+
+    def setUp(self):
+        for i in range(10):
+            factories.create_product()
+        self.paginator = KeysetPaginator(Product.objects.all(), 1)
+
+    def test_shows_the_last_pages(self):
+        self.assertEqual([1, None, 4, 5, 6, None, 10],
+                         ellipses_page_range(self.paginator.page(5), '1,1'))
+
+    def test_ellipses_the_last_pages_of_estimated_counts(self):
+        self.paginator.count_is_estimated = True
+        self.assertEqual([1, None, 4, 5, 6, None],
+                         ellipses_page_range(self.paginator.page(5), '1,1'))
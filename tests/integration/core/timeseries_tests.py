@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+from decimal import Decimal as D
+
+from django.db.models import Count, Sum
+from django.test import TestCase
+from django.utils import timezone
+
+from oscar.apps.order.models import Order
+from oscar.core import prices
+from oscar.core.timeseries import aggregate_by_period
+from oscar.test.factories import create_order
+
+
+def place_order(date_placed, total):
+    order = create_order(total=prices.Price(
+        'GBP', excl_tax=total, tax=D('0.00')))
+    order.date_placed = date_placed
+    order.save()
+
+
+class TestAggregateByPeriod(TestCase):
+
+    def setUp(self):
+        timezone.activate('Europe/London')
+        self.addCleanup(timezone.deactivate)
+        self.start = timezone.get_current_timezone().localize(
+            datetime(2016, 1, 10))
+        place_order(self.start + timedelta(minutes=30), D('10.00'))
+        place_order(self.start + timedelta(hours=2), D('5.00'))
+        place_order(self.start + timedelta(hours=2, minutes=59), D('7.00'))
+
+    def aggregate(self, start, end, period):
+        return aggregate_by_period(
+            Order.objects.all(), 'date_placed', start, end, period=period,
+            default={'num_orders': 0, 'total': D('0.00')},
+            num_orders=Count('id'), total=Sum('total_incl_tax'))
+
+    def test_aggregates_hours_in_a_single_query(self):
+        with self.assertNumQueries(1):
+            periods = self.aggregate(
+                self.start, self.start + timedelta(hours=4), 'hour')
+        self.assertEqual(
+            [(1, D('10.00')), (0, D('0.00')), (2, D('12.00')),
+             (0, D('0.00'))],
+            [(period['num_orders'], period['total']) for period in periods])
+        self.assertEqual(self.start + timedelta(hours=2), periods[2]['start'])
+        self.assertEqual(self.start + timedelta(hours=3), periods[2]['end'])
+
+    def test_aggregates_days_of_the_current_time_zone(self):
+        # 23:30 in London is already the next day in Paris
+        place_order(self.start - timedelta(minutes=30), D('1.00'))
+        start = self.start - timedelta(days=1)
+        end = self.start + timedelta(days=1)
+        days = self.aggregate(start, end, 'day')
+        self.assertEqual([1, 3], [day['num_orders'] for day in days])
+        with timezone.override('Europe/Paris'):
+            days = self.aggregate(start, end, 'day')
+        self.assertEqual([0, 4, 0], [day['num_orders'] for day in days])
+
+    def test_includes_periods_that_start_before_the_end(self):
+        periods = self.aggregate(
+            self.start + timedelta(minutes=45),
+            self.start + timedelta(hours=2, minutes=1), 'hour')
+        self.assertEqual(3, len(periods))
+        self.assertEqual([0, 0, 1],
+                         [period['num_orders'] for period in periods])
+
+    def test_rejects_other_periods(self):
+        with self.assertRaises(ValueError):
+            self.aggregate(self.start, self.start, 'week')
@@ -0,0 +1,32 @@
+from django.test import TestCase
+
+from oscar.apps.catalogue.models import Product
+from oscar.core.utils import chunked
+from oscar.test.factories import ProductFactory
+
+
+class TestChunked(TestCase):
+
+    def setUp(self):
+        self.products = [ProductFactory() for i in range(5)]
+
+    def test_splits_lists_into_chunks(self):
+        self.assertEqual(
+            [[1, 2], [3, 4], [5]], list(chunked([1, 2, 3, 4, 5], 2)))
+
+    def test_paginates_querysets_ordered_by_pk(self):
+        with self.assertNumQueries(3):
+            chunks = list(chunked(Product.objects.order_by('-pk'), 2))
+        self.assertEqual(
+            [p.pk for p in reversed(self.products)],
+            [p.pk for chunk in chunks for p in chunk])
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+
+    def test_keeps_other_orderings(self):
+        Product.objects.filter(pk=self.products[2].pk).update(title='a')
+        queryset = Product.objects.order_by('title', 'pk')
+        # One query for the primary keys plus one per chunk
+        with self.assertNumQueries(4):
+            chunks = list(chunked(queryset, 2))
+        self.assertEqual(
+            list(queryset), [p for chunk in chunks for p in chunk])
@@ -1,6 +1,9 @@
 from decimal import Decimal as D
 
+from django.core.cache import cache
 from django.test import TestCase
+from django.test.utils import override_settings
+import mock
 from mock import Mock
 
 from oscar.apps.offer import models
@@ -56,3 +59,93 @@ class TestOfferApplicator(TestCase):
         offers = self.applicator.get_offers(self.basket)
         priorities = [offer.priority for offer in offers]
         self.assertEqual(sorted(priorities, reverse=True), priorities)
+
+
+class TestOfferApplicatorMemoisesLineData(TestCase):
+
+    def setUp(self):
+        self.basket = BasketFactory()
+        for price in (D('10'), D('30'), D('20')):
+            add_product(self.basket, price, 3)
+        self.range = RangeFactory(includes_all_products=True)
+        self.offers = [
+            ConditionalOfferFactory(
+                name='Offer %d' % i, max_basket_applications=1,
+                condition=ConditionFactory(
+                    range=self.range, type=models.Condition.COUNT, value=2),
+                benefit=BenefitFactory(
+                    range=self.range, type=models.Benefit.PERCENTAGE,
+                    value=10, max_affected_items=1))
+            for i in range(3)]
+
+    def test_checks_each_line_against_a_range_only_once(self):
+        with mock.patch.object(
+                models.Range, 'contains_product',
+                autospec=True, return_value=True) as contains_product:
+            Applicator().apply_offers(self.basket, self.offers)
+        self.assertEqual(3, contains_product.call_count)
+
+    def test_gives_the_same_discounts_as_without_memoisation(self):
+        Applicator().apply_offers(self.basket, self.offers)
+        discounts = self.get_discounts()
+        self.assertEqual(3, len(self.basket.offer_applications))
+
+        self.basket.reset_offer_applications()
+        with mock.patch('oscar.apps.offer.utils.memoise_for_lines',
+                        lambda basket, key, func: func()):
+            Applicator().apply_offers(self.basket, self.offers)
+        self.assertEqual(discounts, self.get_discounts())
+
+    def get_discounts(self):
+        return [(line.pk, line.discount_value, line.quantity_with_discount)
+                for line in self.basket.all_lines()]
+
+
+@override_settings(OSCAR_BASKET_PRICING_CACHE_TIMEOUT=60)
+class TestCachedOfferApplication(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.basket = BasketFactory()
+        add_product(self.basket, D('10.00'), 2)
+        self.line = self.basket.all_lines()[0]
+        rng = RangeFactory(includes_all_products=True)
+        self.offer = ConditionalOfferFactory(
+            condition=ConditionFactory(
+                range=rng, type=models.Condition.COUNT, value=2),
+            benefit=BenefitFactory(
+                range=rng, type=models.Benefit.PERCENTAGE, value=10))
+
+    def tearDown(self):
+        cache.clear()
+
+    def reprice(self):
+        self.basket.reset_offer_applications()
+        Applicator().apply(self.basket)
+
+    def test_restores_discounts_from_cache(self):
+        self.reprice()
+        with mock.patch.object(Applicator, 'apply_offers') as apply_offers:
+            self.reprice()
+        self.assertFalse(apply_offers.called)
+        self.assertEqual(D('2.00'), self.basket.total_discount)
+        self.assertEqual(1, len(self.basket.offer_applications))
+        self.assertEqual(
+            self.offer, list(self.basket.offer_applications)[0]['offer'])
+        self.assertEqual(2, self.basket.all_lines()[0].quantity_with_discount)
+
+    def test_reprices_when_basket_contents_change(self):
+        self.reprice()
+        fingerprint = self.basket.get_content_fingerprint()
+        self.line.quantity = 4
+        self.line.save()
+        self.reprice()
+        self.assertNotEqual(
+            fingerprint, self.basket.get_content_fingerprint())
+        self.assertEqual(D('4.00'), self.basket.total_discount)
+
+    def test_reprices_when_an_offer_changes(self):
+        self.reprice()
+        self.offer.suspend()
+        self.reprice()
+        self.assertEqual(D('0.00'), self.basket.total_discount)
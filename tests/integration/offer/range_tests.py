@@ -1,4 +1,5 @@
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from oscar.apps.offer import models
 from oscar.apps.catalogue import models as catalogue_models
@@ -163,3 +164,86 @@ class TestRangeModel(TestCase):
         first_range.name = "Bar"
         first_range.save()
         models.Range.objects.create(name="Foo")
+
+
+@override_settings(OSCAR_RANGE_INDEX_CACHE_TIMEOUT=60)
+class TestWholeSiteRangeWithProductIndex(TestWholeSiteRange):
+    pass
+
+
+@override_settings(OSCAR_RANGE_INDEX_CACHE_TIMEOUT=60)
+class TestChildRangeWithProductIndex(TestChildRange):
+    pass
+
+
+@override_settings(OSCAR_RANGE_INDEX_CACHE_TIMEOUT=60)
+class TestPartialRangeWithProductIndex(TestPartialRange):
+    pass
+
+
+@override_settings(OSCAR_RANGE_INDEX_CACHE_TIMEOUT=60)
+class TestRangeProductIndex(TestCase):
+
+    def setUp(self):
+        self.range = models.Range.objects.create(name="Indexed range")
+        self.product = create_product()
+
+    def fresh_range(self):
+        return models.Range.objects.get(pk=self.range.pk)
+
+    def test_is_stored_in_the_cache(self):
+        self.range.add_product(self.product)
+        self.range.contains_product(self.product)
+        rng = self.fresh_range()
+        with self.assertNumQueries(0):
+            self.assertTrue(rng.contains_product(self.product))
+
+    def test_is_updated_when_products_are_added_and_removed(self):
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+        self.range.add_product(self.product)
+        self.assertTrue(self.fresh_range().contains_product(self.product))
+        self.range.remove_product(self.product)
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+
+    def test_is_updated_when_product_categories_change(self):
+        category = catalogue_models.Category.add_root(name="Root")
+        child_category = category.add_child(name="Child")
+        self.range.included_categories.add(category)
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+        link = catalogue_models.ProductCategory.objects.create(
+            product=self.product, category=child_category)
+        self.assertTrue(self.fresh_range().contains_product(self.product))
+        link.delete()
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+
+    def test_is_updated_when_the_product_class_changes(self):
+        product_class = catalogue_models.ProductClass.objects.create(
+            name="Indexed class")
+        self.range.classes.add(product_class)
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+        self.product.product_class = product_class
+        self.product.save()
+        self.assertTrue(self.fresh_range().contains_product(self.product))
+
+    def test_is_rebuilt_when_exclusions_change(self):
+        self.range.add_product(self.product)
+        self.assertTrue(self.fresh_range().contains_product(self.product))
+        self.range.excluded_products.add(self.product)
+        self.assertFalse(self.fresh_range().contains_product(self.product))
+
+    def test_includes_children_of_included_products(self):
+        parent = create_product(structure='parent')
+        child = create_product(structure='child', parent=parent)
+        self.range.add_product(parent)
+        self.assertTrue(self.fresh_range().contains_product(child))
+
+    def test_is_rebuilt_when_a_category_is_moved(self):
+        books = catalogue_models.Category.add_root(name="Books")
+        fiction = books.add_child(name="Fiction")
+        music = catalogue_models.Category.add_root(name="Music")
+        catalogue_models.ProductCategory.objects.create(
+            product=self.product, category=fiction)
+        self.range.included_categories.add(books)
+        self.assertTrue(self.fresh_range().contains_product(self.product))
+        fiction.move(music, 'last-child')
+        self.assertFalse(self.fresh_range().contains_product(self.product))
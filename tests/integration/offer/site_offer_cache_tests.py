@@ -0,0 +1,98 @@
+import datetime
+from decimal import Decimal as D
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from oscar.apps.offer import conditions, benefits, models
+from oscar.apps.offer.cache import site_offer_cache
+from oscar.apps.offer.utils import Applicator
+from oscar.test.basket import add_product
+from oscar.test.factories import (
+    BasketFactory, ConditionalOfferFactory, ProductFactory, RangeFactory)
+
+
+@override_settings(OSCAR_SITE_OFFER_CACHE_TIMEOUT=60)
+class TestSiteOfferCache(TestCase):
+
+    def setUp(self):
+        site_offer_cache.clear()
+        rng = RangeFactory(includes_all_products=True)
+        self.offer = ConditionalOfferFactory(
+            condition__type=models.Condition.COUNT,
+            condition__value=1,
+            condition__range=rng,
+            benefit__range=rng)
+        self.applicator = Applicator()
+
+    def tearDown(self):
+        site_offer_cache.clear()
+
+    def test_returns_site_offers(self):
+        offers = self.applicator.get_site_offers()
+        self.assertEqual([self.offer.pk], [o.pk for o in offers])
+
+    def test_doesnt_query_the_database_once_loaded(self):
+        self.applicator.get_site_offers()
+        with self.assertNumQueries(0):
+            offers = self.applicator.get_site_offers()
+            offers[0].condition.range
+            offers[0].benefit.range
+
+    def test_resolves_conditions_and_benefits_to_proxies(self):
+        offer = self.applicator.get_site_offers()[0]
+        self.assertIsInstance(offer.condition, conditions.CountCondition)
+        self.assertIsInstance(
+            offer.benefit, benefits.PercentageDiscountBenefit)
+
+    def test_returns_copies_of_the_cached_offers(self):
+        first = self.applicator.get_site_offers()[0]
+        second = self.applicator.get_site_offers()[0]
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.condition, second.condition)
+        self.assertIs(first.condition.range, second.condition.range)
+
+    def test_is_invalidated_when_an_offer_is_saved(self):
+        self.applicator.get_site_offers()
+        self.offer.suspend()
+        self.assertEqual([], self.applicator.get_site_offers())
+
+    def test_is_invalidated_when_an_offer_is_deleted(self):
+        self.applicator.get_site_offers()
+        self.offer.delete()
+        self.assertEqual([], self.applicator.get_site_offers())
+
+    def test_is_invalidated_when_a_range_changes(self):
+        rng = RangeFactory()
+        offer = ConditionalOfferFactory(
+            name='Range offer', condition__range=rng)
+        product = ProductFactory()
+        self.assertFalse(self.get_offer(offer.pk).condition.range
+                         .contains_product(product))
+        rng.add_product(product)
+        self.assertTrue(self.get_offer(offer.pk).condition.range
+                        .contains_product(product))
+        rng.excluded_products.add(product)
+        self.assertFalse(self.get_offer(offer.pk).condition.range
+                         .contains_product(product))
+
+    def test_filters_offers_by_date_window(self):
+        yesterday = timezone.now() - datetime.timedelta(days=1)
+        self.offer.end_datetime = yesterday
+        self.offer.start_datetime = yesterday - datetime.timedelta(days=1)
+        self.offer.save()
+        self.assertEqual([], self.applicator.get_site_offers())
+        self.assertEqual(1, len(site_offer_cache.get_offers()))
+
+    def test_applies_cached_offers_to_basket(self):
+        basket = BasketFactory()
+        add_product(basket, D('10.00'), 2)
+        self.applicator.apply(basket)
+        self.assertEqual(1, len(basket.offer_applications))
+        self.assertEqual(D('2.00'), basket.total_discount)
+
+    def get_offer(self, pk):
+        for offer in self.applicator.get_site_offers():
+            if offer.pk == pk:
+                return offer
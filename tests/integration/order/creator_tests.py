@@ -1,13 +1,16 @@
 from decimal import Decimal as D
 
+from django.contrib.sites.models import Site
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from mock import Mock
 
 from oscar.apps.catalogue.models import ProductClass, Product
 from oscar.apps.offer.utils import Applicator
 from oscar.apps.order.models import Order
 from oscar.apps.order.utils import OrderCreator
+from oscar.apps.partner.allocation import StockAllocator
 from oscar.apps.shipping.methods import Free, FixedPrice
 from oscar.apps.shipping.repository import Repository
 from oscar.core.loading import get_class
@@ -100,6 +103,15 @@ class TestSuccessfulOrderCreation(TestCase):
         line = order.lines.all()[0]
         self.assertEqual('A', line.status)
 
+    def test_allocates_reserved_stock_once(self):
+        product = factories.create_product(num_in_stock=10)
+        add_product(self.basket, D('12.00'), 3, product=product)
+        StockAllocator().reserve(self.basket)
+        place_order(self.creator, basket=self.basket, order_number='1234')
+
+        self.assertEqual(3, product.stockrecords.get().num_allocated)
+        self.assertFalse(self.basket.stock_reservations.exists())
+
     def test_partner_name_is_optional(self):
         for partner_name, order_number in [('', 'A'), ('p1', 'B')]:
             self.basket = factories.create_basket(empty=True)
@@ -186,3 +198,55 @@ class TestShippingOfferForOrder(TestCase):
         self.assertEqual(0, len(order.shipping_discounts))
         self.assertEqual(D('0.00'), order.shipping_incl_tax)
         self.assertEqual(D('12.00'), order.total_incl_tax)
+
+
+@override_settings(OSCAR_BULK_ORDER_PLACEMENT=True)
+class TestBulkOrderCreation(TestSuccessfulOrderCreation):
+
+    def test_allocates_stock_of_all_lines(self):
+        products = [factories.create_product(num_in_stock=10)
+                    for i in range(3)]
+        for quantity, product in enumerate(products, 1):
+            add_product(self.basket, D('12.00'), quantity, product=product)
+        place_order(self.creator, basket=self.basket, order_number='1234')
+
+        for quantity, product in enumerate(products, 1):
+            stockrecord = product.stockrecords.all()[0]
+            self.assertEqual(quantity, stockrecord.num_allocated)
+
+    def test_creates_line_prices_in_order_of_basket_lines(self):
+        for price in ('10.00', '20.00', '30.00'):
+            add_product(self.basket, D(price), 2)
+        order = place_order(
+            self.creator, basket=self.basket, order_number='1234')
+
+        for line in order.lines.all():
+            price = line.prices.get()
+            self.assertEqual(line.line_price_incl_tax, price.price_incl_tax * 2)
+            self.assertEqual(2, price.quantity)
+
+    def test_number_of_queries_does_not_depend_on_number_of_lines(self):
+        # The current site is cached after the first lookup, and the first
+        # order of an hour creates its analytics record
+        Site.objects.get_current()
+        add_product(self.basket, D('12.00'))
+        place_order(self.creator, basket=self.basket, order_number='1234')
+        num_queries = []
+        for num_lines, order_number in [(1, 'A'), (5, 'B')]:
+            basket = factories.create_basket(empty=True)
+            for i in range(num_lines):
+                add_product(basket, D('12.00'))
+            # Checkouts price the basket before placing the order
+            basket.total_incl_tax
+            with CaptureQueriesContext(connection) as context:
+                place_order(
+                    self.creator, basket=basket, order_number=order_number)
+            num_queries.append(len(context))
+        self.assertEqual(num_queries[0], num_queries[1])
+
+    def test_records_timings(self):
+        add_product(self.basket, D('12.00'))
+        place_order(self.creator, basket=self.basket, order_number='1234')
+        self.assertEqual(
+            ['order', 'lines', 'stock', 'discounts', 'vouchers', 'signal'],
+            list(self.creator.timings))
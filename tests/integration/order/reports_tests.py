@@ -4,6 +4,7 @@ from django.test import TestCase
 from django.utils.timezone import now
 
 from oscar.apps.order import reports
+from oscar.test.factories import UserFactory, create_order
 
 
 class TestOrderReportGenerator(TestCase):
@@ -18,3 +19,12 @@ class TestOrderReportGenerator(TestCase):
         generator = reports.OrderReportGenerator(
             start_date=start_date, end_date=end_date, formatter='CSV')
         generator.generate()
+
+    def test_streams_csv(self):
+        order = create_order(user=UserFactory())
+        generator = reports.OrderReportGenerator(formatter='CSV')
+        response = generator.generate()
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode('utf8').splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[1].startswith(str(order.number)))
@@ -0,0 +1,131 @@
+from decimal import Decimal as D
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from oscar.apps.partner.allocation import StockAllocator
+from oscar.apps.partner.exceptions import InsufficientStock
+from oscar.core.loading import get_model
+from oscar.test import factories
+from oscar.test.basket import add_product
+
+StockAlert = get_model('partner', 'StockAlert')
+StockRecord = get_model('partner', 'StockRecord')
+StockReservation = get_model('partner', 'StockReservation')
+
+
+def reload(stockrecord):
+    return StockRecord.objects.get(pk=stockrecord.pk)
+
+
+class TestStockAllocator(TestCase):
+
+    def setUp(self):
+        self.allocator = StockAllocator()
+        self.stockrecords = [
+            factories.create_stockrecord(num_in_stock=10) for i in range(3)]
+
+    def test_allocates_stock_of_many_stockrecords(self):
+        self.allocator.allocate(dict(
+            (stockrecord.pk, quantity)
+            for quantity, stockrecord in enumerate(self.stockrecords, 1)))
+        for quantity, stockrecord in enumerate(self.stockrecords, 1):
+            self.assertEqual(quantity, reload(stockrecord).num_allocated)
+
+    def test_adds_to_existing_allocations(self):
+        stockrecord = self.stockrecords[0]
+        stockrecord.allocate(2)
+        self.allocator.allocate({stockrecord.pk: 3})
+        self.assertEqual(5, reload(stockrecord).num_allocated)
+
+    def test_locks_stockrecords_in_order(self):
+        ids = [stockrecord.pk for stockrecord in self.stockrecords]
+        locked = self.allocator.lock_stockrecords(reversed(ids))
+        self.assertEqual(ids, list(locked))
+
+    def test_raises_if_stock_is_insufficient(self):
+        first, second = self.stockrecords[:2]
+        second.allocate(8)
+        with self.assertRaises(InsufficientStock):
+            self.allocator.allocate({first.pk: 1, second.pk: 3},
+                                    check_availability=True)
+        self.assertIsNone(reload(first).num_allocated)
+        self.assertEqual(8, reload(second).num_allocated)
+
+    def test_cancels_allocations(self):
+        first, second = self.stockrecords[:2]
+        first.allocate(5)
+        second.allocate(5)
+        self.allocator.cancel({first.pk: 2, second.pk: 6})
+        self.assertEqual(3, reload(first).num_allocated)
+        self.assertEqual(0, reload(second).num_allocated)
+
+    def test_raises_low_stock_alerts(self):
+        stockrecord = self.stockrecords[0]
+        stockrecord.low_stock_threshold = 5
+        stockrecord.save()
+        self.allocator.allocate({stockrecord.pk: 6})
+        self.assertTrue(StockAlert.objects.filter(
+            stockrecord=stockrecord, status=StockAlert.OPEN).exists())
+
+
+class TestStockReservations(TestCase):
+
+    def setUp(self):
+        self.allocator = StockAllocator()
+        self.basket = factories.create_basket(empty=True)
+        self.product = factories.create_product(num_in_stock=10)
+        self.stockrecord = self.product.stockrecords.get()
+        add_product(self.basket, D('10.00'), 4, product=self.product)
+
+    def test_reserving_allocates_stock(self):
+        self.allocator.reserve(self.basket)
+        self.assertEqual(4, reload(self.stockrecord).num_allocated)
+        reservation = self.basket.stock_reservations.get()
+        self.assertEqual(4, reservation.quantity)
+        self.assertTrue(reservation.date_expires > timezone.now())
+
+    def test_reserving_again_replaces_the_reservations(self):
+        self.allocator.reserve(self.basket)
+        self.allocator.reserve(self.basket)
+        self.assertEqual(4, reload(self.stockrecord).num_allocated)
+        self.assertEqual(1, self.basket.stock_reservations.count())
+
+    def test_raises_if_stock_is_reserved_by_other_baskets(self):
+        other_basket = factories.create_basket(empty=True)
+        add_product(other_basket, D('10.00'), 7, product=self.product)
+        self.allocator.reserve(other_basket)
+        with self.assertRaises(InsufficientStock):
+            self.allocator.reserve(self.basket)
+        self.assertEqual(0, self.basket.stock_reservations.count())
+
+    def test_releasing_cancels_the_allocation(self):
+        self.allocator.reserve(self.basket)
+        self.assertEqual(1, self.allocator.release(self.basket))
+        self.assertEqual(0, reload(self.stockrecord).num_allocated)
+        self.assertEqual(0, StockReservation.objects.count())
+
+    def test_expires_reservations_in_bulk(self):
+        self.allocator.reserve(self.basket, timeout=0)
+        other_basket = factories.create_basket(empty=True)
+        add_product(other_basket, D('10.00'), 2, product=self.product)
+        self.allocator.reserve(other_basket)
+
+        self.assertEqual(1, self.allocator.expire_reservations())
+        self.assertEqual(2, reload(self.stockrecord).num_allocated)
+        self.assertEqual(
+            [other_basket.pk],
+            list(StockReservation.objects.values_list('basket', flat=True)))
+
+    def test_expires_reservations_of_deleted_baskets(self):
+        self.allocator.reserve(self.basket, timeout=0)
+        self.basket.delete()
+        call_command('oscar_expire_stock_reservations')
+        self.assertEqual(0, reload(self.stockrecord).num_allocated)
+        self.assertEqual(0, StockReservation.objects.count())
+
+    def test_doesnt_expire_reservations_before_they_expire(self):
+        self.allocator.reserve(self.basket)
+        self.assertEqual(0, self.allocator.expire_reservations())
+        self.assertEqual(4, reload(self.stockrecord).num_allocated)
@@ -0,0 +1,54 @@
+import logging
+import os
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from oscar.apps.catalogue.categories import create_from_breadcrumbs
+from oscar.apps.catalogue.models import Product
+from oscar.apps.offer.models import Range
+from oscar.apps.partner.importers import CatalogueImporter
+from oscar.core.loading import get_model
+
+ProductIndexUpdate = get_model('search', 'ProductIndexUpdate')
+
+TEST_BOOKS_CSV = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'unit', 'partner', 'fixtures',
+    'books-small.csv')
+
+logger = logging.getLogger(__name__)
+
+
+class TestBatchedImportSideEffects(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(OSCAR_RANGE_INDEX_CACHE_TIMEOUT=3600)
+    def test_updates_range_indexes(self):
+        rng = Range.objects.create(name="Fiction")
+        rng.included_categories.add(
+            create_from_breadcrumbs('Books > Fiction'))
+        rng.get_product_index()
+
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+
+        rng = Range.objects.get(pk=rng.pk)
+        products = Product.objects.all()
+        self.assertEqual(10, len(products))
+        for product in products:
+            self.assertTrue(rng.contains_product(product))
+
+    @override_settings(HAYSTACK_SIGNAL_PROCESSOR=(
+        'oscar.apps.search.signal_processors.QueuedSignalProcessor'))
+    def test_queues_products_for_reindexing(self):
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+        self.assertEqual(
+            set(Product.objects.values_list('id', flat=True)),
+            set(ProductIndexUpdate.objects.values_list(
+                'product_id', flat=True)))
+
+    def test_doesnt_queue_products_without_the_queued_processor(self):
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+        self.assertFalse(ProductIndexUpdate.objects.exists())
@@ -107,3 +107,57 @@ class TestDefaultStrategyForParentProductWithOutOfStockVariant(TestCase):
 
     def test_specifies_product_has_correct_price(self):
         self.assertEqual(D('10.00'), self.info.price.incl_tax)
+
+
+class TestDefaultStrategyForListsOfProducts(TestCase):
+
+    def setUp(self):
+        self.strategy = strategy.Default()
+        self.products = [
+            factories.create_product(price=D('1.99'), num_in_stock=4)
+            for x in range(3)]
+        self.parent = factories.create_product(structure='parent')
+        for x in range(2):
+            factories.create_product(
+                parent=self.parent, price=D('5.00'), num_in_stock=1)
+        self.products.append(self.parent)
+
+    def fetch_products(self):
+        return models.Product.objects.filter(
+            id__in=[p.id for p in self.products])
+
+    def test_returns_purchase_info_keyed_by_product_id(self):
+        infos = self.strategy.fetch_for_products(self.fetch_products())
+        self.assertEqual(set(p.id for p in self.products), set(infos))
+        self.assertEqual(D('1.99'), infos[self.products[0].id].price.excl_tax)
+        self.assertEqual(D('5.00'), infos[self.parent.id].price.excl_tax)
+
+    def test_matches_single_product_methods(self):
+        infos = self.strategy.fetch_for_products(self.fetch_products())
+        for product in self.products:
+            if product.is_parent:
+                info = self.strategy.fetch_for_parent(product)
+            else:
+                info = self.strategy.fetch_for_product(product)
+            self.assertEqual(info.price.excl_tax,
+                             infos[product.id].price.excl_tax)
+            self.assertEqual(info.availability.code,
+                             infos[product.id].availability.code)
+
+    def test_uses_a_constant_number_of_queries(self):
+        products = list(self.fetch_products())
+        # Products, product classes, stockrecords, children and their
+        # stockrecords
+        with self.assertNumQueries(4):
+            self.strategy.fetch_for_products(products)
+
+    def test_handles_basket_lines(self):
+        basket = factories.create_basket(empty=True)
+        basket.strategy = self.strategy
+        for product in self.products[:2]:
+            basket.add_product(product)
+        lines = list(basket.all_lines())
+        infos = self.strategy.fetch_for_lines(lines)
+        self.assertEqual(set(line.id for line in lines), set(infos))
+        self.assertTrue(all(info.availability.is_available_to_buy
+                            for info in infos.values()))
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+
+from oscar.apps.promotions import models
+from oscar.apps.promotions.context_processors import promotions
+
+
+@override_settings(OSCAR_PROMOTIONS_CACHE_TIMEOUT=60)
+class TestCachedPromotions(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.html = models.RawHTML.objects.create(name='Banner', body='Hi')
+        self.image = models.Image.objects.create(name='Image')
+        self.page_promotion = models.PagePromotion.objects.create(
+            page_url='/', content_object=self.html, position='page')
+
+    def get_context(self, path='/', **params):
+        return promotions(self.factory.get(path, params))
+
+    def test_splits_promotions_by_position(self):
+        models.KeywordPromotion.objects.create(
+            keyword='sale', content_object=self.image, position='page')
+        context = self.get_context(q='sale')
+        self.assertEqual([self.html, self.image], context['promotions_page'])
+
+    def test_doesnt_query_the_database_once_cached(self):
+        self.get_context()
+        with self.assertNumQueries(0):
+            context = self.get_context()
+        self.assertEqual([self.html], context['promotions_page'])
+
+    def test_caches_pages_without_promotions(self):
+        self.get_context('/catalogue/')
+        with self.assertNumQueries(0):
+            context = self.get_context('/catalogue/')
+        self.assertEqual({'url_path': '/catalogue/'}, context)
+
+    def test_caches_keywords_without_promotions(self):
+        self.get_context(q='shoes')
+        with self.assertNumQueries(0):
+            self.get_context(q='boots')
+
+    def test_is_invalidated_when_a_linked_promotion_changes(self):
+        self.get_context()
+        self.page_promotion.position = 'left'
+        self.page_promotion.save()
+        context = self.get_context()
+        self.assertEqual([self.html], context['promotions_left'])
+
+    def test_is_invalidated_when_promotion_content_changes(self):
+        self.get_context()
+        self.html.body = 'Bye'
+        self.html.save()
+        self.assertEqual(
+            'Bye', self.get_context()['promotions_page'][0].body)
+
+    def test_is_not_invalidated_by_clicks(self):
+        self.get_context()
+        self.page_promotion.record_click()
+        with self.assertNumQueries(0):
+            self.get_context()
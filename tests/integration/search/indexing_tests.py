@@ -0,0 +1,95 @@
+import datetime
+
+import mock
+from django.test import TestCase
+from django.utils import timezone
+from haystack import connections
+
+from oscar.apps.catalogue.categories import create_from_breadcrumbs
+from oscar.apps.search.indexing import ProductIndexer
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+Product = get_model('catalogue', 'Product')
+StockRecord = get_model('partner', 'StockRecord')
+
+
+def get_product_index():
+    return connections['default'].get_unified_index().get_index(Product)
+
+
+class TestProductIndex(TestCase):
+
+    def setUp(self):
+        self.index = get_product_index()
+        category = create_from_breadcrumbs('Books > Fiction')
+        self.products = []
+        for i in range(3):
+            product = factories.create_product(num_in_stock=5)
+            factories.ProductCategoryFactory(
+                product=product, category=category)
+            self.products.append(product)
+
+    def test_prepares_products_without_further_queries(self):
+        products = list(self.index.index_queryset())
+        with self.assertNumQueries(0):
+            for product in products:
+                prepared = self.index.full_prepare(product)
+        self.assertEqual(['Books > Fiction'], prepared['category'])
+        self.assertEqual(5, prepared['num_in_stock'])
+
+    def test_recomputes_category_names_when_the_tree_changes(self):
+        self.index.index_queryset()
+        category = self.products[0].categories.get()
+        category.name = 'Novels'
+        category.save()
+        product = self.index.index_queryset().get(pk=self.products[0].pk)
+        self.assertEqual(['Books > Novels'],
+                         self.index.full_prepare(product)['category'])
+
+    def test_incremental_queryset_includes_products_with_changed_stock(self):
+        last_week = timezone.now() - datetime.timedelta(days=7)
+        Product.objects.update(date_updated=last_week)
+        StockRecord.objects.update(date_updated=last_week)
+        self.products[0].stockrecords.get().allocate(1)
+
+        queryset = self.index.build_queryset(
+            start_date=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual([self.products[0]], list(queryset))
+
+    def test_incremental_queryset_includes_parents_with_changed_stock(self):
+        last_week = timezone.now() - datetime.timedelta(days=7)
+        parent = factories.ProductFactory(
+            structure=Product.PARENT, stockrecords=[], categories=[])
+        child = factories.ProductFactory(
+            structure=Product.CHILD, parent=parent, product_class=None,
+            categories=[])
+        Product.objects.update(date_updated=last_week)
+        StockRecord.objects.update(date_updated=last_week)
+        child.stockrecords.get().allocate(1)
+
+        queryset = self.index.build_queryset(
+            start_date=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual([parent], list(queryset))
+
+
+class TestProductIndexer(TestCase):
+
+    def setUp(self):
+        self.products = [factories.create_product() for i in range(5)]
+
+    def test_splits_products_into_primary_key_ranges(self):
+        pks = [product.pk for product in self.products]
+        ranges = ProductIndexer(batch_size=2).get_ranges()
+        self.assertEqual(
+            [(0, pks[1]), (pks[1], pks[3]), (pks[3], pks[4])], ranges)
+
+    def test_indexes_all_products_in_batches(self):
+        backend = connections['default'].get_backend()
+        with mock.patch.object(backend.__class__, 'update') as update:
+            num_indexed = ProductIndexer(batch_size=2).run()
+        self.assertEqual(5, num_indexed)
+        self.assertEqual(3, update.call_count)
+        indexed = [product for call in update.call_args_list
+                   for product in call[0][1]]
+        self.assertEqual(set(self.products), set(indexed))
@@ -0,0 +1,117 @@
+import mock
+from django.core.management import call_command
+from django.test import TestCase
+from haystack import connection_router, connections
+
+from oscar.apps.search.indexing import ProductIndexQueue
+from oscar.apps.search.signal_processors import QueuedSignalProcessor
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+Product = get_model('catalogue', 'Product')
+ProductIndexUpdate = get_model('search', 'ProductIndexUpdate')
+
+
+def queued_product_ids():
+    return set(ProductIndexUpdate.objects.values_list(
+        'product_id', flat=True))
+
+
+class TestQueuedSignalProcessor(TestCase):
+
+    def setUp(self):
+        self.processor = QueuedSignalProcessor(connections, connection_router)
+
+    def tearDown(self):
+        self.processor.teardown()
+
+    def test_queues_saved_products_once(self):
+        product = factories.ProductFactory(stockrecords=[], categories=[])
+        product.title = 'Changed'
+        product.save()
+        self.assertEqual([product.pk], list(
+            ProductIndexUpdate.objects.values_list('product_id', flat=True)))
+
+    def test_queues_products_of_saved_stockrecords(self):
+        product = factories.create_product(num_in_stock=5)
+        ProductIndexUpdate.objects.all().delete()
+        product.stockrecords.get().allocate(1)
+        self.assertEqual(set([product.pk]), queued_product_ids())
+
+    def test_queues_deleted_products(self):
+        product = factories.create_product()
+        ProductIndexUpdate.objects.all().delete()
+        product_id = product.pk
+        product.delete()
+        self.assertEqual(set([product_id]), queued_product_ids())
+
+    def test_ignores_other_models(self):
+        factories.PartnerFactory()
+        self.assertEqual(set(), queued_product_ids())
+
+
+class TestProductIndexQueue(TestCase):
+
+    def setUp(self):
+        self.queue = ProductIndexQueue()
+        self.backend = connections['default'].get_backend()
+
+    def process(self, **kwargs):
+        with mock.patch.object(self.backend.__class__, 'update') as update, \
+                mock.patch.object(self.backend.__class__, 'remove') as remove:
+            num_processed = self.queue.process(**kwargs)
+        indexed = [product for call in update.call_args_list
+                   for product in call[0][1]]
+        removed = [call[0][0] for call in remove.call_args_list]
+        return num_processed, indexed, removed
+
+    def test_indexes_queued_products_in_batches(self):
+        products = [factories.create_product() for i in range(3)]
+        for product in products:
+            self.queue.enqueue(product.pk)
+
+        num_processed, indexed, removed = self.process(batch_size=2)
+        self.assertEqual(2, num_processed)
+        self.assertEqual(set(products[:2]), set(indexed))
+        self.assertEqual(1, len(self.queue))
+
+    def test_indexes_parents_of_queued_children(self):
+        parent = factories.ProductFactory(
+            structure=Product.PARENT, stockrecords=[], categories=[])
+        child = factories.ProductFactory(
+            structure=Product.CHILD, parent=parent, product_class=None,
+            categories=[])
+        self.queue.enqueue(child.pk)
+        self.assertEqual((1, [parent], []), self.process())
+
+    def test_removes_deleted_products_from_index(self):
+        self.queue.enqueue(1234)
+        self.assertEqual((1, [], ['catalogue.product.1234']), self.process())
+        self.assertEqual(0, len(self.queue))
+
+    def test_keeps_products_requeued_while_indexing(self):
+        product = factories.create_product()
+        self.queue.enqueue(product.pk)
+
+        def requeue(*args, **kwargs):
+            self.queue.enqueue(product.pk)
+
+        with mock.patch.object(self.backend.__class__, 'update',
+                               side_effect=requeue):
+            self.queue.process()
+        self.assertEqual(1, len(self.queue))
+
+    def test_command_drains_the_queue(self):
+        for i in range(3):
+            self.queue.enqueue(factories.create_product().pk)
+        with mock.patch.object(self.backend.__class__, 'update'):
+            call_command('oscar_process_index_queue', once=True, batch_size=2)
+        self.assertEqual(0, len(self.queue))
+
+    def test_queues_many_products_at_once(self):
+        products = [factories.create_product() for i in range(3)]
+        self.queue.enqueue(products[0].pk)
+        # Update, select, and insert within a savepoint
+        with self.assertNumQueries(5):
+            self.queue.enqueue_many([product.pk for product in products])
+        self.assertEqual(3, len(self.queue))
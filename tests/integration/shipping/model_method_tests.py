@@ -1,9 +1,12 @@
 from decimal import Decimal as D
 
+from django.core.cache import cache
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from oscar.apps.offer.applicator import Applicator
 from oscar.apps.offer.models import Benefit
+from oscar.apps.shipping.cache import weight_band_cache
 from oscar.apps.shipping.models import OrderAndItemCharges, WeightBased
 from oscar.apps.shipping.repository import Repository
 from oscar.core.compat import get_user_model
@@ -222,3 +225,35 @@ class WeightBasedMethodTests(TestCase):
         method = Repository().apply_shipping_offer(
             basket, self.standard, offer)
         self.assertEqual(D('0.00'), method.discount(basket))
+
+
+class TestWeightBandTable(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        weight_band_cache.clear()
+        self.method = WeightBased.objects.create(name='Standard')
+        self.method.bands.create(upper_limit=1, charge=D('4.00'))
+        self.method.bands.create(upper_limit=3, charge=D('12.00'))
+
+    def test_charges_are_computed_with_a_single_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(D('12.00'), self.method.get_charge(2))
+
+    def test_charges_for_weights_over_the_top_band(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(D('28.00'), self.method.get_charge(7))
+
+    @override_settings(OSCAR_SHIPPING_BAND_CACHE_TIMEOUT=60)
+    def test_band_table_can_be_cached(self):
+        self.method.get_charge(1)
+        with self.assertNumQueries(0):
+            self.assertEqual(D('4.00'), self.method.get_charge(1))
+
+    @override_settings(OSCAR_SHIPPING_BAND_CACHE_TIMEOUT=60)
+    def test_cached_band_table_is_invalidated_when_bands_change(self):
+        self.assertEqual(D('12.00'), self.method.get_charge(2))
+        self.method.bands.create(upper_limit=2, charge=D('8.00'))
+        self.assertEqual(D('8.00'), self.method.get_charge(2))
+        self.method.bands.filter(upper_limit=2).get().delete()
+        self.assertEqual(D('12.00'), self.method.get_charge(2))
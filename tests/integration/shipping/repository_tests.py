@@ -0,0 +1,115 @@
+from decimal import Decimal as D
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from oscar.apps.offer.applicator import Applicator
+from oscar.apps.order.models import ShippingAddress
+from oscar.apps.shipping import methods, repository
+from oscar.apps.shipping.cache import SHIPPING_QUOTE_VERSION_CACHE_KEY
+from oscar.apps.shipping.models import OrderAndItemCharges, WeightBased
+from oscar.test import factories
+
+
+class CountingMethod(methods.FixedPrice):
+    code = 'counting'
+    name = 'Counting'
+
+    def __init__(self, *args, **kwargs):
+        super(CountingMethod, self).__init__(*args, **kwargs)
+        self.num_calculations = 0
+
+    def calculate(self, basket):
+        self.num_calculations += 1
+        return super(CountingMethod, self).calculate(basket)
+
+
+@override_settings(OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT=60)
+class TestCachedShippingQuotes(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.method = CountingMethod(D('5.00'), D('6.00'))
+        self.repo = repository.Repository()
+        self.repo.methods = (self.method,)
+        self.basket = factories.create_basket()
+        self.address = ShippingAddress(
+            first_name='Barry', last_name='Barrington', line1='1 King Road',
+            line4='London', postcode='SW1 9RE')
+
+    def get_charge(self, basket=None, address=None):
+        method = self.repo.get_default_shipping_method(
+            basket or self.basket, shipping_addr=address or self.address)
+        return method.calculate(basket or self.basket)
+
+    def test_charges_are_calculated_once(self):
+        self.assertEqual(D('6.00'), self.get_charge().incl_tax)
+        self.assertEqual(D('6.00'), self.get_charge().incl_tax)
+        self.assertEqual(1, self.method.num_calculations)
+
+    def test_methods_keep_their_interface(self):
+        method = self.repo.get_default_shipping_method(
+            self.basket, shipping_addr=self.address)
+        self.assertEqual('counting', method.code)
+        self.assertEqual('Counting', method.name)
+        self.assertEqual(D('5.00'), method.charge_excl_tax)
+        self.assertEqual(D('0.00'), method.discount(self.basket))
+
+    def test_charges_are_recalculated_when_the_basket_changes(self):
+        self.get_charge()
+        self.basket.add_product(factories.create_product(price=D('2.00')))
+        self.get_charge()
+        self.assertEqual(2, self.method.num_calculations)
+
+    def test_charges_are_recalculated_when_the_address_changes(self):
+        self.get_charge()
+        self.address.postcode = 'N1 9GU'
+        self.get_charge()
+        self.assertEqual(2, self.method.num_calculations)
+
+    def test_charges_are_recalculated_when_a_method_changes(self):
+        self.get_charge()
+        WeightBased.objects.create(name='Standard')
+        self.get_charge()
+        self.assertEqual(2, self.method.num_calculations)
+
+    def test_charges_are_recalculated_when_an_offer_changes(self):
+        basket = factories.create_basket(empty=True)
+        basket.add_product(factories.create_product(price=D('12.00')))
+        self.repo.methods = (OrderAndItemCharges(
+            price_per_order=D('5.00'), free_shipping_threshold=D('10.00')),)
+        self.assertEqual(D('0.00'), self.get_charge(basket).incl_tax)
+
+        # 20% off takes the basket below the free shipping threshold
+        factories.create_offer()
+        basket.reset_offer_applications()
+        Applicator().apply(basket)
+        self.assertEqual(D('5.00'), self.get_charge(basket).incl_tax)
+
+    def test_charges_are_recalculated_when_a_product_weight_changes(self):
+        basket = factories.create_basket(empty=True)
+        product = factories.create_product(
+            price=D('12.00'), attributes={'weight': 1})
+        basket.add_product(product)
+        method = WeightBased.objects.create(name='Standard')
+        method.bands.create(upper_limit=1, charge=D('4.00'))
+        method.bands.create(upper_limit=5, charge=D('8.00'))
+        self.repo.methods = (method,)
+        self.assertEqual(D('4.00'), self.get_charge(basket).incl_tax)
+
+        product.attr.weight = 3
+        product.save()
+        self.assertEqual(D('8.00'), self.get_charge(basket).incl_tax)
+
+    @override_settings(OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT=0)
+    def test_charges_are_not_cached_by_default(self):
+        self.get_charge()
+        self.get_charge()
+        self.assertEqual(2, self.method.num_calculations)
+
+    @override_settings(OSCAR_SHIPPING_QUOTE_CACHE_TIMEOUT=0)
+    def test_methods_are_saved_without_cache_writes_by_default(self):
+        cache.clear()
+        WeightBased.objects.create(name='Standard')
+        self.assertIsNone(cache.get(SHIPPING_QUOTE_VERSION_CACHE_KEY))
@@ -71,3 +71,27 @@ class TestScales(TestCase):
 
         basket.add(product)
         self.assertEqual(D('0.9'), scale.weigh_basket(basket))
+
+    def test_uses_weight_of_parent_product(self):
+        parent = factories.create_product(
+            structure='parent', attributes={'weight': '2'})
+        child = factories.create_product(parent=parent)
+        scale = Scale(attribute_code='weight')
+        self.assertEqual(2, scale.weigh_product(child))
+
+    def test_weighs_basket_with_a_constant_number_of_queries(self):
+        basket = factories.create_basket(empty=True)
+        parent = factories.create_product(
+            structure='parent', attributes={'weight': '2'})
+        basket.add(factories.create_product(
+            parent=parent, price=D('5.00')), quantity=2)
+        for i in range(10):
+            basket.add(factories.create_product(
+                attributes={'weight': '1'}, price=D('5.00')))
+        basket = Basket.objects.get(pk=basket.pk)
+
+        scale = Scale(attribute_code='weight')
+        # Basket lines (with their products, attributes and images), then
+        # the weights
+        with self.assertNumQueries(4):
+            self.assertEqual(2 * 2 + 10, scale.weigh_basket(basket))
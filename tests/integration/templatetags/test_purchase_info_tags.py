@@ -0,0 +1,40 @@
+from decimal import Decimal as D
+
+from django import template
+from django.test import TestCase
+from mock import Mock
+
+from oscar.apps.partner import strategy
+from oscar.test import factories
+
+
+class TestPurchaseInfoTags(TestCase):
+
+    def setUp(self):
+        self.request = Mock(strategy=strategy.Default())
+        self.products = [
+            factories.create_product(price=D('1.99'), num_in_stock=4),
+            factories.create_product(price=D('2.99'), num_in_stock=4)]
+
+    def render(self, template_string, **ctx):
+        ctx.setdefault('request', self.request)
+        tpl = template.Template(
+            "{% load purchase_info_tags %}" + template_string)
+        return tpl.render(template.Context(ctx))
+
+    def test_fetches_purchase_info_for_a_list_of_products(self):
+        out = self.render(
+            "{% purchase_info_for_products request products as infos %}"
+            "{% for info in infos.values %}{{ info.price.excl_tax }} "
+            "{% endfor %}", products=self.products)
+        self.assertEqual(set(['1.99', '2.99']), set(out.split()))
+
+    def test_product_tag_uses_purchase_infos_from_context(self):
+        infos = self.request.strategy.fetch_for_products(self.products)
+        self.request.strategy = Mock()
+        out = self.render(
+            "{% purchase_info_for_product request product as session %}"
+            "{{ session.price.excl_tax }}",
+            product=self.products[0], purchase_infos=infos)
+        self.assertEqual('1.99', out)
+        self.assertFalse(self.request.strategy.fetch_for_product.called)
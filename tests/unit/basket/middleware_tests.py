@@ -1,8 +1,14 @@
+from decimal import Decimal as D
+
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.client import RequestFactory
+from django.test.utils import override_settings
 from django.contrib.auth.models import AnonymousUser
+from django.utils.functional import empty
 
 from oscar.apps.basket import middleware
+from oscar.test import factories
 
 
 class TestBasketMiddleware(TestCase):
@@ -31,4 +37,66 @@ class TestBasketMiddleware(TestCase):
         cookie_basket = self.middleware.get_cookie_basket("oscar_open_basket", request, None)
 
         self.assertEqual(None, cookie_basket)
-        self.assertIn("oscar_open_basket", request.cookies_to_delete)
\ No newline at end of file
+        self.assertIn("oscar_open_basket", request.cookies_to_delete)
+
+    def test_strategy_is_loaded_lazily(self):
+        self.assertIs(empty, self.request.strategy._wrapped)
+        self.assertTrue(hasattr(self.request.strategy, 'fetch_for_product'))
+
+
+class TestBasketSummary(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.middleware = middleware.BasketMiddleware()
+        self.basket = factories.create_basket()
+
+    def get_request(self, basket=None):
+        request_factory = RequestFactory()
+        if basket is not None:
+            request_factory.cookies['oscar_open_basket'] = (
+                self.middleware.get_basket_hash(basket.id))
+        request = request_factory.get('/')
+        request.user = AnonymousUser()
+        self.middleware.process_request(request)
+        return request
+
+    def test_is_empty_for_visitors_without_a_basket(self):
+        request = self.get_request()
+        with self.assertNumQueries(0):
+            self.assertTrue(request.basket_summary.is_empty)
+            self.assertEqual(D('0.00'), request.basket_summary.total)
+        self.assertIs(empty, request.basket._wrapped)
+
+    def test_summarises_the_basket(self):
+        summary = self.get_request(self.basket).basket_summary
+        self.assertEqual(self.basket.id, summary.basket_id)
+        self.assertEqual(1, summary.num_lines)
+        self.assertEqual(self.basket.num_items, summary.num_items)
+        self.assertEqual(self.basket.total_incl_tax, summary.total)
+
+    @override_settings(OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT=60)
+    def test_is_read_from_the_cache(self):
+        self.get_request(self.basket).basket_summary.num_items
+        request = self.get_request(self.basket)
+        with self.assertNumQueries(0):
+            self.assertEqual(1, request.basket_summary.num_lines)
+        self.assertIs(empty, request.basket._wrapped)
+
+    @override_settings(OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT=60)
+    def test_is_invalidated_when_the_basket_changes(self):
+        self.get_request(self.basket).basket_summary.num_items
+        self.basket.add(factories.create_product(price=D('5.00')))
+        summary = self.get_request(self.basket).basket_summary
+        self.assertEqual(2, summary.num_lines)
+
+        self.basket.flush()
+        self.assertTrue(self.get_request(self.basket).basket_summary.is_empty)
+
+    @override_settings(OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT=60)
+    def test_is_not_cached_for_submitted_baskets(self):
+        self.get_request(self.basket).basket_summary.num_items
+        self.basket.submit()
+        request = self.get_request(self.basket)
+        self.assertTrue(request.basket_summary.is_empty)
+        self.assertIn('oscar_open_basket', request.cookies_to_delete)
@@ -0,0 +1,95 @@
+from django.conf.urls import url
+from django.core.urlresolvers import RegexURLResolver, reverse
+from django.http import HttpResponse
+from django.test import TestCase
+
+from oscar.app import Shop
+from oscar.core.application import Application, lazy_include
+
+
+def view(request):
+    return HttpResponse()
+
+
+def decorate(view_func):
+    def decorated_view(request):
+        return view_func(request)
+    decorated_view.decorated = True
+    return decorated_view
+
+
+class ChildApplication(Application):
+    num_builds = 0
+
+    def get_urls(self):
+        self.num_builds += 1
+        return self.post_process_urls([url(r'^$', view, name='child')])
+
+
+class ParentApplication(Application):
+
+    def __init__(self, child, **kwargs):
+        super(ParentApplication, self).__init__(**kwargs)
+        self.child = child
+
+    def get_urls(self):
+        return self.post_process_urls([
+            url(r'^$', view, name='parent'),
+            url(r'^child/', lazy_include(self.child, 'child')),
+        ])
+
+    def get_url_decorator(self, pattern):
+        if pattern.name == 'child':
+            return decorate
+
+
+class URLConf(object):
+
+    def __init__(self, urlpatterns):
+        self.urlpatterns = urlpatterns
+
+
+def get_resolver(urlpatterns):
+    return RegexURLResolver(r'^/', urlpatterns)
+
+
+class TestLazyInclude(TestCase):
+
+    def setUp(self):
+        self.child = ChildApplication()
+        self.resolver = get_resolver(ParentApplication(self.child).get_urls())
+
+    def test_doesnt_build_urls_until_they_are_resolved(self):
+        self.resolver.resolve('/')
+        self.assertEqual(0, self.child.num_builds)
+
+        match = self.resolver.resolve('/child/')
+        self.assertEqual(['child'], match.namespaces)
+        self.assertEqual(1, self.child.num_builds)
+
+        self.resolver.resolve('/child/')
+        self.assertEqual(1, self.child.num_builds)
+
+    def test_applies_parent_decorators_once_built(self):
+        match = self.resolver.resolve('/child/')
+        self.assertTrue(getattr(match.func, 'decorated', False))
+
+    def test_reverses_lazily_included_urls(self):
+        urlconf = URLConf(ParentApplication(self.child).get_urls())
+        self.assertEqual('/', reverse('parent', urlconf=urlconf))
+        self.assertEqual(0, self.child.num_builds)
+        self.assertEqual('/child/', reverse('child:child', urlconf=urlconf))
+
+
+class TestShopURLs(TestCase):
+
+    def test_doesnt_build_dashboard_urls_for_storefront_urls(self):
+        urlpatterns = Shop().get_urls()
+        resolver = get_resolver(urlpatterns)
+        resolver.resolve('/basket/')
+        dashboard = [pattern for pattern in urlpatterns
+                     if getattr(pattern, 'namespace', None) == 'dashboard'][0]
+        self.assertFalse(dashboard.urlconf_name.is_loaded)
+
+        resolver.resolve('/dashboard/orders/')
+        self.assertTrue(dashboard.urlconf_name.is_loaded)
@@ -65,7 +65,7 @@ class TestForkAppFunction(TestCase):
             self.assertTrue(expected_string in contents)
 
     def test_copies_in_migrations_when_needed(self):
-        for app, has_models in [('order', True), ('search', False)]:
+        for app, has_models in [('order', True), ('checkout', False)]:
             customisation.fork_app(app, self.tmp_folder)
             native_migration_path = os.path.join(
                 self.tmp_folder, app, 'migrations')
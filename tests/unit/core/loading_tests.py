@@ -1,10 +1,14 @@
 from os.path import dirname
 
+import mock
+from django.core.management import call_command
 from django.test import TestCase
 from django.conf import settings
 from django.test.utils import override_settings
+from django.utils.six import StringIO
 
 import oscar
+from oscar.core import loading
 from oscar.core.loading import (
     get_model, AppNotFoundError, get_classes, get_class, ClassNotFoundError)
 from tests import temporary_python_path
@@ -107,6 +111,46 @@ class ClassLoadingWithLocalOverrideWithMultipleSegmentsTests(TestCase):
             self.assertEqual('tests._site.apps.shipping.methods', Free.__module__)
 
 
+class TestClassLoadingMemoisation(TestCase):
+
+    def test_memoises_resolved_classes(self):
+        get_class('shipping.methods', 'Free')
+        with mock.patch.object(loading, '_load_classes') as load_classes:
+            Free = get_class('shipping.methods', 'Free')
+        self.assertFalse(load_classes.called)
+        self.assertEqual('oscar.apps.shipping.methods', Free.__module__)
+
+    def test_clears_memoised_classes_when_installed_apps_change(self):
+        get_class('shipping.methods', 'Free')
+        installed_apps = list(settings.INSTALLED_APPS)
+        installed_apps[installed_apps.index('oscar.apps.shipping')] = \
+            'tests._site.apps.shipping'
+        with override_settings(INSTALLED_APPS=installed_apps):
+            Free = get_class('shipping.methods', 'Free')
+        self.assertEqual('tests._site.apps.shipping.methods', Free.__module__)
+        Free = get_class('shipping.methods', 'Free')
+        self.assertEqual('oscar.apps.shipping.methods', Free.__module__)
+
+    @override_settings(OSCAR_PROFILE_CLASS_LOADING=True)
+    def test_records_class_loading_stats(self):
+        loading.reset_class_loading_stats()
+        get_class('shipping.methods', 'Free')
+        get_class('shipping.methods', 'Free')
+        total, stats = loading.get_class_loading_stats()
+        calls, memoised, seconds = stats['shipping.methods']
+        self.assertEqual(2, calls)
+        self.assertEqual(2, memoised)
+        self.assertEqual(1, len(stats))
+
+    @override_settings(OSCAR_PROFILE_CLASS_LOADING=True)
+    def test_reports_class_loading_stats(self):
+        get_class('shipping.methods', 'Free')
+        out = StringIO()
+        call_command('oscar_class_loading_report', limit=1000, stdout=out)
+        self.assertIn('spent loading classes', out.getvalue())
+        self.assertIn('shipping.methods', out.getvalue())
+
+
 class TestGetCoreAppsFunction(TestCase):
     """
     oscar.get_core_apps function
@@ -1,6 +1,8 @@
+import datetime
 import os
 from decimal import Decimal as D
 from django.test import TestCase
+from django.utils.timezone import utc
 import logging
 
 from oscar.apps.partner.importers import CatalogueImporter
@@ -125,3 +127,65 @@ class ImportWithFlushTest(TestCase):
 
         with self.assertRaises(Product.DoesNotExist):
             Product.objects.get(upc=upc)
+
+
+class BatchedImportSmokeTest(ImportSmokeTest):
+
+    def setUp(self):
+        self.importer = CatalogueImporter(logger, batch_size=3)
+        self.importer.handle(TEST_BOOKS_CSV)
+        self.product = Product.objects.get(upc='9780115531446')
+
+    def test_products_are_added_to_their_category(self):
+        self.assertEqual(
+            ['Books > Fiction'],
+            [category.full_name for category in self.product.categories.all()])
+
+
+class BatchedImportTest(TestCase):
+
+    def test_reimporting_updates_existing_products(self):
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+        Product.objects.filter(upc='9780115531446').update(title='Old title')
+        StockRecord.objects.update(num_in_stock=0)
+
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+
+        self.assertEqual(10, Product.objects.count())
+        self.assertEqual(
+            "Prepare for Your Practical Driving Test",
+            Product.objects.get(upc='9780115531446').title)
+        self.assertEqual(
+            6, StockRecord.objects.get(partner_sku='9780115531446')
+            .num_in_stock)
+
+    def test_reimporting_bumps_date_updated(self):
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+        past = datetime.datetime(2000, 1, 1, tzinfo=utc)
+        Product.objects.filter(upc='9780115531446').update(
+            title='Old title', date_updated=past)
+        StockRecord.objects.update(num_in_stock=0, date_updated=past)
+
+        CatalogueImporter(logger, batch_size=3).handle(TEST_BOOKS_CSV)
+
+        self.assertGreater(
+            Product.objects.get(upc='9780115531446').date_updated, past)
+        self.assertGreater(
+            StockRecord.objects.get(partner_sku='9780115531446')
+            .date_updated, past)
+
+    def test_resumes_from_offset(self):
+        CatalogueImporter(logger, batch_size=3, offset=4).handle(
+            TEST_BOOKS_CSV)
+        self.assertEqual(6, Product.objects.count())
+        self.assertFalse(Product.objects.filter(upc='9780115531446').exists())
+
+    def test_uses_few_queries_per_batch(self):
+        # Warm up the category, class and partner caches
+        importer = CatalogueImporter(logger, batch_size=10, offset=9)
+        importer.handle(TEST_BOOKS_CSV)
+        importer._offset = 0
+        # Within a savepoint, a batch selects and creates products, product
+        # categories and stock records, and fetches the new product IDs
+        with self.assertNumQueries(9):
+            importer.handle(TEST_BOOKS_CSV)